@@ -1,6 +1,9 @@
 """Command-line interface for the AlphaBot agent."""
 
 import logging
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from urllib.parse import urlparse
 
 import click
@@ -21,7 +24,11 @@ from a2a.types import (
 from fastapi import FastAPI
 
 import common.config as defaults
+from common.utils.agent_cards import agent_cards
 from common.utils.agent_utils import get_service_url
+from common.utils.http_pool import HttpPoolStats, http_pool
+
+from .a2a_risk_tool import is_local_riskguard_url
 
 # Import the specific AgentExecutor for AlphaBot
 from .agent_executor import AlphaBotAgentExecutor
@@ -36,16 +43,37 @@ alphabot_default_host = parsed_default_url.hostname or "127.0.0.1"
 alphabot_default_port = parsed_default_url.port or 8081
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Prewarm RiskGuard's agent card, and close the pooled HTTP client on shutdown."""
+    riskguard_url = os.environ.get(
+        "RISKGUARD_SERVICE_URL", defaults.DEFAULT_RISKGUARD_URL
+    )
+    prewarm = None
+    if not is_local_riskguard_url(riskguard_url):
+        prewarm = agent_cards.start_prewarm([riskguard_url], http_pool.get_client())
+    yield
+    if prewarm is not None:
+        prewarm.cancel()
+    await http_pool.aclose()
+
+
 def create_app(agent_card, request_handler) -> FastAPI:
     """Create the FastAPI app with mounted A2A routes."""
     agent_card_routes = create_agent_card_routes(agent_card)
     jsonrpc_routes = create_jsonrpc_routes(request_handler, rpc_url="/a2a/jsonrpc")
     rest_routes = create_rest_routes(request_handler, path_prefix="/a2a/rest")
 
-    app = FastAPI()
+    app = FastAPI(lifespan=lifespan)
     app.routes.extend(jsonrpc_routes)
     app.routes.extend(agent_card_routes)
     app.routes.extend(rest_routes)
+
+    @app.get("/http_pool")
+    async def handle_get_http_pool_stats() -> HttpPoolStats:
+        """Return the statistics of the pooled HTTP client used for RiskGuard calls."""
+        return http_pool.stats()
+
     return app
 
 
@@ -82,7 +110,7 @@ def main(host: str, port: int, proxy_headers: bool) -> None:
             ),
             version="1.0.0",
             capabilities=AgentCapabilities(
-                streaming=False,  # AlphaBotTaskManager doesn't support streaming
+                streaming=True,  # Episode day outcomes stream as artifact chunks
                 push_notifications=False,  # Not implemented
             ),
             skills=[
@@ -95,6 +123,15 @@ def main(host: str, port: int, proxy_headers: bool) -> None:
                     ],
                     tags=[],
                 ),
+                AgentSkill(
+                    id=defaults.ALPHABOT_EPISODE_SKILL_ID,
+                    name="Run Episode",
+                    description="Runs a whole simulation's price series in one task, checking trades with RiskGuard and applying them to the portfolio, and streams each day's outcome.",
+                    examples=[
+                        "Given these prices and a starting portfolio, what would you trade each day?",
+                    ],
+                    tags=[],
+                ),
             ],
             default_input_modes=["data"],
             default_output_modes=["data"],
@@ -4,10 +4,10 @@ import logging
 import os
 import uuid
 from typing import Any
+from urllib.parse import urlparse
 
 import httpx
 from a2a.client import (
-    A2ACardResolver,
     A2AClientError,
     A2AClientTimeoutError,
     ClientConfig,
@@ -29,6 +29,7 @@ from common.config import (
     DEFAULT_RISKGUARD_MAX_CONCENTRATION,
     DEFAULT_RISKGUARD_MAX_POS_SIZE,
     DEFAULT_RISKGUARD_URL,
+    LOCAL_RISKGUARD_SCHEME,
 )
 from common.models import (
     PortfolioState,
@@ -36,50 +37,61 @@ from common.models import (
     RiskCheckResult,
     TradeProposal,
 )
+from common.utils.agent_cards import agent_cards, is_connection_error
+from common.utils.http_pool import http_pool
 
 logger = logging.getLogger(__name__)
 
-RISKGUARD_A2A_TIMEOUT_SECONDS = 10
+
+def is_local_riskguard_url(url: str) -> bool:
+    """Return True if a RiskGuard URL asks for the in-process rules (`local://`)."""
+    return urlparse(url).scheme == LOCAL_RISKGUARD_SCHEME
 
 
 class A2ARiskCheckTool(BaseTool):
-    """ADK Tool that makes an A2A call to the RiskGuard service."""
+    """ADK Tool that makes an A2A call to the RiskGuard service.
+
+    With a `local://` RiskGuard URL (`LOCAL_RISKGUARD_URL`), the tool instead
+    applies RiskGuard's rules in this process, for deployments that run both
+    agents on one machine.
+    """
 
     name: str = "a2a_risk_check"
     description: str = "Sends a trade proposal to the RiskGuard service for validation and returns the approval status and reason."
     risk_guard_url: str
-    _httpx_client: httpx.AsyncClient
+    _httpx_client: httpx.AsyncClient | None
 
     def __init__(self, **kwargs) -> None:
-        """Initialize the A2ARiskCheckTool."""
+        """Initialize the A2ARiskCheckTool.
+
+        Without an `httpx_client` argument, the tool uses the process-wide
+        pooled client (see `common.utils.http_pool`), created on first use.
+        """
         # Pop custom arguments for this class before calling super()
-        # Configure httpx.AsyncClient with the timeout
-        self._httpx_client = kwargs.pop(
-            "httpx_client",
-            httpx.AsyncClient(
-                timeout=RISKGUARD_A2A_TIMEOUT_SECONDS,
-            ),
-        )
+        self._httpx_client = kwargs.pop("httpx_client", None)
         risk_guard_service_url = os.environ.get(
             "RISKGUARD_SERVICE_URL",
             DEFAULT_RISKGUARD_URL,
         )
         self.risk_guard_url = kwargs.pop("risk_guard_url", risk_guard_service_url)
-        self._a2a_sdk_clients: dict[str, Any] = {}
+        # (agent card, A2A client) by RiskGuard URL.
+        self._a2a_sdk_clients: dict[str, tuple[Any, Any]] = {}
+        # The httpx client the cached A2A clients were created with.
+        self._a2a_sdk_clients_http: httpx.AsyncClient | None = None
 
         # Now, kwargs only contains arguments meant for the parent class
         super().__init__(name=self.name, description=self.description, **kwargs)
 
     async def close(self) -> None:
-        """Close the httpx.AsyncClient when the tool is no longer needed."""
+        """Close an injected httpx.AsyncClient; the shared pool is closed by its service."""
         if self._httpx_client:
             await self._httpx_client.aclose()
             logger.info("A2ARiskCheckTool httpx.AsyncClient closed.")
 
     @property
     def httpx_client(self) -> httpx.AsyncClient:
-        """Get the internal httpx.AsyncClient."""
-        return self._httpx_client
+        """Get the injected httpx.AsyncClient, or else the shared pooled one."""
+        return self._httpx_client or http_pool.get_client()
 
     @httpx_client.setter
     def httpx_client(self, client: httpx.AsyncClient) -> None:
@@ -223,34 +235,89 @@ class A2ARiskCheckTool(BaseTool):
                 turn_complete=True,
             )
 
-        logger.info(
-            f"[{self.name} Tool ({invocation_id_short})] Preparing A2A call to {risk_guard_target_url}",
+        final_result_dict = await self.check_risk(
+            RiskCheckPayload(
+                trade_proposal=TradeProposal(**trade_proposal),
+                portfolio_state=PortfolioState(**portfolio_state),
+                max_pos_size=max_pos_size,
+                max_concentration=max_concentration,
+            ),
+            riskguard_url=risk_guard_target_url,
+            context_id=tool_context.session.id,
+            log_id=invocation_id_short,
         )
+        return Event(
+            author=self.name,
+            content=genai_types.Content(
+                parts=[
+                    genai_types.Part(
+                        function_response=genai_types.FunctionResponse(
+                            name=self.name,
+                            response=final_result_dict,
+                        ),
+                    ),
+                ],
+            ),
+            turn_complete=True,  # This tool completes its action in one go
+        )
+
+    async def check_risk(
+        self,
+        risk_payload: RiskCheckPayload,
+        riskguard_url: str,
+        context_id: str,
+        log_id: str,
+    ) -> dict[str, Any]:
+        """Send a risk check to RiskGuard and return its result.
 
-        # --- REFACTORED SECTION ---
-        # 1. Create Pydantic models from your data
-        trade_proposal_model = TradeProposal(**trade_proposal)
-        portfolio_state_model = PortfolioState(**portfolio_state)
+        This is the tool's A2A call without the ADK event around it, for
+        callers outside an agent invocation such as AlphaBot's episode skill.
 
-        risk_payload = RiskCheckPayload(
-            trade_proposal=trade_proposal_model,
-            portfolio_state=portfolio_state_model,
-            max_pos_size=max_pos_size,
-            max_concentration=max_concentration,
+        Args:
+            risk_payload: The trade proposal, portfolio and risk limits.
+            riskguard_url: The RiskGuard service to ask.
+            context_id: The A2A context ID to send the check under.
+            log_id: A short ID to tag this check's log lines with.
+
+        Returns:
+            A `RiskCheckResult` as a dict; errors are reported as a rejection
+            with the error as its reason.
+
+        """
+        if is_local_riskguard_url(riskguard_url):
+            return self._check_risk_locally(risk_payload, log_id)
+
+        invocation_id_short = log_id
+        risk_guard_target_url = riskguard_url
+        final_result_dict: dict[str, Any] = {
+            "approved": False,
+            "reason": "A2A call failed or result not found.",
+        }
+        logger.info(
+            f"[{self.name} Tool ({invocation_id_short})] Preparing A2A call to {risk_guard_target_url}",
         )
 
         try:
-            a2a_sdk_client = self._a2a_sdk_clients.get(risk_guard_target_url)
-            if not a2a_sdk_client:
-                client_config = ClientConfig(httpx_client=self._httpx_client)
+            httpx_client = self.httpx_client
+            if httpx_client is not self._a2a_sdk_clients_http:
+                self._a2a_sdk_clients = {}
+                self._a2a_sdk_clients_http = httpx_client
+            agent_card = await agent_cards.get_card(
+                risk_guard_target_url,
+                httpx_client,
+            )
+            cached = self._a2a_sdk_clients.get(risk_guard_target_url)
+            if cached is not None and cached[0] is agent_card:
+                a2a_sdk_client = cached[1]
+            else:
+                # First use, or the card was refreshed: rebuild the client.
+                client_config = ClientConfig(httpx_client=httpx_client)
                 client_factory = ClientFactory(config=client_config)
-                card_resolver = A2ACardResolver(
-                    httpx_client=self._httpx_client,
-                    base_url=risk_guard_target_url,
-                )
-                agent_card = await card_resolver.get_agent_card()
                 a2a_sdk_client = client_factory.create(agent_card)
-                self._a2a_sdk_clients[risk_guard_target_url] = a2a_sdk_client
+                self._a2a_sdk_clients[risk_guard_target_url] = (
+                    agent_card,
+                    a2a_sdk_client,
+                )
 
             # The new client uses a streaming response. We need to iterate.
             message_to_send = Message(
@@ -259,7 +326,7 @@ class A2ARiskCheckTool(BaseTool):
                 parts=[
                     new_data_part(risk_payload.model_dump(mode="json")),
                 ],
-                context_id=tool_context.session.id,
+                context_id=context_id,
             )
             request = SendMessageRequest(message=message_to_send)
             stream = a2a_sdk_client.send_message(request)
@@ -341,6 +408,8 @@ class A2ARiskCheckTool(BaseTool):
             logger.exception(
                 f"[{self.name} Tool ({invocation_id_short})] A2A SDK error connecting to/from RiskGuard ({risk_guard_target_url})"
             )
+            if is_connection_error(e):
+                agent_cards.invalidate(risk_guard_target_url)
             final_result_dict["reason"] = f"A2A SDK Error: {e}. Is RiskGuard running?"
         except ValidationError:
             logger.exception(
@@ -358,17 +427,43 @@ class A2ARiskCheckTool(BaseTool):
         logger.info(
             f"[{self.name} Tool ({invocation_id_short})] Yielding final result: {final_result_dict}",
         )
-        return Event(
-            author=self.name,
-            content=genai_types.Content(
-                parts=[
-                    genai_types.Part(
-                        function_response=genai_types.FunctionResponse(
-                            name=self.name,
-                            response=final_result_dict,
-                        ),
-                    ),
-                ],
-            ),
-            turn_complete=True,  # This tool completes its action in one go
+        return final_result_dict
+
+    def _check_risk_locally(
+        self,
+        risk_payload: RiskCheckPayload,
+        log_id: str,
+    ) -> dict[str, Any]:
+        """Apply RiskGuard's rules in this process and return the result.
+
+        The result and its error reasons match what the RiskGuard service
+        returns for the same payload.
+        """
+        # Imported on first use, so AlphaBot only needs RiskGuard in local mode.
+        try:
+            from riskguard.rules import check_trade_risk_logic
+        except ImportError:
+            logger.exception(
+                f"[{self.name} Tool ({log_id})] Local RiskGuard rules are unavailable",
+            )
+            return RiskCheckResult(
+                approved=False,
+                reason="Local RiskGuard Error: the riskguard package is not installed.",
+            ).model_dump()
+
+        try:
+            result = check_trade_risk_logic(
+                trade_proposal=risk_payload.trade_proposal,
+                portfolio_state=risk_payload.portfolio_state,
+                max_pos_size=risk_payload.max_pos_size,
+                max_concentration=risk_payload.max_concentration,
+            )
+        except Exception as e:
+            logger.exception(
+                f"[{self.name} Tool ({log_id})] Unexpected error in local risk check",
+            )
+            result = RiskCheckResult(approved=False, reason=f"Internal Error: {e}")
+        logger.info(
+            f"[{self.name} Tool ({log_id})] Local risk check result: {result}",
         )
+        return result.model_dump()
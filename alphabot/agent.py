@@ -2,7 +2,9 @@
 
 import logging
 import uuid
+from collections import OrderedDict
 from collections.abc import AsyncGenerator
+from dataclasses import dataclass
 from typing import Any
 
 from google.adk.agents import BaseAgent
@@ -10,24 +12,159 @@ from google.adk.agents.invocation_context import InvocationContext
 from google.adk.events import Event, EventActions
 from google.adk.tools import BaseTool, ToolContext
 from google.genai import types as genai_types
+from pydantic import PrivateAttr
 
 from common.config import (
     DEFAULT_TICKER,
+    MAX_ALPHABOT_INDICATOR_SESSIONS,
 )
 from common.models import AlphaBotTaskPayload, PortfolioState
 from common.utils.agent_utils import parse_and_validate_input
-from common.utils.indicators import calculate_sma
+from common.utils.indicators import RollingSMA
 
 from .a2a_risk_tool import A2ARiskCheckTool
 
 logger = logging.getLogger(__name__)
 
 
+def crossover_signal(
+    sma_short: float,
+    sma_long: float,
+    prev_sma_short: float,
+    prev_sma_long: float,
+) -> str | None:
+    """Return "BUY" or "SELL" if the short SMA crossed the long SMA, else None."""
+    if prev_sma_short <= prev_sma_long and sma_short > sma_long:
+        return "BUY"
+    if prev_sma_short >= prev_sma_long and sma_short < sma_long:
+        return "SELL"
+    return None
+
+
+def determine_trade_proposal(
+    signal: str | None,
+    should_be_long: bool,
+    portfolio_state: PortfolioState,
+    current_price: float,
+    trade_quantity: int,
+    last_rejected_trade: dict | None,
+    ticker: str = DEFAULT_TICKER,
+) -> dict | None:
+    """Determine the trade proposal based on signal and current state."""
+    trade_proposal = None
+
+    if signal == "BUY" and not should_be_long:
+        trade_proposal = {
+            "action": "BUY",
+            "ticker": ticker,
+            "quantity": trade_quantity,
+            "price": current_price,
+        }
+
+    elif signal == "SELL" and should_be_long:
+        # Prevent selling more shares than available
+        if trade_quantity > portfolio_state.shares:
+            logger.warning(
+                f"SELL signal ignored: Trade quantity ({trade_quantity}) "
+                f"exceeds available shares ({portfolio_state.shares}).",
+            )
+            return None
+
+        trade_proposal = {
+            "action": "SELL",
+            "ticker": ticker,
+            "quantity": trade_quantity,
+            "price": current_price,
+        }
+
+    # If a new proposal was generated, check if it's the same as the last rejected one.
+    if trade_proposal and trade_proposal == last_rejected_trade:
+        logger.info(
+            f"Signal to {signal} ignored as it matches a recently rejected trade.",
+        )
+        return None
+
+    return trade_proposal
+
+
+def warmed_up_sma(historical_prices: list[float], period: int) -> RollingSMA:
+    """Return a rolling SMA fed the tail of the history it needs.
+
+    Only the last `period + 1` prices are needed for both its current and
+    previous value, so the SMA is fed just that tail rather than the whole
+    history.
+
+    Raises:
+        ValueError: If `period` is not positive.
+
+    """
+    sma = RollingSMA(period)
+    sma.extend(historical_prices[-(period + 1) :])
+    return sma
+
+
+@dataclass
+class SessionIndicators:
+    """A session's rolling SMAs, as of its price with sequence number `sequence`.
+
+    An SMA is None if its period is not positive, as it never has a value.
+    """
+
+    short_period: int
+    long_period: int
+    sequence: int
+    sma_short: RollingSMA | None
+    sma_long: RollingSMA | None
+
+    @classmethod
+    def from_history(
+        cls,
+        historical_prices: list[float],
+        short_period: int,
+        long_period: int,
+        sequence: int,
+    ) -> "SessionIndicators":
+        """Build the SMAs from the tail of a full price history."""
+        return cls(
+            short_period=short_period,
+            long_period=long_period,
+            sequence=sequence,
+            sma_short=warmed_up_sma(historical_prices, short_period)
+            if short_period > 0
+            else None,
+            sma_long=warmed_up_sma(historical_prices, long_period)
+            if long_period > 0
+            else None,
+        )
+
+    def update(self, price: float, sequence: int) -> None:
+        """Add the price with the next sequence number to both SMAs."""
+        for sma in (self.sma_short, self.sma_long):
+            if sma is not None:
+                sma.update(price)
+        self.sequence = sequence
+
+    def values(self) -> tuple[float | None, float | None, float | None, float | None]:
+        """Return the current and previous short and long SMAs."""
+        short, long = self.sma_short, self.sma_long
+        return (
+            short.value if short else None,
+            long.value if long else None,
+            short.previous if short else None,
+            long.previous if long else None,
+        )
+
+
 class AlphaBotAgent(BaseAgent):
     """ADK Agent implementing the AlphaBot trading logic."""
 
     ticker: str | None = None
     tools: list[BaseTool] | None = None
+    # Rolling SMAs of sessions using the incremental price protocol, least
+    # recently used first. Only their sequence numbers go in the session state.
+    _session_indicators: OrderedDict[str, SessionIndicators] = PrivateAttr(
+        default_factory=OrderedDict,
+    )
 
     def __init__(
         self,
@@ -49,6 +186,48 @@ class AlphaBotAgent(BaseAgent):
         self.ticker = stock_ticker
         logger.debug(f"[{self.name}] Initialized with ticker: {self.ticker}")
 
+    def _sync_indicators(
+        self,
+        payload: AlphaBotTaskPayload,
+        sequence: int,
+        session_id: str,
+        session_state: dict[str, Any],
+    ) -> SessionIndicators | None:
+        """Return the session's SMAs updated for a sequenced payload, or None if a resync is needed.
+
+        `sequence` is the payload's sequence number. A payload with historical prices is a full sync and rebuilds the SMAs.
+        A payload without them adds `current_price` to the SMAs this process
+        holds for the session, which is only valid if they are for the same
+        periods and the sequence number follows the one in the session state.
+        Each such day costs O(1), and the session only stores the sequence.
+        """
+        if payload.historical_prices:
+            indicators = SessionIndicators.from_history(
+                payload.historical_prices,
+                payload.short_sma_period,
+                payload.long_sma_period,
+                sequence,
+            )
+        else:
+            indicators = self._session_indicators.get(session_id)
+            stored_sequence = session_state.get("price_sequence")
+            if (
+                indicators is None
+                or stored_sequence is None
+                or indicators.sequence != stored_sequence
+                or sequence != stored_sequence + 1
+                or indicators.short_period != payload.short_sma_period
+                or indicators.long_period != payload.long_sma_period
+            ):
+                return None
+            indicators.update(payload.current_price, sequence)
+
+        self._session_indicators[session_id] = indicators
+        self._session_indicators.move_to_end(session_id)
+        while len(self._session_indicators) > MAX_ALPHABOT_INDICATOR_SESSIONS:
+            self._session_indicators.popitem(last=False)
+        return indicators
+
     def _calculate_indicators(
         self,
         historical_prices: list[float],
@@ -63,18 +242,15 @@ class AlphaBotAgent(BaseAgent):
             f"Historical prices count: {len(historical_prices)}.",
         )
 
-        sma_short = calculate_sma(historical_prices, short_period)
-        sma_long = calculate_sma(historical_prices, long_period)
-
-        prev_sma_short = None
-        prev_sma_long = None
-
-        if len(historical_prices) > 1:
-            previous_prices = historical_prices[:-1]
-            if len(previous_prices) >= short_period:
-                prev_sma_short = calculate_sma(previous_prices, short_period)
-            if len(previous_prices) >= long_period:
-                prev_sma_long = calculate_sma(previous_prices, long_period)
+        # An unsequenced payload carries its whole history, so nothing is kept.
+        sma_short, sma_long, prev_sma_short, prev_sma_long = (
+            SessionIndicators.from_history(
+                historical_prices,
+                short_period,
+                long_period,
+                sequence=0,
+            ).values()
+        )
 
         logger.info(
             f"[{self.name} ({invocation_id[:8]})] SMAs: CurrShort={sma_short if sma_short is not None else 'N/A'}, "
@@ -105,25 +281,22 @@ class AlphaBotAgent(BaseAgent):
             )
             return None
 
-        buy_cond1 = prev_sma_short <= prev_sma_long
-        buy_cond2 = sma_short > sma_long
+        signal = crossover_signal(sma_short, sma_long, prev_sma_short, prev_sma_long)
         logger.info(
-            f"[{self.name} ({invocation_id[:8]})] BUY Check: (Prev Short {prev_sma_short:.2f} <= Prev Long {prev_sma_long:.2f}) = {buy_cond1}, "
-            f"(Curr Short {sma_short:.2f} > Curr Long {sma_long:.2f}) = {buy_cond2}",
+            f"[{self.name} ({invocation_id[:8]})] BUY Check: (Prev Short {prev_sma_short:.2f} <= Prev Long {prev_sma_long:.2f}) = {prev_sma_short <= prev_sma_long}, "
+            f"(Curr Short {sma_short:.2f} > Curr Long {sma_long:.2f}) = {sma_short > sma_long}",
         )
-        if buy_cond1 and buy_cond2:
+        if signal == "BUY":
             logger.info(
                 f"[{self.name} ({invocation_id[:8]})] +++ BUY SIGNAL DETECTED +++",
             )
             return "BUY"
 
-        sell_cond1 = prev_sma_short >= prev_sma_long
-        sell_cond2 = sma_short < sma_long
         logger.info(
-            f"[{self.name} ({invocation_id[:8]})] SELL Check: (Prev Short {prev_sma_short:.2f} >= Prev Long {prev_sma_long:.2f}) = {sell_cond1}, "
-            f"(Curr Short {sma_short:.2f} < Curr Long {sma_long:.2f}) = {sell_cond2}",
+            f"[{self.name} ({invocation_id[:8]})] SELL Check: (Prev Short {prev_sma_short:.2f} >= Prev Long {prev_sma_long:.2f}) = {prev_sma_short >= prev_sma_long}, "
+            f"(Curr Short {sma_short:.2f} < Curr Long {sma_long:.2f}) = {sma_short < sma_long}",
         )
-        if sell_cond1 and sell_cond2:
+        if signal == "SELL":
             logger.info(
                 f"[{self.name} ({invocation_id[:8]})] --- SELL SIGNAL DETECTED ---",
             )
@@ -134,51 +307,14 @@ class AlphaBotAgent(BaseAgent):
         )
         return None
 
-    def _determine_trade_proposal(
-        self,
-        signal: str | None,
-        should_be_long: bool,
-        portfolio_state: PortfolioState,
-        current_price: float,
-        trade_quantity: int,
-        last_rejected_trade: dict | None,
-    ) -> dict | None:
-        """Determine the trade proposal based on signal and current state."""
-        trade_proposal = None
-        ticker = self.ticker or DEFAULT_TICKER
-
-        if signal == "BUY" and not should_be_long:
-            trade_proposal = {
-                "action": "BUY",
-                "ticker": ticker,
-                "quantity": trade_quantity,
-                "price": current_price,
-            }
-
-        elif signal == "SELL" and should_be_long:
-            # Prevent selling more shares than available
-            if trade_quantity > portfolio_state.shares:
-                logger.warning(
-                    f"SELL signal ignored: Trade quantity ({trade_quantity}) "
-                    f"exceeds available shares ({portfolio_state.shares}).",
-                )
-                return None
-
-            trade_proposal = {
-                "action": "SELL",
-                "ticker": ticker,
-                "quantity": trade_quantity,
-                "price": current_price,
-            }
-
-        # If a new proposal was generated, check if it's the same as the last rejected one.
-        if trade_proposal and trade_proposal == last_rejected_trade:
-            logger.info(
-                f"Signal to {signal} ignored as it matches a recently rejected trade.",
-            )
+    def risk_check_tool(self) -> A2ARiskCheckTool | None:
+        """Return the agent's A2A risk check tool, if it has one."""
+        if self.tools is None:
             return None
-
-        return trade_proposal
+        return next(
+            (t for t in self.tools if isinstance(t, A2ARiskCheckTool)),
+            None,
+        )
 
     async def _perform_risk_check(
         self,
@@ -202,13 +338,7 @@ class AlphaBotAgent(BaseAgent):
             f"[{self.name} ({invocation_id_short})] A2A Tool Args: {tool_args}",
         )
 
-        a2a_risk_tool_instance = None
-        if self.tools is not None:
-            a2a_risk_tool_instance = next(
-                (t for t in self.tools if isinstance(t, A2ARiskCheckTool)),
-                None,
-            )
-
+        a2a_risk_tool_instance = self.risk_check_tool()
         if not a2a_risk_tool_instance:
             logger.error(
                 f"[{self.name} ({invocation_id_short})] ERROR - A2A Risk check tool not found.",
@@ -372,7 +502,47 @@ class AlphaBotAgent(BaseAgent):
             "max_concentration": validated_input.max_concentration,
         }
 
-        if not historical_prices or current_price is None:
+        sequenced_smas = None
+        if validated_input.sequence is not None:
+            indicators = self._sync_indicators(
+                validated_input,
+                validated_input.sequence,
+                ctx.session.id,
+                ctx.session.state,
+            )
+            if indicators is None:
+                logger.warning(
+                    f"[{self.name} ({invocation_id_short})] Price sequence {validated_input.sequence} does not follow "
+                    f"session sequence {ctx.session.state.get('price_sequence')}. Requesting resync.",
+                )
+                yield Event(
+                    author=self.name,
+                    content=genai_types.Content(
+                        parts=[
+                            genai_types.Part(
+                                text=f"Resync required: price sequence {validated_input.sequence} does not follow the session's price window.",
+                            ),
+                        ],
+                    ),
+                    actions=EventActions(state_delta={"resync_required": True}),
+                    turn_complete=True,
+                )
+                logger.info(
+                    f"[{self.name} ({invocation_id_short})] >>> Invocation END (Resync Required) <<<",
+                )
+                return
+            sequenced_smas = indicators.values()
+            yield Event(
+                author=self.name,
+                actions=EventActions(
+                    state_delta={
+                        "price_sequence": validated_input.sequence,
+                        "resync_required": False,
+                    },
+                ),
+            )
+
+        if sequenced_smas is None and (not historical_prices or current_price is None):
             logger.warning(
                 f"[{self.name} ({invocation_id_short})] Insufficient market data. Yielding event.",
             )
@@ -392,11 +562,14 @@ class AlphaBotAgent(BaseAgent):
             )
             return
 
-        sma_short, sma_long, prev_sma_short, prev_sma_long = self._calculate_indicators(
-            historical_prices,
-            short_sma_period,
-            long_sma_period,
-            ctx.invocation_id,
+        sma_short, sma_long, prev_sma_short, prev_sma_long = (
+            sequenced_smas
+            or self._calculate_indicators(
+                historical_prices,
+                short_sma_period,
+                long_sma_period,
+                ctx.invocation_id,
+            )
         )
         if sma_short is None or sma_long is None:
             logger.info(
@@ -465,13 +638,14 @@ class AlphaBotAgent(BaseAgent):
             )
             return
 
-        trade_proposal = self._determine_trade_proposal(
+        trade_proposal = determine_trade_proposal(
             signal=signal,
             should_be_long=current_should_be_long,
             portfolio_state=portfolio_state,
             current_price=current_price,
             trade_quantity=trade_quantity,
             last_rejected_trade=last_rejected_trade,
+            ticker=self.ticker or DEFAULT_TICKER,
         )
 
         if not trade_proposal:
@@ -1,12 +1,13 @@
 """Agent Executor for the AlphaBot agent."""
 
 import logging
+import uuid
+from typing import Any
 
 from a2a.helpers import get_data_parts, new_data_part
 from a2a.server.agent_execution import AgentExecutor, RequestContext
 from a2a.server.events import EventQueue
 from a2a.server.tasks.task_updater import TaskUpdater
-from a2a.types import Part, Task, TaskState, TaskStatus
 from google.adk import Runner
 from google.adk.memory import InMemoryMemoryService
 from google.adk.sessions import InMemorySessionService, Session
@@ -14,7 +15,22 @@ from google.genai import types as genai_types
 from pydantic import ValidationError
 
 from alphabot.agent import root_agent as alphabot_adk_agent
-from common.models import AlphaBotTaskPayload, TradeOutcome, TradeStatus
+from alphabot.episode import run_episode
+from common.config import ALPHABOT_EPISODE_SKILL_ID
+from common.models import (
+    AlphaBotEpisodePayload,
+    AlphaBotTaskPayload,
+    EpisodeChunk,
+    EpisodeDayOutcome,
+    TradeOutcome,
+    TradeStatus,
+)
+from common.utils.task_events import (
+    fail_task,
+    fast_response_enabled,
+    result_message,
+    start_task,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -22,8 +38,18 @@ logger = logging.getLogger(__name__)
 class AlphaBotAgentExecutor(AgentExecutor):
     """Executes the AlphaBot ADK agent logic in response to A2A requests."""
 
-    def __init__(self) -> None:
-        """Initialize the AlphaBotAgentExecutor."""
+    def __init__(self, fast_response: bool | None = None) -> None:
+        """Initialize the AlphaBotAgentExecutor.
+
+        Args:
+            fast_response: Whether to answer single-day requests with a single
+                message instead of a task's events; defaults to the
+                A2A_FAST_RESPONSE setting. Episodes always run as tasks.
+
+        """
+        self.fast_response = (
+            fast_response_enabled() if fast_response is None else fast_response
+        )
         self._adk_agent = alphabot_adk_agent
         self._adk_runner = Runner(
             app_name="alphabot_adk_runner",
@@ -31,12 +57,15 @@ class AlphaBotAgentExecutor(AgentExecutor):
             session_service=InMemorySessionService(),
             memory_service=InMemoryMemoryService(),
         )
-        logger.info("AlphaBotAgentExecutor initialized with ADK Runner.")
+        logger.info(
+            f"AlphaBotAgentExecutor initialized with ADK Runner (fast response: {self.fast_response}).",
+        )
 
     async def execute(self, context: RequestContext, event_queue: EventQueue) -> None:
         """Receive a unified task payload and run it through the ADK agent.
 
-        The structured result is returned in a standard Artifact.
+        The structured result is returned in a standard Artifact or, in fast
+        response mode, in a single Message event.
         """
         if not context.context_id:
             msg = "Context ID is missing, cannot execute."
@@ -51,23 +80,12 @@ class AlphaBotAgentExecutor(AgentExecutor):
             status=TradeStatus.ERROR,
             reason="Initialization failed.",
         )
+        status_text = "Analyzing market and portfolio state..."
+        task_started = False
         try:
-            # Enqueue the initial Task object to start task mode
-            await event_queue.enqueue_event(
-                Task(
-                    id=context.task_id or "",
-                    context_id=context.context_id or "",
-                    status=TaskStatus(state=TaskState.TASK_STATE_SUBMITTED),
-                    history=[context.message] if context.message else [],
-                ),
-            )
-
-            # Set task state to WORKING
-            await updater.start_work(
-                message=updater.new_agent_message(
-                    parts=[Part(text="Analyzing market and portfolio state...")],
-                ),
-            )
+            if not self.fast_response:
+                await start_task(context, event_queue, updater, status_text)
+                task_started = True
 
             if not context.message or not context.message.parts:
                 msg = "Received an empty or invalid message."
@@ -78,6 +96,19 @@ class AlphaBotAgentExecutor(AgentExecutor):
                 msg = "Expected a DataPart with AlphaBotTaskPayload"
                 raise ValueError(msg)
 
+            if data_parts[0].get("skill") == ALPHABOT_EPISODE_SKILL_ID:
+                # Episodes stream their days, so they always run as a task.
+                if not task_started:
+                    await start_task(context, event_queue, updater, status_text)
+                    task_started = True
+                await self._execute_episode(
+                    data_parts[0],
+                    context.context_id,
+                    updater,
+                )
+                await updater.complete()
+                return
+
             validated_payload = AlphaBotTaskPayload.model_validate(data_parts[0])
             agent_input_json = validated_payload.model_dump_json()
             adk_content = genai_types.Content(
@@ -122,7 +153,12 @@ class AlphaBotAgentExecutor(AgentExecutor):
                     if text_part:
                         final_reason_text = text_part.text
 
-            if "approved_trade" in captured_state_delta:
+            if captured_state_delta.get("resync_required"):
+                trade_decision = {
+                    "status": TradeStatus.RESYNC_REQUIRED,
+                    "reason": final_reason_text,
+                }
+            elif "approved_trade" in captured_state_delta:
                 trade_decision = {
                     "status": TradeStatus.APPROVED,
                     "reason": final_reason_text,
@@ -143,6 +179,12 @@ class AlphaBotAgentExecutor(AgentExecutor):
                 }
             outcome = TradeOutcome.model_validate(trade_decision)
 
+            if self.fast_response:
+                await event_queue.enqueue_event(
+                    result_message(context.context_id, outcome.model_dump()),
+                )
+                return
+
             # Save the result as artifact
             await updater.add_artifact(
                 parts=[new_data_part(outcome.model_dump())],
@@ -156,20 +198,56 @@ class AlphaBotAgentExecutor(AgentExecutor):
         except (ValidationError, ValueError, RuntimeError, AttributeError) as e:
             logger.exception("Error during agent execution")
             try:
-                error_msg = updater.new_agent_message(parts=[Part(text=str(e))])
-                await updater.failed(message=error_msg)
+                await fail_task(context, event_queue, updater, str(e), task_started)
             except Exception:
                 logger.exception("Failed to publish failure update")
         except Exception:
             logger.exception("An unexpected error occurred")
             try:
-                error_msg = updater.new_agent_message(
-                    parts=[Part(text="An unexpected server error occurred.")],
+                await fail_task(
+                    context,
+                    event_queue,
+                    updater,
+                    "An unexpected server error occurred.",
+                    task_started,
                 )
-                await updater.failed(message=error_msg)
             except Exception:
                 logger.exception("Failed to publish failure update")
 
+    async def _execute_episode(
+        self,
+        payload_data: dict[str, Any],
+        context_id: str,
+        updater: TaskUpdater,
+    ) -> None:
+        """Run an episode and stream its day outcomes as chunks of one artifact.
+
+        Each chunk is an `EpisodeChunk` DataPart appended to the "episode"
+        artifact, so a streaming client can use the days as they are decided
+        and a non-streaming client gets them all in the completed task.
+        """
+        payload = AlphaBotEpisodePayload.model_validate(payload_data)
+        logger.info(
+            f"Running episode of {len(payload.prices)} days in chunks of {payload.chunk_days}",
+        )
+        artifact_id = uuid.uuid4().hex
+        num_days = len(payload.prices)
+        chunk: list[EpisodeDayOutcome] = []
+        first_chunk = True
+        async for outcome in run_episode(self._adk_agent, payload, context_id):
+            chunk.append(outcome)
+            if len(chunk) < payload.chunk_days and outcome.day < num_days:
+                continue
+            await updater.add_artifact(
+                parts=[new_data_part(EpisodeChunk(days=chunk).model_dump(mode="json"))],
+                artifact_id=artifact_id,
+                name="episode",
+                append=not first_chunk,
+                last_chunk=outcome.day == num_days,
+            )
+            chunk = []
+            first_chunk = False
+
     async def cancel(self, context: RequestContext, event_queue: EventQueue) -> None:
         """Cancel the agent execution."""
         logger.warning(
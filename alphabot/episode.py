@@ -0,0 +1,159 @@
+"""AlphaBot's episode skill: a whole simulation's day loop in one task.
+
+A single-day task runs the ADK agent once and keeps its position and last
+rejected trade in the session, so a simulation costs one A2A round-trip per
+day. An episode instead carries the whole price series: AlphaBot updates its
+SMAs incrementally, makes each day's decision with the agent's own rules,
+checks proposals with RiskGuard and applies approved trades to the
+portfolio itself, so the simulator only waits for the day outcomes.
+"""
+
+import logging
+from collections.abc import AsyncIterator
+
+from common.config import DEFAULT_TICKER
+from common.models import (
+    AlphaBotEpisodePayload,
+    EpisodeDayOutcome,
+    PortfolioState,
+    RiskCheckPayload,
+    TradeProposal,
+    TradeStatus,
+)
+
+from .agent import (
+    AlphaBotAgent,
+    crossover_signal,
+    determine_trade_proposal,
+    warmed_up_sma,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def run_episode(
+    agent: AlphaBotAgent,
+    payload: AlphaBotEpisodePayload,
+    context_id: str,
+) -> AsyncIterator[EpisodeDayOutcome]:
+    """Run an episode's day loop and yield each day's outcome as it is decided.
+
+    Each day gets the decision a single-day task would give for the same price
+    history, start-of-day portfolio and session state, including the state
+    correction and the skip of a re-proposed rejected trade.
+
+    Args:
+        agent: The AlphaBot agent whose rules and risk check tool are used.
+        payload: The episode's prices, starting portfolio and parameters.
+        context_id: The A2A context ID to send RiskGuard checks under.
+
+    Raises:
+        RuntimeError: If the agent has no risk check tool.
+
+    """
+    risk_tool = agent.risk_check_tool()
+    if risk_tool is None:
+        msg = "Risk check tool misconfiguration."
+        raise RuntimeError(msg)
+
+    sma_short = warmed_up_sma(payload.historical_prices, payload.short_sma_period)
+    sma_long = warmed_up_sma(payload.historical_prices, payload.long_sma_period)
+    cash = payload.portfolio_state.cash
+    shares = payload.portfolio_state.shares
+    should_be_long = False
+    last_rejected_trade: dict | None = None
+
+    for day, price in enumerate(payload.prices, start=1):
+        sma_short.update(price)
+        sma_long.update(price)
+        portfolio = PortfolioState(
+            cash=cash,
+            shares=shares,
+            total_value=cash + shares * price,
+        )
+        status = TradeStatus.NO_ACTION
+        trade_proposal = None
+        executed = None
+
+        if sma_short.value is None or sma_long.value is None:
+            reason = "No signal yet (calculating SMAs)."
+        elif sma_short.previous is None or sma_long.previous is None:
+            reason = "No signal (Not enough history for previous SMAs)."
+        else:
+            signal = crossover_signal(
+                sma_short.value,
+                sma_long.value,
+                sma_short.previous,
+                sma_long.previous,
+            )
+            if signal is None:
+                reason = "No signal (Conditions not met)."
+            elif signal == "SELL" and should_be_long and shares == 0:
+                should_be_long = False
+                reason = (
+                    "State correction: Position was long as per session state, "
+                    "but no shares held on SELL signal. Corrected to flat/not long."
+                )
+            else:
+                proposal = determine_trade_proposal(
+                    signal=signal,
+                    should_be_long=should_be_long,
+                    portfolio_state=portfolio,
+                    current_price=price,
+                    trade_quantity=payload.trade_quantity,
+                    last_rejected_trade=last_rejected_trade,
+                    ticker=agent.ticker or DEFAULT_TICKER,
+                )
+                if proposal is None:
+                    reason = (
+                        "Signal generated, but no trade action needed based on "
+                        "current state or recent rejections."
+                    )
+                else:
+                    trade_proposal = TradeProposal(**proposal)
+                    risk_result = await risk_tool.check_risk(
+                        RiskCheckPayload(
+                            trade_proposal=trade_proposal,
+                            portfolio_state=portfolio,
+                            max_pos_size=payload.max_pos_size,
+                            max_concentration=payload.max_concentration,
+                        ),
+                        riskguard_url=payload.riskguard_url,
+                        context_id=context_id,
+                        log_id=f"day {day}",
+                    )
+                    risk_reason = risk_result.get("reason", "No reason provided.")
+                    if risk_result.get("approved", False):
+                        status = TradeStatus.APPROVED
+                        reason = f"Trade Approved (A2A): {risk_reason}"
+                        should_be_long = signal == "BUY"
+                        cost = trade_proposal.quantity * price
+                        if signal == "BUY":
+                            executed = cost <= cash
+                            if executed:
+                                cash -= cost
+                                shares += trade_proposal.quantity
+                        else:
+                            executed = trade_proposal.quantity <= shares
+                            if executed:
+                                cash += cost
+                                shares -= trade_proposal.quantity
+                    else:
+                        status = TradeStatus.REJECTED
+                        reason = f"Trade Rejected (A2A): {risk_reason}"
+                        last_rejected_trade = proposal
+
+        logger.debug("Episode day %s: %s %s", day, status.value, reason)
+        yield EpisodeDayOutcome(
+            day=day,
+            price=price,
+            status=status,
+            reason=reason,
+            trade_proposal=trade_proposal,
+            executed=executed,
+            portfolio_state=PortfolioState(
+                cash=cash,
+                shares=shares,
+                total_value=cash + shares * price,
+            ),
+        )
@@ -6,6 +6,9 @@ DEFAULT_RISKGUARD_PORT: int = 8080
 DEFAULT_RISKGUARD_URL: str = f"http://127.0.0.1:{DEFAULT_RISKGUARD_PORT}"
 DEFAULT_RISKGUARD_MAX_POS_SIZE: float = 10000.0
 DEFAULT_RISKGUARD_MAX_CONCENTRATION: float = 0.50
+# A RiskGuard URL with this scheme runs the risk rules inside AlphaBot
+LOCAL_RISKGUARD_SCHEME: str = "local"
+LOCAL_RISKGUARD_URL: str = f"{LOCAL_RISKGUARD_SCHEME}://riskguard"
 
 # --- AlphaBot Defaults ---
 DEFAULT_ALPHABOT_PORT: int = 8081
@@ -14,6 +17,10 @@ DEFAULT_ALPHABOT_SHORT_SMA: int = 5
 DEFAULT_ALPHABOT_LONG_SMA: int = 30
 DEFAULT_ALPHABOT_TRADE_QTY: int = 100
 DEFAULT_ALPHABOT_TRADE_DECISION_ARTIFACT_NAME: str = "trade_decision"
+MAX_ALPHABOT_INDICATOR_SESSIONS: int = 1024  # Sessions whose rolling SMAs are kept
+ALPHABOT_EPISODE_SKILL_ID: str = "run_episode"
+DEFAULT_ALPHABOT_EPISODE_CHUNK_DAYS: int = 250  # Day outcomes per streamed chunk
+MAX_ALPHABOT_EPISODE_DAYS: int = 10000
 
 # --- Simulator Defaults ---
 DEFAULT_SIMULATOR_PORT: int = 8000
@@ -23,6 +30,52 @@ DEFAULT_SIM_INITIAL_CASH: float = 100000.0
 DEFAULT_SIM_INITIAL_PRICE: float = 100.0
 DEFAULT_SIM_VOLATILITY: float = 0.02
 DEFAULT_SIM_TREND: float = 0.0005
+DEFAULT_SIM_BLOCK_SIZE: int = 256  # Days drawn per vectorized block in seeded mode
+DEFAULT_MARKET_DATA_DIR: str = "data"  # Replay files are resolved inside this directory
+# Day events queued before a stream pauses the run
+SIMULATION_STREAM_BUFFER_DAYS: int = 256
+
+# --- Results Chart ---
+# Longer lines are downsampled, keeping trade days
+CHART_MAX_POINTS_PER_TRACE: int = 2000
+CHART_WEBGL_THRESHOLD_DAYS: int = 1000  # Longer runs are drawn with WebGL traces
+# Runs whose chart and detailed log can still be fetched
+SIMULATION_ARTIFACT_STORE_SIZE: int = 64
+SIMULATION_LOG_MAX_RECORDS: int = 5000  # Newest detailed log records kept per run
+
+# --- Monte Carlo Ensemble Defaults ---
+DEFAULT_ENSEMBLE_PATHS: int = 1000
+DEFAULT_ENSEMBLE_BOOTSTRAP_SAMPLES: int = 1000
+DEFAULT_ENSEMBLE_CONFIDENCE_LEVEL: float = 0.95
+MAX_ENSEMBLE_PATH_DAYS: int = 10_000_000  # Paths x days, about 80 MB per price array
+MAX_ENSEMBLE_BOOTSTRAP_DRAWS: int = 10_000_000  # Bootstrap samples x paths
+
+# --- Parameter Sweep Defaults ---
+DEFAULT_SWEEP_CONCURRENCY: int = 4  # Simulations run at once
+MAX_SWEEP_COMBINATIONS: int = 1000
+
+# --- Simulation Result Cache Defaults ---
+SIMULATION_RESULT_CACHE_SIZE: int = 32  # Seeded runs whose results are kept
+SIMULATION_RESULT_CACHE_TTL_SECONDS: float = 600.0
+
+# --- Simulation Job Queue Defaults ---
+# Queued and finished jobs are persisted here
+DEFAULT_SIMULATION_JOB_DIR: str = "data/jobs"
+DEFAULT_SIMULATION_JOB_WORKERS: int = 2  # Jobs run at once
+MAX_QUEUED_SIMULATION_JOBS: int = 100
+DEFAULT_SIMULATION_JOB_RETENTION: int = 100  # Finished jobs kept
+DEFAULT_SIMULATION_JOB_TTL_HOURS: float = 24.0  # How long finished jobs are kept
+
+# --- Inter-Agent HTTP Connection Pool Defaults ---
+DEFAULT_HTTP_MAX_CONNECTIONS: int = 100  # Connections open at once, per process
+DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20  # Idle connections kept warm
+DEFAULT_HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+DEFAULT_HTTP_TIMEOUT_SECONDS: float = 10.0
+AGENT_CARD_CACHE_TTL_SECONDS: float = 300.0  # Agent cards are fetched again after this
+
+# --- A2A Executor Defaults ---
+# Answer quick requests with one terminal message instead of a task's events
+DEFAULT_A2A_FAST_RESPONSE: bool = False
 
 # --- Ticker Symbol ---
 DEFAULT_TICKER: str = "TECH"
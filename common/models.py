@@ -1,18 +1,21 @@
 """Data models for the agentic trading simulator."""
 
 from enum import StrEnum
-from typing import Literal
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import BaseModel, Field, field_validator
 
 # --- Import Defaults from config.py ---
 from .config import (
+    DEFAULT_ALPHABOT_EPISODE_CHUNK_DAYS,
     DEFAULT_ALPHABOT_LONG_SMA,
     DEFAULT_ALPHABOT_SHORT_SMA,
     DEFAULT_ALPHABOT_TRADE_QTY,
     DEFAULT_RISKGUARD_MAX_CONCENTRATION,
     DEFAULT_RISKGUARD_MAX_POS_SIZE,
     DEFAULT_RISKGUARD_URL,
+    MAX_ALPHABOT_EPISODE_DAYS,
 )
 
 # --- Shared Core Models ---
@@ -63,11 +66,17 @@ class AlphaBotTaskPayload(BaseModel):
     This is sent FROM the Simulator TO AlphaBot.
     """
 
-    historical_prices: list[float]
+    historical_prices: list[float] = Field(default_factory=list)
     current_price: float
     portfolio_state: PortfolioState
     day: int
 
+    # Incremental price protocol (opt-in): when a sequence number is set, AlphaBot
+    # keeps rolling SMAs for the session. A payload with historical_prices is a
+    # full sync; one without only appends current_price, and must carry the next
+    # sequence number or AlphaBot answers RESYNC_REQUIRED.
+    sequence: int | None = Field(default=None, ge=0)
+
     # Agent parameters can be grouped for clarity
     short_sma_period: int = Field(default=DEFAULT_ALPHABOT_SHORT_SMA)
     long_sma_period: int = Field(default=DEFAULT_ALPHABOT_LONG_SMA)
@@ -78,6 +87,14 @@ class AlphaBotTaskPayload(BaseModel):
     max_pos_size: float = Field(default=DEFAULT_RISKGUARD_MAX_POS_SIZE)
     max_concentration: float = Field(default=DEFAULT_RISKGUARD_MAX_CONCENTRATION)
 
+    @field_validator("historical_prices", mode="before")
+    @classmethod
+    def _convert_price_array(cls, value: Any) -> Any:
+        """Accept a NumPy price window, converting it to a list in one C-level call."""
+        if isinstance(value, np.ndarray):
+            return value.tolist()
+        return value
+
 
 class TradeStatus(StrEnum):
     """Enum for the status of a trade decision from AlphaBot."""
@@ -86,6 +103,7 @@ class TradeStatus(StrEnum):
     REJECTED = "REJECTED"
     NO_ACTION = "NO_ACTION"  # No signal or trade proposed
     ERROR = "ERROR"
+    RESYNC_REQUIRED = "RESYNC_REQUIRED"  # Incremental price sequence has a gap
 
 
 class TradeOutcome(BaseModel):
@@ -94,3 +112,60 @@ class TradeOutcome(BaseModel):
     status: TradeStatus
     reason: str
     trade_proposal: TradeProposal | None = None
+
+
+class AlphaBotEpisodePayload(BaseModel):
+    """A whole simulation for AlphaBot's episode skill, evaluated in one A2A call.
+
+    This is sent FROM the Simulator TO AlphaBot. AlphaBot runs the day loop
+    itself: for each price it decides as it would on a single-day task,
+    checks proposals with RiskGuard and applies approved trades to the
+    portfolio, starting from a fresh session (flat, nothing rejected yet).
+    """
+
+    # Identifies the skill, as both skills take a DataPart.
+    skill: Literal["run_episode"] = "run_episode"
+    # Prices before day 1, which warm up the SMAs.
+    historical_prices: list[float] = Field(default_factory=list)
+    # One price per simulated day.
+    prices: list[float] = Field(min_length=1, max_length=MAX_ALPHABOT_EPISODE_DAYS)
+    portfolio_state: PortfolioState
+
+    short_sma_period: int = Field(default=DEFAULT_ALPHABOT_SHORT_SMA, gt=0)
+    long_sma_period: int = Field(default=DEFAULT_ALPHABOT_LONG_SMA, gt=0)
+    trade_quantity: int = Field(default=DEFAULT_ALPHABOT_TRADE_QTY)
+
+    riskguard_url: str = Field(default=DEFAULT_RISKGUARD_URL)
+    max_pos_size: float = Field(default=DEFAULT_RISKGUARD_MAX_POS_SIZE)
+    max_concentration: float = Field(default=DEFAULT_RISKGUARD_MAX_CONCENTRATION)
+
+    # Day outcomes per streamed artifact chunk.
+    chunk_days: int = Field(default=DEFAULT_ALPHABOT_EPISODE_CHUNK_DAYS, gt=0)
+
+    @field_validator("historical_prices", "prices", mode="before")
+    @classmethod
+    def _convert_price_array(cls, value: Any) -> Any:
+        """Accept NumPy prices, converting them to a list in one C-level call."""
+        if isinstance(value, np.ndarray):
+            return value.tolist()
+        return value
+
+
+class EpisodeDayOutcome(BaseModel):
+    """AlphaBot's decision on one day of an episode, and the portfolio after it."""
+
+    day: int
+    price: float
+    status: TradeStatus
+    reason: str
+    trade_proposal: TradeProposal | None = None
+    # Whether an approved trade could be applied (None unless approved).
+    executed: bool | None = None
+    # After the day's trade, valued at the day's price.
+    portfolio_state: PortfolioState
+
+
+class EpisodeChunk(BaseModel):
+    """One chunk of the episode artifact: consecutive day outcomes."""
+
+    days: list[EpisodeDayOutcome]
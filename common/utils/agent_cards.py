@@ -0,0 +1,138 @@
+"""A process-wide cache of resolved A2A agent cards, by agent URL.
+
+Building an A2A client needs the agent's card, and fetching it is an extra
+HTTP round-trip before the first real request. `AgentCardCache` keeps each
+card for a time to live, so simulation runs and risk checks start straight
+away, while a redeployed agent is still picked up once its card expires. A
+connection error evicts the agent's card so the next call resolves it again,
+and services fetch the cards they depend on in the background at startup.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import httpx
+from a2a.client import A2ACardResolver
+from a2a.types import AgentCard
+
+from common.config import AGENT_CARD_CACHE_TTL_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+def is_connection_error(error: BaseException) -> bool:
+    """Return True if an error, or one it was raised from, is an HTTP transport error."""
+    cause: BaseException | None = error
+    while cause is not None:
+        if isinstance(cause, httpx.TransportError):
+            return True
+        cause = cause.__cause__
+    return False
+
+
+def _card_key(url: str) -> str:
+    """Return the cache key for an agent URL, ignoring any trailing slash."""
+    return url.rstrip("/")
+
+
+@dataclass
+class _CachedCard:
+    card: AgentCard
+    fetched_at: float
+
+
+class AgentCardCache:
+    """Agent cards by agent URL, each kept for a time to live."""
+
+    def __init__(self, ttl_seconds: float) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds: How long a card is used before it is fetched again.
+
+        """
+        self.ttl_seconds = ttl_seconds
+        self._cards: dict[str, _CachedCard] = {}
+        # One lock per URL, so concurrent first calls share one fetch. Locks
+        # belong to an event loop, so they are replaced with the loop.
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def __len__(self) -> int:
+        """Return the number of cards held, including expired ones."""
+        return len(self._cards)
+
+    def _cached(self, url: str) -> AgentCard | None:
+        entry = self._cards.get(url)
+        if entry is None or time.monotonic() - entry.fetched_at >= self.ttl_seconds:
+            return None
+        return entry.card
+
+    async def get_card(self, url: str, httpx_client: httpx.AsyncClient) -> AgentCard:
+        """Return the agent's card, fetching it if it is not cached or has expired.
+
+        Raises:
+            A2AClientError: If the card cannot be fetched.
+
+        """
+        url = _card_key(url)
+        card = self._cached(url)
+        if card is not None:
+            return card
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._locks = {}
+            self._loop = loop
+        async with self._locks.setdefault(url, asyncio.Lock()):
+            card = self._cached(url)
+            if card is None:
+                card = await A2ACardResolver(
+                    httpx_client=httpx_client,
+                    base_url=url,
+                ).get_agent_card()
+                self._cards[url] = _CachedCard(card, time.monotonic())
+                logger.info(f"Cached agent card for {url} ({card.name})")
+        return card
+
+    def invalidate(self, url: str) -> None:
+        """Drop an agent's card, so the next call fetches it again."""
+        url = _card_key(url)
+        if self._cards.pop(url, None) is not None:
+            logger.info(f"Dropped cached agent card for {url}")
+
+    def clear(self) -> None:
+        """Drop every cached card."""
+        self._cards.clear()
+
+    async def prewarm(
+        self,
+        urls: Iterable[str],
+        httpx_client: httpx.AsyncClient,
+    ) -> None:
+        """Fetch the cards of several agents at once, logging any that fail."""
+        urls = list(urls)
+        results = await asyncio.gather(
+            *(self.get_card(url, httpx_client) for url in urls),
+            return_exceptions=True,
+        )
+        for url, result in zip(urls, results, strict=True):
+            if isinstance(result, Exception):
+                logger.warning(
+                    f"Could not prewarm the agent card for {url}: {result}. "
+                    "It will be fetched on first use.",
+                )
+
+    def start_prewarm(
+        self,
+        urls: Iterable[str],
+        httpx_client: httpx.AsyncClient,
+    ) -> asyncio.Task[None]:
+        """Start `prewarm` in the background and return its task."""
+        return asyncio.create_task(self.prewarm(urls, httpx_client))
+
+
+# The process-wide cache used for all A2A clients between the services.
+agent_cards = AgentCardCache(AGENT_CARD_CACHE_TTL_SECONDS)
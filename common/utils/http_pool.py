@@ -0,0 +1,195 @@
+"""A shared, pooled httpx client for traffic between the services.
+
+Opening a client per run or per tool means a TCP (and TLS) handshake for
+every run and sockets that are never reused. `HttpClientPool` instead holds
+one `httpx.AsyncClient` per process with bounded connection and keep-alive
+limits, so concurrent simulations multiplex over warm connections to AlphaBot
+and RiskGuard. Each service closes it from its FastAPI lifespan.
+
+An httpx client is bound to the event loop it first connects on, so the pool
+replaces its client when used from another loop (as `asyncio.run` does in
+the simulation worker processes). If the old loop is still running, in
+another thread, the old client is closed on it; otherwise it is dropped, as
+its connections can no longer be closed from their loop and are released
+with the client.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import os
+
+import httpx
+from pydantic import BaseModel
+
+from common.config import (
+    DEFAULT_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    DEFAULT_HTTP_MAX_CONNECTIONS,
+    DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    DEFAULT_HTTP_TIMEOUT_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class HttpPoolStats(BaseModel):
+    """A snapshot of the shared client's connection pool."""
+
+    http2: bool
+    max_connections: int
+    max_keepalive_connections: int
+    # Open connections, split into those serving a request and idle ones.
+    connections: int
+    active_connections: int
+    idle_connections: int
+    requests_sent: int
+    # How many clients were created, once per event loop the pool served.
+    clients_created: int
+
+
+class HttpClientPool:
+    """Lazily creates, shares and closes one pooled httpx client."""
+
+    def __init__(
+        self,
+        max_connections: int = DEFAULT_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        timeout: float = DEFAULT_HTTP_TIMEOUT_SECONDS,
+        http2: bool = False,
+    ) -> None:
+        """Initialize the pool; the client itself is created on first use.
+
+        Args:
+            max_connections: The most connections open at once; further
+                requests wait for one to be free.
+            max_keepalive_connections: The most idle connections kept open.
+            keepalive_expiry: Seconds an idle connection is kept open.
+            timeout: The default timeout of each request, in seconds.
+            http2: Whether to negotiate HTTP/2, which needs the optional `h2`
+                package (`httpx[http2]`); without it HTTP/1.1 is used.
+
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.timeout = timeout
+        self.http2 = http2
+        self._client: httpx.AsyncClient | None = None
+        self._transport: httpx.AsyncHTTPTransport | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._requests_sent = 0
+        self._clients_created = 0
+
+    @classmethod
+    def from_env(cls) -> "HttpClientPool":
+        """Create a pool configured by the HTTP_POOL_* environment variables."""
+        return cls(
+            max_connections=int(
+                os.environ.get(
+                    "HTTP_POOL_MAX_CONNECTIONS", DEFAULT_HTTP_MAX_CONNECTIONS
+                ),
+            ),
+            max_keepalive_connections=int(
+                os.environ.get(
+                    "HTTP_POOL_MAX_KEEPALIVE_CONNECTIONS",
+                    DEFAULT_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                ),
+            ),
+            keepalive_expiry=float(
+                os.environ.get(
+                    "HTTP_POOL_KEEPALIVE_EXPIRY",
+                    DEFAULT_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+                ),
+            ),
+            timeout=float(
+                os.environ.get("HTTP_POOL_TIMEOUT", DEFAULT_HTTP_TIMEOUT_SECONDS),
+            ),
+            http2=os.environ.get("HTTP_POOL_HTTP2", "").lower() in {"1", "true", "yes"},
+        )
+
+    async def _count_request(self, request: httpx.Request) -> None:
+        self._requests_sent += 1
+
+    def _create_transport(self) -> httpx.AsyncHTTPTransport:
+        if self.http2 and importlib.util.find_spec("h2") is None:
+            logger.warning(
+                "HTTP/2 was requested but the 'h2' package is not installed; using HTTP/1.1.",
+            )
+            self.http2 = False
+        if self.http2:
+            return httpx.AsyncHTTPTransport(limits=self.limits, http2=True)
+        return httpx.AsyncHTTPTransport(limits=self.limits)
+
+    def get_client(self) -> httpx.AsyncClient:
+        """Return the shared client, creating it for the running event loop if needed.
+
+        Callers must not close the client; `aclose` closes it for everyone.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            self._close_replaced_client()
+            self._transport = self._create_transport()
+            self._client = httpx.AsyncClient(
+                transport=self._transport,
+                timeout=self.timeout,
+                event_hooks={"request": [self._count_request]},
+            )
+            self._loop = loop
+            self._clients_created += 1
+            logger.info(
+                f"Created pooled HTTP client (max {self.limits.max_connections} connections, "
+                f"{self.limits.max_keepalive_connections} kept alive, HTTP/2 {self.http2})",
+            )
+        return self._client
+
+    def _close_replaced_client(self) -> None:
+        """Close the client being replaced on its own loop, if that loop still runs."""
+        old_client, old_loop = self._client, self._loop
+        if (
+            old_client is None
+            or old_client.is_closed
+            or old_loop is None
+            or old_loop.is_closed()
+            or not old_loop.is_running()
+        ):
+            return
+        asyncio.run_coroutine_threadsafe(old_client.aclose(), old_loop)
+        logger.info("Closing the pooled HTTP client of another event loop.")
+
+    async def aclose(self) -> None:
+        """Close the shared client and its connections, if it is open."""
+        if (
+            self._client is not None
+            and not self._client.is_closed
+            and self._loop is asyncio.get_running_loop()
+        ):
+            await self._client.aclose()
+            logger.info("Pooled HTTP client closed.")
+        self._client = None
+        self._transport = None
+        self._loop = None
+
+    def stats(self) -> HttpPoolStats:
+        """Return the current pool statistics."""
+        connections = []
+        if self._transport is not None and self._client is not None:
+            # httpx does not expose its connection pool other than on the transport.
+            connections = list(getattr(self._transport._pool, "connections", []))
+        idle = sum(1 for connection in connections if connection.is_idle())
+        return HttpPoolStats(
+            http2=self.http2,
+            max_connections=self.limits.max_connections or 0,
+            max_keepalive_connections=self.limits.max_keepalive_connections or 0,
+            connections=len(connections),
+            active_connections=len(connections) - idle,
+            idle_connections=idle,
+            requests_sent=self._requests_sent,
+            clients_created=self._clients_created,
+        )
+
+
+# The process-wide pool used for all A2A calls between the services.
+http_pool = HttpClientPool.from_env()
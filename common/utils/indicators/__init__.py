@@ -0,0 +1,34 @@
+"""Indicator calculation utilities.
+
+Each indicator comes in two forms: a stateful `Rolling*` updater that costs
+O(1) per price, for agents that see one tick at a time, and a vectorized
+`calculate_*_series` function over a whole price array, for the simulator and
+offline analysis. `INDICATORS` pairs the two forms by name.
+"""
+
+from .bollinger import BollingerBands, RollingBollingerBands, calculate_bollinger_series
+from .ema import RollingEMA, calculate_ema_series
+from .macd import MACD, RollingMACD, calculate_macd_series
+from .registry import INDICATORS, IndicatorSpec, StreamingIndicator, get_indicator
+from .rsi import RollingRSI, calculate_rsi_series
+from .sma import RollingSMA, calculate_sma, calculate_sma_series
+
+__all__ = [
+    "INDICATORS",
+    "MACD",
+    "BollingerBands",
+    "IndicatorSpec",
+    "RollingBollingerBands",
+    "RollingEMA",
+    "RollingMACD",
+    "RollingRSI",
+    "RollingSMA",
+    "StreamingIndicator",
+    "calculate_bollinger_series",
+    "calculate_ema_series",
+    "calculate_macd_series",
+    "calculate_rsi_series",
+    "calculate_sma",
+    "calculate_sma_series",
+    "get_indicator",
+]
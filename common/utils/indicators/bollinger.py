@@ -0,0 +1,97 @@
+"""Bollinger Band indicators."""
+
+from typing import Generic, NamedTuple, TypeVar
+
+import numpy as np
+import numpy.typing as npt
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .validation import validate_period
+
+SeriesT = TypeVar("SeriesT", float, npt.NDArray[np.float64])
+
+
+class BollingerBands(NamedTuple, Generic[SeriesT]):
+    """Middle (SMA), upper and lower bands (floats or arrays)."""
+
+    middle: SeriesT
+    upper: SeriesT
+    lower: SeriesT
+
+
+class RollingBollingerBands:
+    """Bollinger Bands updated one price at a time.
+
+    The window mean and sum of squared deviations are maintained with a sliding
+    Welford update, so each price costs O(1) and the variance stays stable.
+    Bands use the population standard deviation of the window.
+    """
+
+    def __init__(self, period: int = 20, num_std: float = 2.0) -> None:
+        """Initialize the rolling Bollinger Bands.
+
+        Args:
+            period: The number of prices in the window (must be > 0).
+            num_std: How many standard deviations the bands sit from the mean.
+
+        """
+        validate_period(period)
+        self.period = period
+        self.num_std = num_std
+        self._window: list[float] = [0.0] * period
+        self._next_index = 0
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self.value: BollingerBands[float] | None = None
+        self.previous: BollingerBands[float] | None = None
+
+    @property
+    def is_ready(self) -> bool:
+        """Return True once the window holds `period` prices."""
+        return self._count == self.period
+
+    def update(self, price: float) -> BollingerBands[float] | None:
+        """Add a price and return the new bands (None during warm-up)."""
+        price = float(price)
+        self.previous = self.value
+        if self.is_ready:
+            evicted = self._window[self._next_index]
+            old_mean = self._mean
+            self._mean += (price - evicted) / self.period
+            self._m2 += (price - evicted) * (price - self._mean + evicted - old_mean)
+        else:
+            self._count += 1
+            delta = price - self._mean
+            self._mean += delta / self._count
+            self._m2 += delta * (price - self._mean)
+        self._window[self._next_index] = price
+        self._next_index = (self._next_index + 1) % self.period
+
+        if self.is_ready:
+            std = max(self._m2 / self.period, 0.0) ** 0.5
+            width = self.num_std * std
+            self.value = BollingerBands(
+                self._mean,
+                self._mean + width,
+                self._mean - width,
+            )
+        return self.value
+
+
+def calculate_bollinger_series(
+    prices: npt.ArrayLike,
+    period: int = 20,
+    num_std: float = 2.0,
+) -> BollingerBands[npt.NDArray[np.float64]]:
+    """Calculate middle, upper and lower Bollinger Band arrays (NaN during warm-up)."""
+    validate_period(period)
+    values = np.asarray(prices, dtype=np.float64)
+    middle = np.full(values.shape, np.nan)
+    std = np.full(values.shape, np.nan)
+    if len(values) >= period:
+        windows = sliding_window_view(values, period)
+        middle[period - 1 :] = windows.mean(axis=-1)
+        std[period - 1 :] = windows.std(axis=-1)
+    width = num_std * std
+    return BollingerBands(middle, middle + width, middle - width)
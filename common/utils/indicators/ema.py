@@ -0,0 +1,79 @@
+"""Exponential Moving Average indicators."""
+
+import numpy as np
+import numpy.typing as npt
+
+from .validation import validate_period
+
+
+def seeded_ewm(
+    values: npt.NDArray[np.float64],
+    period: int,
+    alpha: float,
+) -> npt.NDArray[np.float64]:
+    """Exponentially smooth a series, seeding it with the mean of the first `period` values.
+
+    Entries before index `period - 1` are NaN. The recursion itself runs in
+    pandas' compiled `ewm`, which is imported lazily to keep module import cheap.
+    """
+    result = np.full(values.shape, np.nan)
+    if len(values) < period:
+        return result
+
+    import pandas as pd
+
+    seeded = np.concatenate(([values[:period].mean()], values[period:]))
+    smoothed = pd.Series(seeded).ewm(alpha=alpha, adjust=False).mean()
+    result[period - 1 :] = smoothed.to_numpy()
+    return result
+
+
+class RollingEMA:
+    """Exponential Moving Average updated one price at a time.
+
+    The average is seeded with the SMA of the first `period` prices and then
+    follows the usual `2 / (period + 1)` smoothing.
+    """
+
+    def __init__(self, period: int) -> None:
+        """Initialize the rolling EMA.
+
+        Args:
+            period: The EMA span (must be > 0).
+
+        """
+        validate_period(period)
+        self.period = period
+        self.alpha = 2.0 / (period + 1)
+        self._count = 0
+        self._seed_sum = 0.0
+        self.value: float | None = None
+        self.previous: float | None = None
+
+    @property
+    def is_ready(self) -> bool:
+        """Return True once the EMA has been seeded."""
+        return self.value is not None
+
+    def update(self, price: float) -> float | None:
+        """Add a price and return the new EMA (None during warm-up)."""
+        price = float(price)
+        self.previous = self.value
+        if self.value is None:
+            self._count += 1
+            self._seed_sum += price
+            if self._count == self.period:
+                self.value = self._seed_sum / self.period
+        else:
+            self.value = (1 - self.alpha) * self.value + self.alpha * price
+        return self.value
+
+
+def calculate_ema_series(
+    prices: npt.ArrayLike,
+    period: int,
+) -> npt.NDArray[np.float64]:
+    """Calculate the EMA at every point of a price series (NaN during warm-up)."""
+    validate_period(period)
+    values = np.asarray(prices, dtype=np.float64)
+    return seeded_ewm(values, period, 2.0 / (period + 1))
@@ -0,0 +1,106 @@
+"""Moving Average Convergence Divergence indicators."""
+
+from typing import Generic, NamedTuple, TypeVar
+
+import numpy as np
+import numpy.typing as npt
+
+from .ema import RollingEMA, seeded_ewm
+from .validation import validate_period
+
+SeriesT = TypeVar("SeriesT", float, npt.NDArray[np.float64])
+
+
+class MACD(NamedTuple, Generic[SeriesT]):
+    """MACD line, signal line and histogram (floats or arrays)."""
+
+    macd: SeriesT
+    signal: SeriesT
+    histogram: SeriesT
+
+
+def _validate_macd_periods(
+    fast_period: int,
+    slow_period: int,
+    signal_period: int,
+) -> None:
+    """Raise ValueError unless all periods are positive and fast < slow."""
+    validate_period(fast_period, "fast_period")
+    validate_period(slow_period, "slow_period")
+    validate_period(signal_period, "signal_period")
+    if fast_period >= slow_period:
+        msg = f"MACD fast_period ({fast_period}) must be shorter than slow_period ({slow_period})."
+        raise ValueError(msg)
+
+
+class RollingMACD:
+    """MACD updated one price at a time.
+
+    The value is None until the signal line (an EMA of the MACD line) has been
+    seeded, i.e. for the first `slow_period + signal_period - 2` prices.
+    """
+
+    def __init__(
+        self,
+        fast_period: int = 12,
+        slow_period: int = 26,
+        signal_period: int = 9,
+    ) -> None:
+        """Initialize the rolling MACD.
+
+        Args:
+            fast_period: Span of the fast EMA.
+            slow_period: Span of the slow EMA (must exceed `fast_period`).
+            signal_period: Span of the signal EMA applied to the MACD line.
+
+        """
+        _validate_macd_periods(fast_period, slow_period, signal_period)
+        self._fast = RollingEMA(fast_period)
+        self._slow = RollingEMA(slow_period)
+        self._signal = RollingEMA(signal_period)
+        self.value: MACD[float] | None = None
+        self.previous: MACD[float] | None = None
+
+    @property
+    def is_ready(self) -> bool:
+        """Return True once the signal line is available."""
+        return self.value is not None
+
+    def update(self, price: float) -> MACD[float] | None:
+        """Add a price and return the new MACD values (None during warm-up)."""
+        self.previous = self.value
+        fast = self._fast.update(price)
+        slow = self._slow.update(price)
+        if fast is None or slow is None:
+            return self.value
+        macd_line = fast - slow
+        signal = self._signal.update(macd_line)
+        if signal is not None:
+            self.value = MACD(macd_line, signal, macd_line - signal)
+        return self.value
+
+
+def calculate_macd_series(
+    prices: npt.ArrayLike,
+    fast_period: int = 12,
+    slow_period: int = 26,
+    signal_period: int = 9,
+) -> MACD[npt.NDArray[np.float64]]:
+    """Calculate MACD, signal and histogram arrays for a price series.
+
+    The MACD line is defined from index `slow_period - 1`; the signal line and
+    histogram follow `signal_period - 1` entries later. Earlier entries are NaN.
+    """
+    _validate_macd_periods(fast_period, slow_period, signal_period)
+    values = np.asarray(prices, dtype=np.float64)
+    fast = seeded_ewm(values, fast_period, 2.0 / (fast_period + 1))
+    slow = seeded_ewm(values, slow_period, 2.0 / (slow_period + 1))
+    macd_line = fast - slow
+    signal = np.full(values.shape, np.nan)
+    if len(values) >= slow_period:
+        signal[slow_period - 1 :] = seeded_ewm(
+            macd_line[slow_period - 1 :],
+            signal_period,
+            2.0 / (signal_period + 1),
+        )
+    return MACD(macd_line, signal, macd_line - signal)
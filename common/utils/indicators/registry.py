@@ -0,0 +1,92 @@
+"""Registry pairing each indicator's streaming and batch implementations."""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+from .bollinger import RollingBollingerBands, calculate_bollinger_series
+from .ema import RollingEMA, calculate_ema_series
+from .macd import RollingMACD, calculate_macd_series
+from .rsi import RollingRSI, calculate_rsi_series
+from .sma import RollingSMA, calculate_sma_series
+
+
+class StreamingIndicator(Protocol):
+    """Interface shared by the O(1)-per-tick indicator updaters."""
+
+    value: Any
+    previous: Any
+
+    @property
+    def is_ready(self) -> bool:
+        """Return True once the indicator has produced a value."""
+        ...
+
+    def update(self, price: float) -> Any:
+        """Add a price and return the new value (None during warm-up)."""
+        ...
+
+
+@dataclass(frozen=True)
+class IndicatorSpec:
+    """Describes one indicator in both of its forms.
+
+    Both callables accept the same keyword parameters, so
+    `spec.streaming(**params)` and `spec.batch(prices, **params)` always agree.
+    """
+
+    name: str
+    description: str
+    streaming: Callable[..., StreamingIndicator]
+    batch: Callable[..., Any]
+
+
+INDICATORS: dict[str, IndicatorSpec] = {
+    spec.name: spec
+    for spec in (
+        IndicatorSpec(
+            name="sma",
+            description="Simple Moving Average.",
+            streaming=RollingSMA,
+            batch=calculate_sma_series,
+        ),
+        IndicatorSpec(
+            name="ema",
+            description="Exponential Moving Average seeded with the SMA.",
+            streaming=RollingEMA,
+            batch=calculate_ema_series,
+        ),
+        IndicatorSpec(
+            name="rsi",
+            description="Wilder's Relative Strength Index.",
+            streaming=RollingRSI,
+            batch=calculate_rsi_series,
+        ),
+        IndicatorSpec(
+            name="macd",
+            description="MACD line, signal line and histogram.",
+            streaming=RollingMACD,
+            batch=calculate_macd_series,
+        ),
+        IndicatorSpec(
+            name="bollinger",
+            description="Bollinger Bands around the SMA.",
+            streaming=RollingBollingerBands,
+            batch=calculate_bollinger_series,
+        ),
+    )
+}
+
+
+def get_indicator(name: str) -> IndicatorSpec:
+    """Look up an indicator by name.
+
+    Raises:
+        ValueError: If no indicator is registered under that name.
+
+    """
+    try:
+        return INDICATORS[name.lower()]
+    except KeyError:
+        msg = f"Unknown indicator '{name}'. Available: {', '.join(sorted(INDICATORS))}."
+        raise ValueError(msg) from None
@@ -0,0 +1,92 @@
+"""Relative Strength Index indicators."""
+
+import numpy as np
+import numpy.typing as npt
+
+from .ema import seeded_ewm
+from .validation import validate_period
+
+
+def _rsi_from_averages(avg_gain: float, avg_loss: float) -> float:
+    """Convert average gain and loss into an RSI value in [0, 100]."""
+    if avg_loss == 0:
+        return 100.0 if avg_gain > 0 else 50.0
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+
+class RollingRSI:
+    """Wilder's Relative Strength Index updated one price at a time.
+
+    The first value is available after `period + 1` prices, when the average
+    gain and loss are seeded with simple means; later values use Wilder
+    smoothing (`alpha = 1 / period`).
+    """
+
+    def __init__(self, period: int = 14) -> None:
+        """Initialize the rolling RSI.
+
+        Args:
+            period: The smoothing window (must be > 0).
+
+        """
+        validate_period(period)
+        self.period = period
+        self._last_price: float | None = None
+        self._count = 0
+        self._avg_gain = 0.0
+        self._avg_loss = 0.0
+        self.value: float | None = None
+        self.previous: float | None = None
+
+    @property
+    def is_ready(self) -> bool:
+        """Return True once enough price changes have been seen."""
+        return self.value is not None
+
+    def update(self, price: float) -> float | None:
+        """Add a price and return the new RSI (None during warm-up)."""
+        price = float(price)
+        self.previous = self.value
+        if self._last_price is None:
+            self._last_price = price
+            return self.value
+
+        change = price - self._last_price
+        self._last_price = price
+        gain = max(change, 0.0)
+        loss = max(-change, 0.0)
+        if self._count < self.period:
+            self._count += 1
+            self._avg_gain += gain
+            self._avg_loss += loss
+            if self._count < self.period:
+                return self.value
+            self._avg_gain /= self.period
+            self._avg_loss /= self.period
+        else:
+            alpha = 1.0 / self.period
+            self._avg_gain = (1 - alpha) * self._avg_gain + alpha * gain
+            self._avg_loss = (1 - alpha) * self._avg_loss + alpha * loss
+        self.value = _rsi_from_averages(self._avg_gain, self._avg_loss)
+        return self.value
+
+
+def calculate_rsi_series(
+    prices: npt.ArrayLike,
+    period: int = 14,
+) -> npt.NDArray[np.float64]:
+    """Calculate Wilder's RSI at every point of a price series (NaN during warm-up)."""
+    validate_period(period)
+    values = np.asarray(prices, dtype=np.float64)
+    result = np.full(values.shape, np.nan)
+    if len(values) <= period:
+        return result
+
+    changes = np.diff(values)
+    avg_gain = seeded_ewm(np.clip(changes, 0.0, None), period, 1.0 / period)
+    avg_loss = seeded_ewm(np.clip(-changes, 0.0, None), period, 1.0 / period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    rsi = np.where(avg_loss == 0, np.where(avg_gain > 0, 100.0, 50.0), rsi)
+    result[1:] = np.where(np.isnan(avg_gain), np.nan, rsi)
+    return result
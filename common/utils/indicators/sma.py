@@ -0,0 +1,114 @@
+"""Simple Moving Average indicators."""
+
+import numpy as np
+import numpy.typing as npt
+
+from .validation import validate_period
+
+
+def calculate_sma(prices: list[float], period: int) -> float | None:
+    """Calculate the Simple Moving Average."""
+    if period <= 0:
+        return None
+    price_slice = prices[-period:]
+    if len(prices) < period:
+        return None
+    valid_prices = [float(p) for p in price_slice if isinstance(p, (int, float))]
+    if len(valid_prices) < period:
+        return None
+    return sum(valid_prices) / period
+
+
+def calculate_sma_series(
+    prices: npt.ArrayLike,
+    period: int,
+) -> npt.NDArray[np.float64]:
+    """Calculate the Simple Moving Average at every point of a price series.
+
+    The whole series is processed in one vectorized pass using a cumulative sum,
+    so the cost does not depend on the window length. Entry `i` matches
+    `calculate_sma(prices[: i + 1], period)` to within rounding (a relative
+    error of about 1e-12), not bit for bit, with NaN during the warm-up period.
+    Two-dimensional input is treated as one series per row.
+
+    Raises:
+        ValueError: If `period` is not positive.
+
+    """
+    validate_period(period)
+    values = np.asarray(prices, dtype=np.float64)
+    result = np.full(values.shape, np.nan)
+    if values.ndim == 0 or values.shape[-1] < period:
+        return result
+
+    # Offsetting by the first price keeps the cumulative sum small, which limits
+    # the rounding error picked up over long series.
+    offset = values[..., :1]
+    cumulative = np.cumsum(values - offset, axis=-1)
+    window_sums = cumulative[..., period - 1 :].copy()
+    window_sums[..., 1:] -= cumulative[..., :-period]
+    result[..., period - 1 :] = window_sums / period + offset
+    return result
+
+
+class RollingSMA:
+    """Simple Moving Average maintained incrementally, one price at a time.
+
+    Prices are kept in a fixed-size ring buffer alongside a running sum, so each
+    update costs O(1) regardless of the window length. The running sum uses
+    Neumaier compensated summation so that adding and evicting prices over very
+    long runs does not accumulate floating point drift.
+    """
+
+    def __init__(self, period: int) -> None:
+        """Initialize the rolling SMA.
+
+        Args:
+            period: The number of prices in the averaging window (must be > 0).
+
+        """
+        validate_period(period)
+        self.period = period
+        self._window: list[float] = [0.0] * period
+        self._next_index = 0
+        self._count = 0
+        self._sum = 0.0
+        self._compensation = 0.0
+        self.value: float | None = None
+        self.previous: float | None = None
+
+    def _accumulate(self, amount: float) -> None:
+        """Add an amount to the running sum using Neumaier compensation."""
+        total = self._sum + amount
+        if abs(self._sum) >= abs(amount):
+            self._compensation += (self._sum - total) + amount
+        else:
+            self._compensation += (amount - total) + self._sum
+        self._sum = total
+
+    @property
+    def is_ready(self) -> bool:
+        """Return True once the window holds `period` prices."""
+        return self._count == self.period
+
+    def update(self, price: float) -> float | None:
+        """Add a price to the window and return the new SMA (None during warm-up)."""
+        price = float(price)
+        self.previous = self.value
+        if self.is_ready:
+            self._accumulate(-self._window[self._next_index])
+        else:
+            self._count += 1
+        self._window[self._next_index] = price
+        self._next_index = (self._next_index + 1) % self.period
+        self._accumulate(price)
+        self.value = (
+            (self._sum + self._compensation) / self.period if self.is_ready else None
+        )
+        return self.value
+
+    def extend(self, prices: list[float]) -> float | None:
+        """Feed several prices in order and return the resulting SMA."""
+        for price in prices:
+            self.update(price)
+        return self.value
@@ -0,0 +1,8 @@
+"""Argument checks shared by the indicators."""
+
+
+def validate_period(period: int, name: str = "period") -> None:
+    """Raise ValueError unless the window length is positive."""
+    if period <= 0:
+        msg = f"Indicator {name} must be positive, got {period}."
+        raise ValueError(msg)
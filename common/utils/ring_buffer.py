@@ -0,0 +1,84 @@
+"""Array-backed ring buffer with a contiguous view of its contents."""
+
+from collections.abc import Iterable, Iterator
+from typing import overload
+
+import numpy as np
+import numpy.typing as npt
+
+
+class PriceWindow:
+    """Fixed-size window of the most recent prices, backed by a NumPy array.
+
+    Every price is written twice, at `i` and `i + maxlen` of a `2 * maxlen`
+    array, so the last `maxlen` prices always occupy one contiguous slice.
+    `view()` returns that slice as a read-only array without copying. The view
+    shares memory with the buffer, so it is only valid until the next append;
+    call `tolist()` or `np.array(view)` to keep a snapshot.
+
+    The window behaves like a `deque(maxlen=...)` for `len()`, indexing and
+    iteration, oldest price first.
+    """
+
+    def __init__(self, maxlen: int, prices: Iterable[float] = ()) -> None:
+        """Initialize the window.
+
+        Args:
+            maxlen: The maximum number of prices kept (must be > 0).
+            prices: Optional initial prices, oldest first.
+
+        """
+        if maxlen <= 0:
+            msg = f"Window size must be positive, got {maxlen}."
+            raise ValueError(msg)
+        self.maxlen = maxlen
+        self._buffer = np.zeros(2 * maxlen, dtype=np.float64)
+        self._next_index = 0
+        self._count = 0
+        self.extend(prices)
+
+    def append(self, price: float) -> None:
+        """Add a price, evicting the oldest one once the window is full."""
+        self._buffer[self._next_index] = price
+        self._buffer[self._next_index + self.maxlen] = price
+        self._next_index = (self._next_index + 1) % self.maxlen
+        self._count = min(self._count + 1, self.maxlen)
+
+    def extend(self, prices: Iterable[float]) -> None:
+        """Add several prices, oldest first."""
+        for price in prices:
+            self.append(price)
+
+    def view(self) -> npt.NDArray[np.float64]:
+        """Return the stored prices, oldest first, as a read-only view."""
+        end = self._next_index + self.maxlen
+        window = self._buffer[end - self._count : end]
+        window.flags.writeable = False
+        return window
+
+    def tolist(self) -> list[float]:
+        """Return a copy of the stored prices as a list, oldest first."""
+        return self.view().tolist()
+
+    def __len__(self) -> int:
+        """Return the number of stored prices."""
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> float: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> npt.NDArray[np.float64]: ...
+
+    def __getitem__(
+        self,
+        index: int | slice,
+    ) -> float | npt.NDArray[np.float64]:
+        """Return a price (or a read-only slice), indexed oldest first."""
+        if isinstance(index, slice):
+            return self.view()[index]
+        return float(self.view()[index])
+
+    def __iter__(self) -> Iterator[float]:
+        """Iterate over the stored prices, oldest first."""
+        return iter(self.tolist())
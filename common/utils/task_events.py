@@ -0,0 +1,82 @@
+"""Helpers for the events the A2A executors publish for a request.
+
+By default an executor answers in task mode: a submitted `Task`, a working
+status update, the result artifact and a completed status, each serialized
+and sent to the client. For requests that finish in well under a second that
+ceremony costs more than the work, so in fast response mode
+(`A2A_FAST_RESPONSE`) the executors reply with a single terminal event: an
+agent `Message` carrying the result, or a failed `Task` carrying the error.
+Clients already accept both, as the A2A protocol allows either as a reply.
+"""
+
+import os
+import uuid
+from typing import Any
+
+from a2a.helpers import new_data_part
+from a2a.server.agent_execution import RequestContext
+from a2a.server.events import EventQueue
+from a2a.server.tasks.task_updater import TaskUpdater
+from a2a.types import Message, Part, Role, Task, TaskState, TaskStatus
+
+from common.config import DEFAULT_A2A_FAST_RESPONSE
+
+
+def fast_response_enabled() -> bool:
+    """Return whether the A2A_FAST_RESPONSE environment variable enables fast mode."""
+    value = os.environ.get("A2A_FAST_RESPONSE")
+    if value is None:
+        return DEFAULT_A2A_FAST_RESPONSE
+    return value.lower() in {"1", "true", "yes"}
+
+
+async def start_task(
+    context: RequestContext,
+    event_queue: EventQueue,
+    updater: TaskUpdater,
+    status_text: str,
+) -> None:
+    """Publish the submitted task and a working status update for a request."""
+    await event_queue.enqueue_event(
+        Task(
+            id=context.task_id or "",
+            context_id=context.context_id or "",
+            status=TaskStatus(state=TaskState.TASK_STATE_SUBMITTED),
+            history=[context.message] if context.message else [],
+        ),
+    )
+    await updater.start_work(
+        message=updater.new_agent_message(parts=[Part(text=status_text)]),
+    )
+
+
+def result_message(context_id: str, result: dict[str, Any]) -> Message:
+    """Return the agent message answering a request with `result` as a DataPart."""
+    return Message(
+        message_id=uuid.uuid4().hex,
+        role=Role.ROLE_AGENT,
+        parts=[new_data_part(result)],
+        context_id=context_id,
+    )
+
+
+async def fail_task(
+    context: RequestContext,
+    event_queue: EventQueue,
+    updater: TaskUpdater,
+    error_text: str,
+    task_started: bool,
+) -> None:
+    """Report a failed request, as a status update or, before any task, a failed task."""
+    error_msg = updater.new_agent_message(parts=[Part(text=error_text)])
+    if task_started:
+        await updater.failed(message=error_msg)
+        return
+    await event_queue.enqueue_event(
+        Task(
+            id=context.task_id or "",
+            context_id=context.context_id or "",
+            status=TaskStatus(state=TaskState.TASK_STATE_FAILED, message=error_msg),
+            history=[context.message] if context.message else [],
+        ),
+    )
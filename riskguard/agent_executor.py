@@ -8,11 +8,17 @@ from a2a.helpers import get_data_parts, new_data_part
 from a2a.server.agent_execution import AgentExecutor, RequestContext
 from a2a.server.events import EventQueue
 from a2a.server.tasks.task_updater import TaskUpdater
-from a2a.types import Part, Task, TaskState, TaskStatus
 from google.adk import Runner
 from google.adk.sessions import InMemorySessionService, Session
 from google.genai import types as genai_types
 
+from common.utils.task_events import (
+    fail_task,
+    fast_response_enabled,
+    result_message,
+    start_task,
+)
+
 from .agent import root_agent as riskguard_adk_agent
 
 logger = logging.getLogger(__name__)
@@ -21,8 +27,17 @@ logger = logging.getLogger(__name__)
 class RiskGuardAgentExecutor(AgentExecutor):
     """Executes the RiskGuard ADK agent logic in response to A2A requests."""
 
-    def __init__(self) -> None:
-        """Initialize the RiskGuardAgentExecutor."""
+    def __init__(self, fast_response: bool | None = None) -> None:
+        """Initialize the RiskGuardAgentExecutor.
+
+        Args:
+            fast_response: Whether to answer with a single message instead of
+                a task's events; defaults to the A2A_FAST_RESPONSE setting.
+
+        """
+        self.fast_response = (
+            fast_response_enabled() if fast_response is None else fast_response
+        )
         self._adk_agent = riskguard_adk_agent
         self._adk_runner = Runner(
             app_name="riskguard_adk_runner",
@@ -30,12 +45,15 @@ class RiskGuardAgentExecutor(AgentExecutor):
             session_service=InMemorySessionService(),
             # Other services like memory and artifact can be added if needed by the ADK agent
         )
-        logger.info("RiskGuardAgentExecutor initialized with ADK Runner.")
+        logger.info(
+            f"RiskGuardAgentExecutor initialized with ADK Runner (fast response: {self.fast_response}).",
+        )
 
     async def execute(self, context: RequestContext, event_queue: EventQueue) -> None:
         """Receive a trade proposal and run it through the ADK agent.
 
-        The result is immediately returned in a single Message event.
+        The result is returned as the "response" artifact of a task or, in
+        fast response mode, in a single Message event.
         """
         if not context.context_id:
             msg = "Context ID is missing, cannot execute."
@@ -46,23 +64,16 @@ class RiskGuardAgentExecutor(AgentExecutor):
             task_id=context.task_id or "",
             context_id=context.context_id,
         )
+        task_started = False
         try:
-            # Enqueue the initial Task object to start task mode
-            await event_queue.enqueue_event(
-                Task(
-                    id=context.task_id or "",
-                    context_id=context.context_id or "",
-                    status=TaskStatus(state=TaskState.TASK_STATE_SUBMITTED),
-                    history=[context.message] if context.message else [],
-                ),
-            )
-
-            # Set task state to WORKING
-            await updater.start_work(
-                message=updater.new_agent_message(
-                    parts=[Part(text="Checking trade risk...")],
-                ),
-            )
+            if not self.fast_response:
+                await start_task(
+                    context,
+                    event_queue,
+                    updater,
+                    "Checking trade risk...",
+                )
+                task_started = True
 
             agent_input_data = None
             if context.message and context.message.parts:
@@ -167,6 +178,12 @@ class RiskGuardAgentExecutor(AgentExecutor):
                             risk_result_dict = response_data
                             break
 
+            if self.fast_response:
+                await event_queue.enqueue_event(
+                    result_message(context.context_id, risk_result_dict),
+                )
+                return
+
             # Save the result as artifact
             await updater.add_artifact(
                 parts=[new_data_part(risk_result_dict)],
@@ -197,8 +214,13 @@ class RiskGuardAgentExecutor(AgentExecutor):
                 error_text = "An unexpected server error occurred."
             # Create an error message to send back
             try:
-                error_msg = updater.new_agent_message(parts=[Part(text=error_text)])
-                await updater.failed(message=error_msg)
+                await fail_task(
+                    context,
+                    event_queue,
+                    updater,
+                    error_text,
+                    task_started,
+                )
             except Exception:
                 logger.exception("Failed to publish failure update")
 
@@ -2,6 +2,9 @@
 
 import logging
 
+import numpy as np
+import numpy.typing as npt
+
 # Import defaults from the common config
 from common.config import (
     DEFAULT_RISKGUARD_MAX_CONCENTRATION,
@@ -139,3 +142,62 @@ def check_trade_risk_logic(
     # If all checks passed for the given action
     logger.info("APPROVED - Trade adheres to risk rules.")
     return RiskCheckResult(approved=True, reason="Trade adheres to risk rules.")
+
+
+def check_trade_risk_vectorized(
+    is_buy: npt.ArrayLike,
+    quantity: npt.ArrayLike,
+    price: npt.ArrayLike,
+    cash: npt.ArrayLike,
+    shares: npt.ArrayLike,
+    total_value: npt.ArrayLike,
+    max_pos_size: float = DEFAULT_RISKGUARD_MAX_POS_SIZE,
+    max_concentration: float = DEFAULT_RISKGUARD_MAX_CONCENTRATION,
+) -> npt.NDArray[np.bool_]:
+    """Apply the `check_trade_risk_logic` rules to many proposals at once.
+
+    Every argument is broadcast elementwise, so one call can check the trades
+    of a whole ensemble of portfolios. Only the approval flag is returned; use
+    `check_trade_risk_logic` when the rejection reason is needed.
+
+    Args:
+        is_buy: True for BUY proposals, False for SELL proposals.
+        quantity: The proposed trade quantities.
+        price: The proposed trade prices.
+        cash: The portfolio cash before each trade.
+        shares: The shares held before each trade.
+        total_value: The portfolio total value before each trade.
+        max_pos_size: The maximum position size for a single trade.
+        max_concentration: The maximum portfolio concentration.
+
+    Returns:
+        A boolean array that is True where the trade would be approved.
+
+    """
+    is_buy = np.asarray(is_buy, dtype=bool)
+    quantity = np.asarray(quantity, dtype=np.float64)
+    price = np.asarray(price, dtype=np.float64)
+    cash = np.asarray(cash, dtype=np.float64)
+    shares = np.asarray(shares, dtype=np.float64)
+    total_value = np.asarray(total_value, dtype=np.float64)
+
+    trade_value = quantity * price
+    valid = (quantity > 0) & (price > 0) & (total_value > 0)
+    within_pos_size = trade_value <= max_pos_size
+
+    # BUY: sufficient cash, then post-trade concentration.
+    holdings_after_buy = (shares + quantity) * price
+    total_after_buy = cash - trade_value + holdings_after_buy
+    total_after_buy = np.where(total_after_buy <= 0, total_value, total_after_buy)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        concentration = np.where(
+            total_after_buy > 0,
+            holdings_after_buy / total_after_buy,
+            1.0,
+        )
+    buy_ok = (trade_value <= cash) & (concentration <= max_concentration)
+
+    # SELL: sufficient shares.
+    sell_ok = quantity <= shares
+
+    return valid & within_pos_size & np.where(is_buy, buy_ok, sell_ok)
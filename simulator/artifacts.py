@@ -0,0 +1,88 @@
+"""Deferred, cached rendering of a run's chart, detailed log and exports.
+
+Serializing a run's Plotly figure, formatting its detailed log and writing
+its export tables are the slowest parts of returning its results, and the
+page does not need any of them to show the metrics and trade signals. A run can instead register builders
+for them with `RunArtifactStore`; the page fetches each artifact from its
+own endpoint when it is shown, the artifact is built then (off the event
+loop), and the result is kept for later views.
+"""
+
+import asyncio
+import logging
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+
+logger = logging.getLogger(__name__)
+
+
+class _Artifact:
+    """An artifact's builder until it is first requested, then its content."""
+
+    def __init__(self, build: Callable[[], str | bytes]) -> None:
+        self.build: Callable[[], str | bytes] | None = build
+        self.content: str | bytes | None = None
+        self.lock = asyncio.Lock()
+
+
+class RunArtifactStore:
+    """A bounded store of artifact builders and built artifacts, by run ID."""
+
+    def __init__(self, max_runs: int) -> None:
+        """Initialize the store.
+
+        Args:
+            max_runs: The number of runs kept; the least recently used run is
+                dropped when a new one is added to a full store.
+
+        """
+        self.max_runs = max_runs
+        self._runs: OrderedDict[str, dict[str, _Artifact]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of runs held."""
+        return len(self._runs)
+
+    def add(self, builders: Mapping[str, Callable[[], str | bytes]]) -> str:
+        """Register a run's artifact builders and return the run's ID.
+
+        Args:
+            builders: Functions returning each artifact, by name. Each is
+                called at most once, in a worker thread.
+
+        """
+        run_id = uuid.uuid4().hex
+        self._runs[run_id] = {
+            name: _Artifact(build) for name, build in builders.items()
+        }
+        while len(self._runs) > self.max_runs:
+            self._runs.popitem(last=False)
+        return run_id
+
+    def touch(self, run_id: str) -> bool:
+        """Mark a run as recently used, returning False if it was dropped."""
+        if run_id not in self._runs:
+            return False
+        self._runs.move_to_end(run_id)
+        return True
+
+    async def get(self, run_id: str, name: str) -> str | bytes | None:
+        """Return a run's artifact, building it on first request.
+
+        Returns:
+            The artifact, or None if the run or artifact is unknown or the
+            run was dropped.
+
+        """
+        artifact = self._runs.get(run_id, {}).get(name)
+        if artifact is None:
+            return None
+        self._runs.move_to_end(run_id)
+        async with artifact.lock:
+            if artifact.content is None and artifact.build is not None:
+                logger.info(f"Building {name} for run {run_id}")
+                artifact.content = await asyncio.to_thread(artifact.build)
+                # The builder holds the run's results; it is not needed again.
+                artifact.build = None
+        return artifact.content
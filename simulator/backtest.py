@@ -0,0 +1,213 @@
+"""Vectorized SMA-crossover backtests over one or many price paths.
+
+Reproduces the decisions AlphaBot and RiskGuard make over A2A, one simulated
+day at a time, but for a whole batch of paths at once: indicators are
+computed for every path and day up front, and the remaining day loop only
+carries the per-path portfolio and session state as NumPy arrays.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+from common.utils.indicators import calculate_sma_series
+
+ACTION_NONE = 0
+ACTION_BUY = 1
+ACTION_SELL = 2
+
+
+@dataclass
+class VectorizedBacktestResult:
+    """Per-path, per-day outcome of a vectorized backtest.
+
+    Daily arrays have shape `(num_paths, num_days)` and hold the start-of-day
+    portfolio, matching the simulator's results frame. `actions` holds the
+    proposed action code for each day (`ACTION_NONE` when AlphaBot would not
+    propose a trade) and `approved` whether RiskGuard approved it.
+    """
+
+    prices: npt.NDArray[np.float64]
+    cash: npt.NDArray[np.float64]
+    shares: npt.NDArray[np.int64]
+    total_value: npt.NDArray[np.float64]
+    actions: npt.NDArray[np.int8]
+    approved: npt.NDArray[np.bool_]
+    initial_cash: float
+    final_cash: npt.NDArray[np.float64]
+    final_shares: npt.NDArray[np.int64]
+    final_value: npt.NDArray[np.float64]
+
+    @property
+    def trade_count(self) -> npt.NDArray[np.int64]:
+        """Return the number of approved trades on each path."""
+        return self.approved.sum(axis=-1)
+
+    @property
+    def max_drawdown(self) -> npt.NDArray[np.float64]:
+        """Return each path's largest peak-to-trough fall in total value, as a fraction."""
+        return calculate_max_drawdown(
+            np.concatenate(
+                (
+                    np.full((len(self.final_value), 1), self.initial_cash),
+                    self.total_value,
+                    self.final_value[:, np.newaxis],
+                ),
+                axis=-1,
+            ),
+        )
+
+
+def calculate_max_drawdown(values: npt.ArrayLike) -> npt.NDArray[np.float64]:
+    """Return the largest peak-to-trough fall along the last axis, as a fraction.
+
+    Args:
+        values: Portfolio values in time order, one series per row.
+
+    Returns:
+        The maximum drawdown of each series (a 0-d array for a 1-D input).
+
+    """
+    series = np.asarray(values, dtype=np.float64)
+    peaks = np.maximum.accumulate(series, axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        drawdowns = np.where(peaks > 0, (peaks - series) / peaks, 0.0)
+    return drawdowns.max(axis=-1)
+
+
+def run_sma_crossover_backtest(
+    prices: npt.ArrayLike,
+    initial_price: float | npt.ArrayLike,
+    short_period: int,
+    long_period: int,
+    trade_quantity: int,
+    initial_cash: float,
+    max_pos_size: float,
+    max_concentration: float,
+) -> VectorizedBacktestResult:
+    """Backtest AlphaBot's SMA-crossover strategy with RiskGuard's rules.
+
+    Each day follows the A2A path: the start-of-day portfolio is valued at the
+    day's price, a crossover of the short and long SMAs produces a signal, the
+    signal becomes a proposal unless the position already matches it (or it
+    repeats the last rejected proposal), and approved proposals are executed.
+
+    Args:
+        prices: Daily prices of shape `(num_days,)` or `(num_paths, num_days)`,
+            excluding the initial price.
+        initial_price: The price before the first day, shared or one per path.
+        short_period: The short SMA window.
+        long_period: The long SMA window.
+        trade_quantity: The number of shares per trade.
+        initial_cash: The starting cash of every path.
+        max_pos_size: RiskGuard's maximum position size per trade.
+        max_concentration: RiskGuard's maximum concentration, as a fraction.
+
+    Returns:
+        A VectorizedBacktestResult with a leading path axis, even for one path.
+
+    """
+    # RiskGuard's package loads its agent, so the rules are imported on first use.
+    from riskguard.rules import check_trade_risk_vectorized
+
+    daily_prices = np.atleast_2d(np.asarray(prices, dtype=np.float64))
+    num_paths, num_days = daily_prices.shape
+    start = np.broadcast_to(np.asarray(initial_price, dtype=np.float64), (num_paths,))
+    history = np.concatenate((start[:, np.newaxis], daily_prices), axis=-1)
+
+    # Column t holds the SMAs as seen on day t (column 0 is the initial price).
+    sma_short = calculate_sma_series(history, short_period)
+    sma_long = calculate_sma_series(history, long_period)
+    prev_short, prev_long = sma_short[:, :-1], sma_long[:, :-1]
+    curr_short, curr_long = sma_short[:, 1:], sma_long[:, 1:]
+    # NaN (not enough history) compares False, so it never signals.
+    buy_signals = (prev_short <= prev_long) & (curr_short > curr_long)
+    sell_signals = (prev_short >= prev_long) & (curr_short < curr_long) & ~buy_signals
+
+    cash = np.full(num_paths, float(initial_cash))
+    shares = np.zeros(num_paths, dtype=np.int64)
+    should_be_long = np.zeros(num_paths, dtype=bool)
+    rejected_action = np.full(num_paths, ACTION_NONE, dtype=np.int8)
+    rejected_price = np.full(num_paths, np.nan)
+
+    daily_cash = np.empty((num_paths, num_days))
+    daily_shares = np.empty((num_paths, num_days), dtype=np.int64)
+    actions = np.zeros((num_paths, num_days), dtype=np.int8)
+    approved = np.zeros((num_paths, num_days), dtype=bool)
+
+    # The portfolio and session state only change on days with a signal, so the
+    # loop visits those days and fills the quiet stretches in between by slice.
+    signal_days = np.flatnonzero((buy_signals | sell_signals).any(axis=0))
+    filled_until = 0
+    for day in signal_days:
+        daily_cash[:, filled_until : day + 1] = cash[:, np.newaxis]
+        daily_shares[:, filled_until : day + 1] = shares[:, np.newaxis]
+        filled_until = day + 1
+
+        price = daily_prices[:, day]
+        total_value = cash + shares * price
+        buy, sell = buy_signals[:, day], sell_signals[:, day]
+        # AlphaBot drops a stale long flag instead of proposing a SELL.
+        corrected = sell & should_be_long & (shares == 0)
+        should_be_long &= ~corrected
+        propose_buy = buy & ~should_be_long
+        propose_sell = sell & should_be_long & ~corrected & (trade_quantity <= shares)
+        action = np.where(
+            propose_buy,
+            ACTION_BUY,
+            np.where(propose_sell, ACTION_SELL, ACTION_NONE),
+        ).astype(np.int8)
+        repeats_rejection = (action == rejected_action) & (price == rejected_price)
+        action[repeats_rejection] = ACTION_NONE
+        proposed = action != ACTION_NONE
+        if not proposed.any():
+            continue
+
+        day_approved = proposed & check_trade_risk_vectorized(
+            action == ACTION_BUY,
+            trade_quantity,
+            price,
+            cash,
+            shares,
+            total_value,
+            max_pos_size=max_pos_size,
+            max_concentration=max_concentration,
+        )
+        day_rejected = proposed & ~day_approved
+        rejected_action[day_rejected] = action[day_rejected]
+        rejected_price[day_rejected] = price[day_rejected]
+
+        trade_value = trade_quantity * price
+        bought = day_approved & (action == ACTION_BUY) & (trade_value <= cash)
+        sold = day_approved & (action == ACTION_SELL) & (trade_quantity <= shares)
+        cash = (
+            cash - np.where(bought, trade_value, 0.0) + np.where(sold, trade_value, 0.0)
+        )
+        shares = (
+            shares
+            + np.where(bought, trade_quantity, 0)
+            - np.where(sold, trade_quantity, 0)
+        )
+        should_be_long = np.where(day_approved, action == ACTION_BUY, should_be_long)
+
+        actions[:, day] = action
+        approved[:, day] = day_approved
+
+    daily_cash[:, filled_until:] = cash[:, np.newaxis]
+    daily_shares[:, filled_until:] = shares[:, np.newaxis]
+    daily_total = daily_cash + daily_shares * daily_prices
+
+    last_price = daily_prices[:, -1] if num_days else start
+    return VectorizedBacktestResult(
+        prices=daily_prices,
+        cash=daily_cash,
+        shares=daily_shares,
+        total_value=daily_total,
+        actions=actions,
+        approved=approved,
+        initial_cash=float(initial_cash),
+        final_cash=cash,
+        final_shares=shares,
+        final_value=cash + shares * last_price,
+    )
@@ -0,0 +1,79 @@
+"""Process-pool execution for batches of independent simulation runs.
+
+A run's CPU work (building the results frame, serializing the chart,
+formatting logs) happens on whichever event loop runs it, so large batches
+run on the web server's loop would block it and use a single core.
+`SimulationProcessPool` runs each job to completion in a worker process
+instead; workers send back only the compact part of the results.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Result keys worth sending back across the process boundary. The logs are
+# the bulk of a run's output and are only needed when a run is rendered.
+COMPACT_RESULT_KEYS = ("success", "error", "final_portfolio", "metrics", "charts")
+
+
+def compact_simulation_results(results: dict[str, Any]) -> dict[str, Any]:
+    """Return the results without the signals and detailed logs."""
+    return {key: results[key] for key in COMPACT_RESULT_KEYS if key in results}
+
+
+class SimulationProcessPool:
+    """A lazily started process pool for simulation jobs.
+
+    Workers are started with the "spawn" method, which is safe to use from a
+    process that already runs an event loop and threads, and the pool is
+    only created on first use so processes that never run a batch pay
+    nothing for it.
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        """Initialize the pool.
+
+        Args:
+            max_workers: The number of worker processes; defaults to the
+                `SIMULATION_PROCESS_WORKERS` environment variable, or the
+                number of CPUs.
+
+        """
+        if max_workers is None and os.environ.get("SIMULATION_PROCESS_WORKERS"):
+            max_workers = int(os.environ["SIMULATION_PROCESS_WORKERS"])
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._executor: ProcessPoolExecutor | None = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            logger.info(
+                f"Starting simulation process pool with {self.max_workers} workers",
+            )
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run `fn(*args)` in a worker process and await its result.
+
+        `fn` and its arguments must be picklable, so `fn` has to be a
+        module-level function.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), fn, *args)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, cancelling jobs that have not started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,119 @@
+"""In-memory cache for the results of deterministic simulation runs.
+
+Entries are evicted least recently used first once the cache is full, and
+expire after a fixed time to live. Callers asking for a key whose run is
+still in progress await that run instead of starting another one.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class SimulationResultCache:
+    """An LRU/TTL cache of simulation results with in-flight de-duplication."""
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+        is_valid: Callable[[dict[str, Any]], bool] | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: The number of results kept; 0 disables caching (runs
+                in flight are still shared).
+            ttl_seconds: How long a result is served after it was produced.
+            clock: Returns the current time in seconds.
+            is_valid: Returns whether cached results can still be served, for
+                results that depend on something that can go away first;
+                results it rejects are dropped as if expired.
+
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._is_valid = is_valid
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._in_flight: dict[str, asyncio.Task[dict[str, Any]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached results, including expired ones."""
+        return len(self._entries)
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached results for a key, or None if missing, expired or invalid."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, results = entry
+        if self._clock() >= expires_at or (
+            self._is_valid is not None and not self._is_valid(results)
+        ):
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return results
+
+    def put(self, key: str, results: dict[str, Any]) -> None:
+        """Cache results, evicting the least recently used entry when full."""
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = (self._clock() + self.ttl_seconds, results)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_or_run(
+        self,
+        key: str,
+        run: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        """Return the cached results for a key, running `run()` on a miss.
+
+        Concurrent calls for the same key share one run. The run is shielded,
+        so a caller that goes away does not cancel it for the others. Only
+        successful results without failed days are cached, so a transient
+        agent outage is not served until the entry expires.
+
+        Args:
+            key: The canonical key of the run.
+            run: Produces the results dict.
+
+        Returns:
+            The results dict, shared between all callers for the key.
+
+        """
+        results = self.get(key)
+        if results is not None:
+            self.hits += 1
+            logger.info(f"Serving cached simulation results for {key[:12]}")
+            return results
+
+        task = self._in_flight.get(key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.ensure_future(run())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self.hits += 1
+            logger.info(f"Joining in-flight simulation run for {key[:12]}")
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Task[dict[str, Any]]) -> None:
+        self._in_flight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        results = task.result()
+        if results.get("success") and not results.get("day_errors"):
+            self.put(key, results)
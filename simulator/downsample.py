@@ -0,0 +1,62 @@
+"""Downsampling of long daily series for charting.
+
+A chart a few thousand pixels wide cannot show more than a few thousand
+points per line, but sending every day of a long run makes the page large
+and slow to render. `min_max_downsample_indices` picks the points to draw:
+the series is split into equal buckets and each bucket keeps its lowest and
+highest point, so every peak and trough survives (which plain striding or
+LTTB's one point per bucket do not guarantee), plus the endpoints and any
+days the caller must keep, such as trade days.
+"""
+
+import numpy as np
+import numpy.typing as npt
+
+
+def min_max_downsample_indices(
+    values: npt.ArrayLike,
+    max_points: int,
+    keep: npt.ArrayLike = (),
+) -> npt.NDArray[np.intp]:
+    """Return the sorted indices of the points to draw for a series.
+
+    NaN values (e.g. an SMA's warm-up) are never selected unless they are an
+    endpoint or kept, so gaps in a line stay gaps.
+
+    Args:
+        values: The series, in x order.
+        max_points: The target number of points, excluding the kept ones
+            (at least 4: both endpoints and one bucket).
+        keep: Indices that are always included.
+
+    Returns:
+        Every index when the series already fits in `max_points`, otherwise
+        at most `max_points` indices plus those in `keep`.
+
+    Raises:
+        ValueError: If `max_points` is less than 4.
+
+    """
+    if max_points < 4:
+        msg = f"Downsampling needs at least 4 points, got {max_points}."
+        raise ValueError(msg)
+    series = np.asarray(values, dtype=np.float64)
+    num_points = len(series)
+    if num_points <= max_points:
+        return np.arange(num_points)
+
+    # The endpoints are kept; the interior is split into buckets of two points.
+    num_buckets = (max_points - 2) // 2
+    interior = series[1:-1]
+    bounds = np.linspace(0, len(interior), num_buckets + 1).astype(np.intp)
+    offsets = bounds[:-1]
+    bucket_of = np.repeat(np.arange(num_buckets), np.diff(bounds))
+    selected = [np.array([0, num_points - 1]), np.asarray(keep, dtype=np.intp)]
+    with np.errstate(invalid="ignore"):
+        for reduce in (np.fmin, np.fmax):
+            extremes = reduce.reduceat(interior, offsets)
+            hits = np.flatnonzero(interior == extremes[bucket_of])
+            # The first hit in each bucket; all-NaN buckets have none.
+            _, first = np.unique(bucket_of[hits], return_index=True)
+            selected.append(hits[first] + 1)
+    return np.unique(np.concatenate(selected))
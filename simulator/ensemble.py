@@ -0,0 +1,157 @@
+"""Monte Carlo ensemble backtests for judging strategy robustness.
+
+Generates many price paths from the market simulator parameters, runs the
+vectorized SMA-crossover backtest over all of them at once and summarizes
+the resulting distributions with bootstrap confidence intervals.
+"""
+
+import logging
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+from pydantic import BaseModel
+
+from common.config import (
+    DEFAULT_ENSEMBLE_BOOTSTRAP_SAMPLES,
+    DEFAULT_ENSEMBLE_CONFIDENCE_LEVEL,
+)
+
+from .backtest import run_sma_crossover_backtest
+from .market import simulate_price_paths
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_PERCENTILES = (5, 25, 50, 75, 95)
+
+
+class MetricDistribution(BaseModel):
+    """Summary of one metric across all ensemble paths."""
+
+    mean: float
+    std: float
+    min: float
+    max: float
+    percentiles: dict[str, float]
+    mean_ci: tuple[float, float]
+    median_ci: tuple[float, float]
+
+
+class EnsembleSummary(BaseModel):
+    """Distributions of the key outcomes of a Monte Carlo ensemble run."""
+
+    num_paths: int
+    sim_days: int
+    seed: int | None
+    confidence_level: float
+    final_value: MetricDistribution
+    max_drawdown: MetricDistribution
+    trade_count: MetricDistribution
+
+
+def summarize_metric(
+    values: npt.ArrayLike,
+    rng: np.random.Generator,
+    num_bootstrap: int = DEFAULT_ENSEMBLE_BOOTSTRAP_SAMPLES,
+    confidence_level: float = DEFAULT_ENSEMBLE_CONFIDENCE_LEVEL,
+) -> MetricDistribution:
+    """Summarize a metric with percentiles and bootstrap confidence intervals.
+
+    The intervals are percentile bootstrap intervals: all resamples are drawn
+    as one `(num_bootstrap, num_paths)` index matrix.
+
+    Args:
+        values: One value per path.
+        rng: The generator used to draw the bootstrap resamples.
+        num_bootstrap: The number of bootstrap resamples.
+        confidence_level: The coverage of the intervals, between 0 and 1.
+
+    Returns:
+        A MetricDistribution for the values.
+
+    """
+    samples = np.asarray(values, dtype=np.float64)
+    resamples = samples[
+        rng.integers(0, len(samples), size=(num_bootstrap, len(samples)))
+    ]
+    tail = (1.0 - confidence_level) / 2 * 100
+    bounds = (tail, 100 - tail)
+    mean_low, mean_high = np.percentile(resamples.mean(axis=1), bounds)
+    median_low, median_high = np.percentile(np.median(resamples, axis=1), bounds)
+    return MetricDistribution(
+        mean=float(samples.mean()),
+        std=float(samples.std()),
+        min=float(samples.min()),
+        max=float(samples.max()),
+        percentiles={
+            f"p{q}": float(v)
+            for q, v in zip(
+                SUMMARY_PERCENTILES,
+                np.percentile(samples, SUMMARY_PERCENTILES),
+                strict=True,
+            )
+        },
+        mean_ci=(float(mean_low), float(mean_high)),
+        median_ci=(float(median_low), float(median_high)),
+    )
+
+
+def run_monte_carlo_ensemble(
+    params: dict[str, Any],
+    num_paths: int,
+    seed: int | None = None,
+    num_bootstrap: int = DEFAULT_ENSEMBLE_BOOTSTRAP_SAMPLES,
+    confidence_level: float = DEFAULT_ENSEMBLE_CONFIDENCE_LEVEL,
+) -> EnsembleSummary:
+    """Run the SMA-crossover strategy over `num_paths` simulated price paths.
+
+    Args:
+        params: Simulation parameters, as produced by `SimulationRunParams.to_dict()`.
+        num_paths: The number of independent price paths to simulate.
+        seed: Seed for the paths and bootstrap resamples; None for a random run.
+        num_bootstrap: The number of bootstrap resamples per metric.
+        confidence_level: The coverage of the bootstrap intervals.
+
+    Returns:
+        An EnsembleSummary of final value, max drawdown and trade count.
+
+    """
+    rng = np.random.default_rng(seed)
+    sim_days = params["sim_days"]
+    logger.info(f"Running Monte Carlo ensemble: {num_paths} paths x {sim_days} days")
+
+    paths = simulate_price_paths(
+        params["sim_initial_price"],
+        params["sim_volatility"],
+        params["sim_trend"],
+        sim_days,
+        rng,
+        num_paths=num_paths,
+    )
+    result = run_sma_crossover_backtest(
+        paths,
+        initial_price=params["sim_initial_price"],
+        short_period=params["alphabot_short_sma"],
+        long_period=params["alphabot_long_sma"],
+        trade_quantity=params["alphabot_trade_qty"],
+        initial_cash=params["sim_initial_cash"],
+        max_pos_size=params["riskguard_max_pos_size"],
+        # The form takes concentration as a percentage, RiskGuard as a fraction.
+        max_concentration=params["riskguard_max_concentration"] / 100.0,
+    )
+
+    return EnsembleSummary(
+        num_paths=num_paths,
+        sim_days=sim_days,
+        seed=seed,
+        confidence_level=confidence_level,
+        final_value=summarize_metric(
+            result.final_value, rng, num_bootstrap, confidence_level
+        ),
+        max_drawdown=summarize_metric(
+            result.max_drawdown, rng, num_bootstrap, confidence_level
+        ),
+        trade_count=summarize_metric(
+            result.trade_count, rng, num_bootstrap, confidence_level
+        ),
+    )
@@ -0,0 +1,77 @@
+"""Columnar export of a run's daily results and trade events.
+
+Analysts load runs into notebooks, so a run's results are also offered as
+Arrow tables instead of only as rendered HTML and text logs: the daily
+results frame, and one row per trade proposal with RiskGuard's decision.
+Either table is written as an Arrow IPC stream (`pyarrow.ipc.open_stream`,
+`pandas.read_feather` does not read streams) or as a Parquet file.
+"""
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+    from .recorder import TradeEvent
+
+ExportTable = Literal["daily", "trades"]
+ExportFormat = Literal["arrow", "parquet"]
+
+# Media type and file extension of each export format.
+EXPORT_FORMATS: dict[ExportFormat, tuple[str, str]] = {
+    "arrow": ("application/vnd.apache.arrow.stream", "arrows"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+
+def daily_results_table(results_df: "pd.DataFrame") -> "pa.Table":
+    """Return the daily results frame as a table, with Day as its first column."""
+    import pyarrow as pa
+
+    return pa.Table.from_pandas(results_df, preserve_index=True).select(
+        ["Day", *results_df.columns],
+    )
+
+
+def trade_events_table(events: Sequence["TradeEvent"]) -> "pa.Table":
+    """Return one row per trade proposal, in day order."""
+    import pyarrow as pa
+
+    schema = pa.schema(
+        [
+            ("day", pa.int64()),
+            ("action", pa.string()),
+            ("quantity", pa.int64()),
+            ("price", pa.float64()),
+            ("approved", pa.bool_()),
+            ("reason", pa.string()),
+        ],
+    )
+    return pa.Table.from_pydict(
+        {
+            "day": [event.day for event in events],
+            "action": [event.action for event in events],
+            "quantity": [event.quantity for event in events],
+            "price": [event.price for event in events],
+            "approved": [event.approved for event in events],
+            "reason": [event.reason for event in events],
+        },
+        schema=schema,
+    )
+
+
+def serialize_table(table: "pa.Table", export_format: ExportFormat) -> bytes:
+    """Write a table as an Arrow IPC stream or a Parquet file and return its bytes."""
+    import pyarrow as pa
+
+    sink = pa.BufferOutputStream()
+    if export_format == "parquet":
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, sink)
+    else:
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+    return sink.getvalue().to_pybytes()
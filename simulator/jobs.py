@@ -0,0 +1,264 @@
+"""Background queue for simulation jobs.
+
+Submitting a job returns its ID at once; a fixed number of worker tasks take
+jobs off the queue and run them, so at most that many simulations call the
+agents at a time however many are submitted. Every job's record (and, once
+it finishes, its results) is written to a state directory, so jobs still
+queued or running when the server stops are run again after a restart.
+Finished jobs are evicted once they exceed the retention count or age.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from enum import StrEnum
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+
+class JobStatus(StrEnum):
+    """Lifecycle states of a simulation job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+FINISHED_STATUSES = frozenset({JobStatus.SUCCEEDED, JobStatus.FAILED})
+
+
+class SimulationJob(BaseModel):
+    """A queued simulation run and its progress."""
+
+    job_id: str
+    status: JobStatus = JobStatus.QUEUED
+    params: dict[str, Any]
+    total_days: int
+    days_completed: int = 0
+    error: str | None = None
+    submitted_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+
+class JobQueueFullError(RuntimeError):
+    """Raised when a job is submitted while the queue is at capacity."""
+
+
+JobRunner = Callable[[SimulationJob], Awaitable[dict[str, Any]]]
+
+
+class SimulationJobQueue:
+    """A bounded pool of workers running simulation jobs in submission order."""
+
+    def __init__(
+        self,
+        run: JobRunner,
+        state_dir: str | Path | None,
+        max_workers: int,
+        max_queued: int,
+        max_finished: int,
+        finished_ttl: timedelta,
+    ) -> None:
+        """Initialize the queue; call `start()` from the event loop to run jobs.
+
+        Args:
+            run: Runs a job and returns its results dict. It may update the
+                job's `days_completed` as it goes.
+            state_dir: Directory the jobs are persisted to (created on first
+                write); None keeps them in memory only.
+            max_workers: The number of jobs run at once.
+            max_queued: The number of jobs that may wait to run.
+            max_finished: The number of finished jobs kept.
+            finished_ttl: How long finished jobs are kept.
+
+        """
+        self._run = run
+        self.state_dir = Path(state_dir) if state_dir is not None else None
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.max_finished = max_finished
+        self.finished_ttl = finished_ttl
+        self._jobs: dict[str, SimulationJob] = {}
+        self._results: dict[str, dict[str, Any]] = {}
+        self._pending: asyncio.Queue[str] | None = None
+        self._workers: list[asyncio.Task[None]] = []
+
+    async def start(self) -> None:
+        """Reload persisted jobs and start the workers.
+
+        Jobs that were queued or running when the server stopped are queued
+        again, in their original submission order.
+        """
+        # The queue is created here so that it belongs to the running loop.
+        self._pending = asyncio.Queue()
+        self._load()
+        for job in sorted(self._jobs.values(), key=lambda job: job.submitted_at):
+            if job.status == JobStatus.QUEUED:
+                self._pending.put_nowait(job.job_id)
+        self._evict()
+        self._workers = [
+            asyncio.create_task(
+                self._worker(self._pending), name=f"simulation-job-worker-{i}"
+            )
+            for i in range(self.max_workers)
+        ]
+        logger.info(
+            f"Started {self.max_workers} simulation job workers with {self._pending.qsize()} queued jobs",
+        )
+
+    async def stop(self) -> None:
+        """Stop the workers; interrupted jobs stay persisted as running."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def submit(self, params: dict[str, Any]) -> SimulationJob:
+        """Queue a simulation run and return its job.
+
+        Jobs submitted before `start()` wait until the workers are started.
+
+        Args:
+            params: Simulation parameters, as produced by `SimulationRunParams.to_dict()`.
+
+        Raises:
+            JobQueueFullError: If `max_queued` jobs are already waiting.
+
+        """
+        queued = sum(job.status == JobStatus.QUEUED for job in self._jobs.values())
+        if queued >= self.max_queued:
+            msg = f"The simulation queue is full ({self.max_queued} jobs waiting)."
+            raise JobQueueFullError(msg)
+        job = SimulationJob(
+            job_id=uuid.uuid4().hex,
+            params=params,
+            total_days=params["sim_days"],
+        )
+        self._jobs[job.job_id] = job
+        self._save(job)
+        if self._pending is not None:
+            self._pending.put_nowait(job.job_id)
+        logger.info(f"Queued simulation job {job.job_id}")
+        return job
+
+    def get(self, job_id: str) -> SimulationJob | None:
+        """Return a job, or None if it is unknown or was evicted."""
+        return self._jobs.get(job_id)
+
+    def result(self, job_id: str) -> dict[str, Any] | None:
+        """Return a finished job's results, or None if they are not available."""
+        job = self._jobs.get(job_id)
+        if job is None or job.status not in FINISHED_STATUSES:
+            return None
+        path = self._result_path(job_id)
+        if path is None:
+            return self._results.get(job_id)
+        try:
+            return json.loads(path.read_text())
+        except FileNotFoundError:
+            return None
+
+    async def _worker(self, pending: asyncio.Queue[str]) -> None:
+        while True:
+            job_id = await pending.get()
+            job = self._jobs.get(job_id)
+            if job is None or job.status != JobStatus.QUEUED:
+                continue
+            job.status = JobStatus.RUNNING
+            job.started_at = datetime.now(UTC)
+            logger.info(f"Running simulation job {job_id}")
+            results: dict[str, Any]
+            # Saving is inside the try too, so a disk error fails the job
+            # instead of stopping the worker with the job left running.
+            try:
+                self._save(job)
+                results = await self._run(job)
+                if self.state_dir is not None:
+                    await asyncio.to_thread(self._save_result, job_id, results)
+            except Exception as e:
+                logger.exception(f"Simulation job {job_id} raised an error")
+                results = {"success": False, "error": f"Unexpected error: {e}"}
+            job.status = (
+                JobStatus.SUCCEEDED if results.get("success") else JobStatus.FAILED
+            )
+            job.error = results.get("error")
+            job.finished_at = datetime.now(UTC)
+            if self.state_dir is None:
+                self._results[job_id] = results
+            try:
+                self._save(job)
+            except OSError:
+                logger.exception(f"Could not save simulation job {job_id}")
+            logger.info(f"Simulation job {job_id} finished: {job.status}")
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop finished jobs beyond `max_finished` or older than `finished_ttl`."""
+        finished = sorted(
+            (job for job in self._jobs.values() if job.status in FINISHED_STATUSES),
+            key=lambda job: job.finished_at or job.submitted_at,
+            reverse=True,
+        )
+        cutoff = datetime.now(UTC) - self.finished_ttl
+        for rank, job in enumerate(finished):
+            finished_at = job.finished_at or job.submitted_at
+            if rank >= self.max_finished or finished_at < cutoff:
+                self._remove(job.job_id)
+
+    def _remove(self, job_id: str) -> None:
+        self._jobs.pop(job_id, None)
+        self._results.pop(job_id, None)
+        for path in (self._job_path(job_id), self._result_path(job_id)):
+            if path is not None:
+                path.unlink(missing_ok=True)
+        logger.debug(f"Evicted simulation job {job_id}")
+
+    def _load(self) -> None:
+        if self.state_dir is None or not self.state_dir.is_dir():
+            return
+        jobs = []
+        for path in self.state_dir.glob("*.job.json"):
+            try:
+                jobs.append(SimulationJob.model_validate_json(path.read_text()))
+            except ValueError:
+                logger.warning(f"Skipping unreadable simulation job file {path}")
+        for job in jobs:
+            if job.status not in FINISHED_STATUSES:
+                job.status = JobStatus.QUEUED
+                job.started_at = None
+                job.days_completed = 0
+            self._jobs[job.job_id] = job
+
+    def _job_path(self, job_id: str) -> Path | None:
+        return self.state_dir / f"{job_id}.job.json" if self.state_dir else None
+
+    def _result_path(self, job_id: str) -> Path | None:
+        return self.state_dir / f"{job_id}.result.json" if self.state_dir else None
+
+    def _save(self, job: SimulationJob) -> None:
+        path = self._job_path(job.job_id)
+        if path is not None:
+            _write_atomic(path, job.model_dump_json())
+
+    def _save_result(self, job_id: str, results: dict[str, Any]) -> None:
+        path = self._result_path(job_id)
+        if path is not None:
+            _write_atomic(path, json.dumps(results))
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Write a file so that readers never see it half-written."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    temp_path.write_text(text)
+    temp_path.replace(path)
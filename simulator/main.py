@@ -6,22 +6,30 @@ for risk checks. Displays results including portfolio value, trades,
 and performance metrics using Plotly charts.
 """
 
+import asyncio
+import functools
+import hashlib
+import json
 import locale
 import logging
 import os
+import random
 import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager
+from dataclasses import dataclass, field, replace
+from datetime import timedelta
 from pathlib import Path
-from typing import Annotated, Any
+from typing import TYPE_CHECKING, Annotated, Any, Literal
 
 import httpx
-import pandas as pd
-import plotly.graph_objects as go
+import numpy as np
+import numpy.typing as npt
 
 # A2A SDK Imports
 from a2a.client import (
-    A2ACardResolver,
     A2AClientError,
+    Client,
     ClientConfig,
     ClientFactory,
 )
@@ -34,12 +42,12 @@ from a2a.types import (
     SendMessageRequest,
     TaskState,
 )
-from fastapi import FastAPI, Form, Request
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, Form, HTTPException, Query, Request
+from fastapi.responses import HTMLResponse, PlainTextResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from plotly.subplots import make_subplots
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, Field, ValidationError, model_validator
+from sse_starlette import EventSourceResponse
 
 # Common project imports
 import common.config as defaults
@@ -47,27 +55,82 @@ from common.config import (
     DEFAULT_SIMULATOR_PORT,
 )  # Keep this for the uvicorn runner at the bottom
 from common.models import (
+    AlphaBotEpisodePayload,
     AlphaBotTaskPayload,
+    EpisodeChunk,
+    EpisodeDayOutcome,
     TradeOutcome,
+    TradeProposal,
     TradeStatus,
 )
 from common.models import (
     PortfolioState as CommonPortfolioState,
 )
-from common.utils.indicators import calculate_sma
-
-from .market import MarketDataSimulator
+from common.utils.agent_cards import agent_cards, is_connection_error
+from common.utils.http_pool import HttpPoolStats, http_pool
+from common.utils.indicators import RollingSMA, calculate_sma_series
+
+from .artifacts import RunArtifactStore
+from .backtest import (
+    ACTION_BUY,
+    ACTION_NONE,
+    calculate_max_drawdown,
+    run_sma_crossover_backtest,
+)
+from .batch import SimulationProcessPool, compact_simulation_results
+from .cache import SimulationResultCache
+from .downsample import min_max_downsample_indices
+from .ensemble import EnsembleSummary, run_monte_carlo_ensemble
+from .export import (
+    EXPORT_FORMATS,
+    ExportFormat,
+    ExportTable,
+    daily_results_table,
+    serialize_table,
+    trade_events_table,
+)
+from .jobs import JobQueueFullError, SimulationJob, SimulationJobQueue
+from .market import MarketDataSimulator, MarketDataSource
 from .portfolio import PortfolioState, TradeAction
+from .recorder import SimulationRecorder, TradeEvent, TradeMarkers
+from .replay import HistoricalReplaySource
+from .run_log import (
+    LogVerbosity,
+    SimulationLog,
+    SimulationLogHandler,
+    attach_simulation_log,
+    detach_simulation_log,
+)
+from .sweep import (
+    SweepField,
+    SweepRange,
+    SweepResult,
+    expand_sweep,
+    run_parameter_sweep,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import plotly.graph_objects as go
+    import pyarrow as pa
 
 SIMULATOR_UI_LOGGER = "SimulatorUI"
 SIMULATOR_LOGIC_LOGGER = "SimulatorLogic"
 
+SimulationEngine = Literal["a2a", "episode", "vectorized"]
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 logger = logging.getLogger(SIMULATOR_UI_LOGGER)
 
+# The simulation logic logger only feeds each run's detailed log (see run_log).
+sim_logger = logging.getLogger(SIMULATOR_LOGIC_LOGGER)
+sim_logger.addHandler(SimulationLogHandler())
+sim_logger.setLevel(logging.INFO)
+sim_logger.propagate = False
+
 module_dir = Path(__file__).parent
 templates_dir = module_dir / "templates"
 static_dir = module_dir / "static"
@@ -89,6 +152,18 @@ def format_currency(value: float | None) -> str:
         return f"${value:,.2f}"
 
 
+class _LazyCurrency:
+    """A value that is formatted with `format_currency` only when logged."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: float) -> None:
+        self.value = value
+
+    def __str__(self) -> str:
+        return format_currency(self.value)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Handle application startup and shutdown events, including locale setting."""
@@ -102,28 +177,81 @@ async def lifespan(app: FastAPI):
             f"Could not set default locale ('{locale_setting}') at startup: {e}. "
             "Check system locale settings. Using fallback currency formatting.",
         )
+    await simulation_jobs.start()
+    alphabot_url = os.environ.get("ALPHABOT_SERVICE_URL", defaults.DEFAULT_ALPHABOT_URL)
+    prewarm = agent_cards.start_prewarm([alphabot_url], http_pool.get_client())
     yield
     logger.info("Simulator UI shutting down...")
+    prewarm.cancel()
+    await simulation_jobs.stop()
+    simulation_pool.shutdown()
+    await http_pool.aclose()
 
 
 app = FastAPI(lifespan=lifespan)
+simulation_pool = SimulationProcessPool()
+simulation_artifacts = RunArtifactStore(defaults.SIMULATION_ARTIFACT_STORE_SIZE)
+
+
+def _run_artifacts_kept(results: dict[str, Any]) -> bool:
+    """Return whether a run's deferred chart, log and exports are still served.
+
+    A cached result links to them by run ID, so it is only served while
+    `simulation_artifacts` keeps the run, and serving it keeps the run there.
+    """
+    run_id = results.get("run_id")
+    return run_id is None or simulation_artifacts.touch(run_id)
+
+
+simulation_results_cache = SimulationResultCache(
+    max_entries=defaults.SIMULATION_RESULT_CACHE_SIZE,
+    ttl_seconds=defaults.SIMULATION_RESULT_CACHE_TTL_SECONDS,
+    is_valid=_run_artifacts_kept,
+)
 templates = Jinja2Templates(directory=str(templates_dir))
 templates.env.filters["format_currency"] = format_currency
 app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
 
 
 def _create_results_figure(
-    results_df: pd.DataFrame,
+    results_df: "pd.DataFrame",
     params: dict[str, Any],
-    trade_markers: dict[str, list],
-) -> go.Figure:
-    """Create the Plotly figure for simulation results."""
+    trade_markers: TradeMarkers,
+) -> "go.Figure":
+    """Create the Plotly figure for simulation results.
+
+    Long runs are drawn with at most `CHART_MAX_POINTS_PER_TRACE` points per
+    line (see `min_max_downsample_indices`), always including the trade days,
+    and with WebGL traces once they exceed `CHART_WEBGL_THRESHOLD_DAYS`.
+    """
+    # Plotly is imported on first use to keep it out of the server's startup.
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
     MARKER_SIZE = 10
     MARKER_LINE_WIDTH = 1
     APPROVED_COLOR = "lime"
     REJECTED_COLOR = "red"
     MARKER_LINE_COLOR = "black"
 
+    scatter = (
+        go.Scattergl
+        if len(results_df) > defaults.CHART_WEBGL_THRESHOLD_DAYS
+        else go.Scatter
+    )
+    days = results_df.index.to_numpy()
+    prices = results_df["Price"].to_numpy(dtype=np.float64)
+    trade_days = trade_markers.all_positions()
+
+    def _line(column: str) -> dict[str, Any]:
+        values = results_df[column].to_numpy(dtype=np.float64)
+        points = min_max_downsample_indices(
+            values,
+            defaults.CHART_MAX_POINTS_PER_TRACE,
+            keep=trade_days,
+        )
+        return {"x": days[points], "y": values[points]}
+
     fig = make_subplots(
         rows=2,
         cols=1,
@@ -133,9 +261,8 @@ def _create_results_figure(
     )
 
     fig.add_trace(
-        go.Scatter(
-            x=results_df.index,
-            y=results_df["Price"],
+        scatter(
+            **_line("Price"),
             name="Price",
             line={"color": "skyblue"},
             legendgroup="price",
@@ -144,9 +271,8 @@ def _create_results_figure(
         col=1,
     )
     fig.add_trace(
-        go.Scatter(
-            x=results_df.index,
-            y=results_df["SMA_Short"],
+        scatter(
+            **_line("SMA_Short"),
             name=f"SMA({params['alphabot_short_sma']})",
             line={"color": "orange", "dash": "dot"},
             legendgroup="price",
@@ -156,9 +282,8 @@ def _create_results_figure(
         col=1,
     )
     fig.add_trace(
-        go.Scatter(
-            x=results_df.index,
-            y=results_df["SMA_Long"],
+        scatter(
+            **_line("SMA_Long"),
             name=f"SMA({params['alphabot_long_sma']})",
             line={"color": "lightcoral", "dash": "dash"},
             legendgroup="price",
@@ -168,11 +293,11 @@ def _create_results_figure(
         col=1,
     )
 
-    if trade_markers["approved_buy_days"]:
+    if len(trade_markers.approved_buy):
         fig.add_trace(
-            go.Scatter(
-                x=trade_markers["approved_buy_days"],
-                y=trade_markers["approved_buy_prices"],
+            scatter(
+                x=days[trade_markers.approved_buy],
+                y=prices[trade_markers.approved_buy],
                 mode="markers",
                 marker={
                     "symbol": "triangle-up",
@@ -187,11 +312,11 @@ def _create_results_figure(
             row=1,
             col=1,
         )
-    if trade_markers["rejected_buy_days"]:
+    if len(trade_markers.rejected_buy):
         fig.add_trace(
-            go.Scatter(
-                x=trade_markers["rejected_buy_days"],
-                y=trade_markers["rejected_buy_prices"],
+            scatter(
+                x=days[trade_markers.rejected_buy],
+                y=prices[trade_markers.rejected_buy],
                 mode="markers",
                 marker={
                     "symbol": "triangle-up",
@@ -206,11 +331,11 @@ def _create_results_figure(
             row=1,
             col=1,
         )
-    if trade_markers["approved_sell_days"]:
+    if len(trade_markers.approved_sell):
         fig.add_trace(
-            go.Scatter(
-                x=trade_markers["approved_sell_days"],
-                y=trade_markers["approved_sell_prices"],
+            scatter(
+                x=days[trade_markers.approved_sell],
+                y=prices[trade_markers.approved_sell],
                 mode="markers",
                 marker={
                     "symbol": "triangle-down",
@@ -225,11 +350,11 @@ def _create_results_figure(
             row=1,
             col=1,
         )
-    if trade_markers["rejected_sell_days"]:
+    if len(trade_markers.rejected_sell):
         fig.add_trace(
-            go.Scatter(
-                x=trade_markers["rejected_sell_days"],
-                y=trade_markers["rejected_sell_prices"],
+            scatter(
+                x=days[trade_markers.rejected_sell],
+                y=prices[trade_markers.rejected_sell],
                 mode="markers",
                 marker={
                     "symbol": "triangle-down",
@@ -246,9 +371,8 @@ def _create_results_figure(
         )
 
     fig.add_trace(
-        go.Scatter(
-            x=results_df.index,
-            y=results_df["TotalValue"],
+        scatter(
+            **_line("TotalValue"),
             name="Total Value",
             line={"color": "green"},
             legendgroup="portfolio",
@@ -259,9 +383,8 @@ def _create_results_figure(
         secondary_y=False,
     )
     fig.add_trace(
-        go.Scatter(
-            x=results_df.index,
-            y=results_df["Cash"],
+        scatter(
+            **_line("Cash"),
             name="Cash",
             line={"color": "lightgreen", "dash": "dash"},
             legendgroup="portfolio",
@@ -272,9 +395,8 @@ def _create_results_figure(
         secondary_y=False,
     )
     fig.add_trace(
-        go.Scatter(
-            x=results_df.index,
-            y=results_df["Shares"],
+        scatter(
+            **_line("Shares"),
             name="Shares Held",
             line={"color": "purple", "dash": "dot"},
             legendgroup="portfolio",
@@ -310,18 +432,26 @@ def _create_results_figure(
     return fig
 
 
-class UILogHandler(logging.Handler):
-    """Custom log handler to capture logs into a provided list for UI display."""
-
-    def __init__(self, log_list: list[str]) -> None:
-        """Initialize the UILogHandler."""
-        super().__init__()
-        self._log_list = log_list
+async def _resolve_alphabot_client(
+    client_factory: ClientFactory,
+    httpx_client: httpx.AsyncClient,
+    alphabot_url: str,
+    cache: dict[str, Any] | None,
+    cache_key: str = "a2a_client",
+) -> Client:
+    """Return the cached A2A client for AlphaBot, built from its cached agent card.
 
-    def emit(self, record) -> None:
-        """Format the record and append it to the log list."""
-        log_entry = self.format(record)
-        self._log_list.append(log_entry)
+    The client is rebuilt whenever `agent_cards` returns a different card, as
+    it does once the old one expired or was dropped after a connection error.
+    """
+    agent_card = await agent_cards.get_card(alphabot_url, httpx_client)
+    cached = cache.get(cache_key) if cache is not None else None
+    if cached is not None and cached[0] is agent_card:
+        return cached[1]
+    a2a_sdk_client = client_factory.create(agent_card)
+    if cache is not None:
+        cache[cache_key] = (agent_card, a2a_sdk_client)
+    return a2a_sdk_client
 
 
 async def _call_alphabot_a2a(
@@ -331,11 +461,12 @@ async def _call_alphabot_a2a(
     session_id: str,
     day: int,
     current_price: float,
-    historical_prices: list[float],
+    historical_prices: list[float] | npt.NDArray[np.float64],
     portfolio: PortfolioState,
     params: dict[str, Any],
     sim_logger: logging.Logger,
     cache: dict[str, Any] | None = None,
+    incremental: bool = False,
 ) -> dict[str, Any]:
     """Prepare and send a message to the AlphaBot A2A server for a given simulation day.
 
@@ -346,18 +477,22 @@ async def _call_alphabot_a2a(
         session_id: The simulation session ID (used as contextId).
         day: The current simulation day.
         current_price: The current market price.
-        historical_prices: List of historical prices.
+        historical_prices: Historical prices, as a list or a read-only history view.
         portfolio: The current PortfolioState object.
         params: Dictionary containing simulation and agent parameters.
         sim_logger: Logger instance for simulation logic.
+        cache: Optional dictionary used to reuse the A2A client across days.
+        incremental: Send only the current price and rely on the price window
+            AlphaBot keeps in its session (requires `incremental_payloads`).
 
     Returns:
-        A dictionary containing the outcome.
+        A dictionary containing the outcome. `resync_required` is True when
+        AlphaBot rejected an incremental payload and needs the full window.
 
     """
     # 1. Create a single, unified payload object.
     payload = AlphaBotTaskPayload(
-        historical_prices=historical_prices,
+        historical_prices=[] if incremental else historical_prices,
         current_price=current_price,
         portfolio_state=CommonPortfolioState(
             cash=portfolio.cash,
@@ -371,36 +506,39 @@ async def _call_alphabot_a2a(
         riskguard_url=params["riskguard_url"],
         max_pos_size=params["riskguard_max_pos_size"],
         max_concentration=params["riskguard_max_concentration"] / 100.0,
+        sequence=day if params.get("incremental_payloads") else None,
     )
 
+    # The validated price list already holds plain floats, so reuse it instead of
+    # letting model_dump copy it again.
+    payload_data = payload.model_dump(mode="json", exclude={"historical_prices"})
+    payload_data["historical_prices"] = payload.historical_prices
+
     # 2. Use the new helper to create the A2A Request
     # This is now handled by the A2A SDK client
 
-    sim_logger.info(f"--- Calling AlphaBot A2A Server (Session ID: {session_id}) ---")
+    sim_logger.info("--- Calling AlphaBot A2A Server (Session ID: %s) ---", session_id)
     outcome: dict[str, Any] = {
         "approved_trade": None,
         "rejected_trade": None,
         "reason": None,
         "error": None,
+        "resync_required": False,
     }
     try:
-        a2a_sdk_client = cache.get("a2a_client") if cache is not None else None
-        if not a2a_sdk_client:
-            card_resolver = A2ACardResolver(
-                httpx_client=httpx_client,
-                base_url=alphabot_url,
-            )
-            agent_card = await card_resolver.get_agent_card()
-            a2a_sdk_client = client_factory.create(agent_card)
-            if cache is not None:
-                cache["a2a_client"] = a2a_sdk_client
+        a2a_sdk_client = await _resolve_alphabot_client(
+            client_factory,
+            httpx_client,
+            alphabot_url,
+            cache,
+        )
 
         # The new client returns a stream. We iterate and process the events.
         message_to_send = A2AMessage(
             message_id=f"msg-{uuid.uuid4().hex[:8]}",
             role=Role.ROLE_USER,
             parts=[
-                new_data_part(payload.model_dump(mode="json")),
+                new_data_part(payload_data),
             ],
             context_id=session_id,
         )
@@ -416,7 +554,9 @@ async def _call_alphabot_a2a(
                         outcome_model.trade_proposal.model_dump()
                     )
                 sim_logger.info(
-                    f"    >>> Approved Trade: {outcome.get('approved_trade')} (Reason: {outcome_model.reason})",
+                    "    >>> Approved Trade: %s (Reason: %s)",
+                    outcome.get("approved_trade"),
+                    outcome_model.reason,
                 )
             elif outcome_model.status == TradeStatus.REJECTED:
                 if outcome_model.trade_proposal:
@@ -424,11 +564,20 @@ async def _call_alphabot_a2a(
                         outcome_model.trade_proposal.model_dump()
                     )
                 sim_logger.info(
-                    f"    >>> Rejected Trade: {outcome.get('rejected_trade')} (Reason: {outcome_model.reason})",
+                    "    >>> Rejected Trade: %s (Reason: %s)",
+                    outcome.get("rejected_trade"),
+                    outcome_model.reason,
+                )
+            elif outcome_model.status == TradeStatus.RESYNC_REQUIRED:
+                outcome["resync_required"] = True
+                sim_logger.info(
+                    "  >> AlphaBot requested a full price resync: %s",
+                    outcome_model.reason,
                 )
             elif outcome_model.status == TradeStatus.NO_ACTION:
                 sim_logger.info(
-                    f"  >> Received info message from AlphaBot: {outcome_model.reason}",
+                    "  >> Received info message from AlphaBot: %s",
+                    outcome_model.reason,
                 )
             outcome["reason"] = outcome_model.reason
 
@@ -458,7 +607,8 @@ async def _call_alphabot_a2a(
                         )
                     break
                 sim_logger.debug(
-                    f"Received unexpected artifact update '{event.artifact_update.artifact.name}' from AlphaBot, ignoring.",
+                    "Received unexpected artifact update '%s' from AlphaBot, ignoring.",
+                    event.artifact_update.artifact.name,
                 )
             elif event.HasField("status_update"):
                 state = event.status_update.status.state
@@ -467,7 +617,9 @@ async def _call_alphabot_a2a(
                     break
             elif event.HasField("task"):
                 sim_logger.debug(
-                    f"Received task update for {event.task.id}: {event.task.status.state}",
+                    "Received task update for %s: %s",
+                    event.task.id,
+                    event.task.status.state,
                 )
                 response_artifact = next(
                     (art for art in event.task.artifacts if art.name == "response"),
@@ -497,6 +649,8 @@ async def _call_alphabot_a2a(
 
     except A2AClientError as e:
         sim_logger.exception("A2A Client Error")
+        if is_connection_error(e):
+            agent_cards.invalidate(alphabot_url)
         outcome["error"] = f"A2A Client Error: {e}"
         msg = f"AlphaBot A2A Client Error: {e}"
         raise ConnectionError(
@@ -508,260 +662,567 @@ async def _call_alphabot_a2a(
     return outcome
 
 
-async def run_simulation_async(params: dict[str, Any]) -> dict[str, Any]:
-    """Run the trading simulation and collects results. Returns dict with results or error."""
+def _create_market_data_source(
+    params: dict[str, Any],
+    sim_logger: logging.Logger,
+) -> MarketDataSource:
+    """Create the price source for a run: a replay file if one is set, else the generator.
+
+    Replay files are looked up by name inside the market data directory
+    (`MARKET_DATA_DIR`), so form input cannot point at arbitrary paths.
+    """
+    history_size = (
+        params["alphabot_long_sma"] + 20
+    )  # Ensure enough history for longest SMA
+    replay_file = params.get("replay_file")
+    if replay_file:
+        data_dir = Path(
+            os.environ.get("MARKET_DATA_DIR", defaults.DEFAULT_MARKET_DATA_DIR),
+        ).resolve()
+        replay_path = (data_dir / replay_file).resolve()
+        if not replay_path.is_relative_to(data_dir) or not replay_path.is_file():
+            msg = f"Replay file '{replay_file}' not found in the market data directory."
+            raise ValueError(msg)
+        source = HistoricalReplaySource(
+            replay_path,
+            symbol=params.get("replay_symbol"),
+            history_size=history_size,
+        )
+        sim_logger.info(
+            "Replaying %s from %s (%s days available)",
+            source.symbol,
+            replay_path.name,
+            source.remaining_days,
+        )
+        return source
+
+    market_sim = MarketDataSimulator(
+        initial_price=params["sim_initial_price"],
+        volatility=params["sim_volatility"],
+        trend=params["sim_trend"],
+        history_size=history_size,
+        seed=params.get("seed"),
+        # Draw the whole path in one block
+        block_size=max(params["sim_days"], 1),
+    )
+    if market_sim.seed is not None:
+        sim_logger.info("Using market seed: %s", market_sim.seed)
+    return market_sim
+
+
+def _new_simulation_log(params: dict[str, Any]) -> SimulationLog:
+    """Create the detailed log for a run, at the run's verbosity."""
+    return SimulationLog(
+        defaults.SIMULATION_LOG_MAX_RECORDS,
+        verbosity=params.get("log_verbosity", "trades"),
+    )
+
+
+def _calculate_run_metrics(
+    results_df: "pd.DataFrame",
+    params: dict[str, Any],
+    trade_markers: TradeMarkers,
+    portfolio: PortfolioState,
+) -> dict[str, float]:
+    """Summarize a run's performance for comparisons such as parameter sweeps."""
+    initial_cash = params["sim_initial_cash"]
+    final_value = portfolio.cash + portfolio.holdings_value
+    values = np.concatenate(
+        (
+            [initial_cash],
+            results_df["TotalValue"].to_numpy(dtype=np.float64),
+            [final_value],
+        ),
+    )
+    return {
+        "final_value": final_value,
+        "total_return_pct": (final_value / initial_cash - 1) * 100
+        if initial_cash
+        else 0.0,
+        "max_drawdown_pct": float(calculate_max_drawdown(values)) * 100,
+        "trade_count": trade_markers.trade_count,
+        "rejected_count": trade_markers.rejected_count,
+    }
+
+
+def _results_chart_json(
+    results_df: "pd.DataFrame",
+    initial_price: float,
+    params: dict[str, Any],
+    trade_markers: TradeMarkers,
+) -> str:
+    """Return the results chart, with the strategy's SMAs, as Plotly JSON."""
+    # The chart SMAs are computed for the whole run in one vectorized pass,
+    # including the initial price so warm-up matches the per-day history.
+    price_series = np.concatenate(
+        ([initial_price], results_df["Price"].to_numpy(dtype=np.float64)),
+    )
+    # A shallow copy, so the exported daily results keep their own columns.
+    results_df = results_df.copy(deep=False)
+    results_df.insert(
+        1,
+        "SMA_Short",
+        calculate_sma_series(price_series, params["alphabot_short_sma"])[1:],
+    )
+    results_df.insert(
+        2,
+        "SMA_Long",
+        calculate_sma_series(price_series, params["alphabot_long_sma"])[1:],
+    )
+    return _create_results_figure(results_df, params, trade_markers).to_json()
+
+
+def _export_bytes(
+    build_table: Callable[[], "pa.Table"],
+    export_format: ExportFormat,
+) -> bytes:
+    """Build an export table and serialize it in the given format."""
+    return serialize_table(build_table(), export_format)
+
+
+def _build_simulation_results(
+    results_df: "pd.DataFrame",
+    initial_price: float,
+    params: dict[str, Any],
+    trade_markers: TradeMarkers,
+    trade_events: list[TradeEvent],
+    signals: list[dict[str, Any]],
+    sim_log: SimulationLog,
+    portfolio: PortfolioState,
+    build_charts: bool = True,
+    defer_charts: bool = False,
+    day_errors: int = 0,
+) -> dict[str, Any]:
+    """Assemble a successful run's output, with its chart and log built now or on request.
+
+    Only deferred runs can be exported, as their results stay in
+    `simulation_artifacts` for a while; the others are discarded once built.
+
+    Args:
+        results_df: Start-of-day Price, Cash, Shares, HoldingsValue and TotalValue,
+            indexed by Day.
+        initial_price: The price before day 1, used to warm up the SMAs.
+        params: The simulation parameters.
+        trade_markers: Row positions of approved and rejected trades.
+        trade_events: The run's trade proposals, for the trade events export.
+        signals: Per-day signal log entries.
+        sim_log: The run's captured detailed log.
+        portfolio: The final portfolio.
+        build_charts: Whether to build the Plotly figure; callers that only
+            need the metrics can skip it.
+        defer_charts: Register the chart, the detailed log and the exports
+            with `simulation_artifacts` instead of building them, and return
+            their `chart_url`, `detailed_log_url` and `export_urls` (overrides
+            `build_charts`).
+        day_errors: The number of days whose AlphaBot call failed; such runs
+            finish, but are not cached.
+
+    Returns:
+        The results dictionary rendered by the UI.
+
+    """
+    charts = {}
+    if defer_charts:
+        export_tables: dict[ExportTable, Callable[[], pa.Table]] = {
+            "daily": functools.partial(daily_results_table, results_df),
+            "trades": functools.partial(trade_events_table, trade_events),
+        }
+        run_id = simulation_artifacts.add(
+            {
+                "chart": functools.partial(
+                    _results_chart_json,
+                    results_df,
+                    initial_price,
+                    params,
+                    trade_markers,
+                ),
+                "log": sim_log.format,
+                **{
+                    f"{table}.{export_format}": functools.partial(
+                        _export_bytes,
+                        build_table,
+                        export_format,
+                    )
+                    for table, build_table in export_tables.items()
+                    for export_format in EXPORT_FORMATS
+                },
+            },
+        )
+        charts = {"chart_url": f"/results/{run_id}/chart"}
+        log_fields: dict[str, Any] = {
+            "run_id": run_id,
+            "detailed_log_url": f"/results/{run_id}/log",
+            "export_urls": {
+                table: f"/results/{run_id}/export/{table}" for table in export_tables
+            },
+        }
+    else:
+        if build_charts:
+            charts = {
+                "combined_chart_json": _results_chart_json(
+                    results_df,
+                    initial_price,
+                    params,
+                    trade_markers,
+                ),
+            }
+        log_fields = {"detailed_log": sim_log.format()}
+    signals_log = "\n".join([f"Day {s['day']}: {s['log']}" for s in signals])
+
+    return {
+        "success": True,
+        "final_portfolio": portfolio.__dict__,
+        "metrics": _calculate_run_metrics(
+            results_df,
+            params,
+            trade_markers,
+            portfolio,
+        ),
+        "charts": charts,
+        "signals_log": signals_log,
+        "day_errors": day_errors,
+        **log_fields,
+    }
+
+
+@dataclass
+class SharedA2AClients:
+    """An httpx client and A2A client cache shared by concurrent simulation runs.
+
+    Runs that share them still use their own A2A context ID, so each keeps a
+    separate AlphaBot session.
+    """
+
+    http_client: httpx.AsyncClient
+    cache: dict[str, Any] = field(default_factory=dict)
+
+
+def _day_progress_event(
+    recorder: SimulationRecorder,
+    index: int,
+    sma_short: float | None,
+    sma_long: float | None,
+    action: str | None,
+    approved: bool | None,
+    log: str,
+) -> dict[str, Any]:
+    """Build the progress event for one simulated day.
+
+    Args:
+        recorder: The run's recorder, holding the start-of-day portfolio.
+        index: The day's row position in the recorder.
+        sma_short: The short SMA including the day's price (None during warm-up).
+        sma_long: The long SMA including the day's price (None during warm-up).
+        action: The proposed action, or None when no trade was proposed.
+        approved: Whether RiskGuard approved the proposal (None without one).
+        log: The day's entry in the trade signals log.
+
+    Returns:
+        A JSON-serializable dict describing the day.
+
+    """
+    return {
+        "day": index + 1,
+        "price": float(recorder.prices[index]),
+        "sma_short": sma_short,
+        "sma_long": sma_long,
+        "cash": float(recorder.cash[index]),
+        "shares": int(recorder.shares[index]),
+        "total_value": float(recorder.total_value[index]),
+        "action": action,
+        "approved": approved,
+        "log": log,
+    }
+
+
+async def run_simulation_async(
+    params: dict[str, Any],
+    shared_clients: SharedA2AClients | None = None,
+    build_charts: bool = True,
+    defer_charts: bool = False,
+    on_day: Callable[[dict[str, Any]], Awaitable[None]] | None = None,
+) -> dict[str, Any]:
+    """Run the trading simulation and collects results. Returns dict with results or error.
+
+    Args:
+        params: Simulation parameters, as produced by `SimulationRunParams.to_dict()`.
+        shared_clients: Clients to reuse across runs; by default the run uses
+            the pooled httpx client and its own A2A client.
+        build_charts: Whether to build the results chart.
+        defer_charts: Whether to leave the chart to `/results/{run_id}/chart`.
+        on_day: Awaited with a progress event (see `_day_progress_event`) as
+            soon as each day is done.
+
+    """
+    if params.get("engine") == "episode":
+        return await run_simulation_episode(
+            params,
+            shared_clients=shared_clients,
+            build_charts=build_charts,
+            defer_charts=defer_charts,
+            on_day=on_day,
+        )
     logger.info(f"--- Starting Simulation with params: {params} ---")
-    sim_log_list: list[str] = []
-    ui_log_handler = UILogHandler(sim_log_list)
-    formatter = logging.Formatter("%(levelname)s:%(name)s: %(message)s")
-    ui_log_handler.setFormatter(formatter)
-
-    sim_logger = logging.getLogger(SIMULATOR_LOGIC_LOGGER)
-    if not any(isinstance(h, UILogHandler) for h in sim_logger.handlers):
-        sim_logger.addHandler(ui_log_handler)
-    sim_logger.setLevel(logging.INFO)
-    sim_logger.propagate = False
-
-    daily_results = []
+    sim_log = _new_simulation_log(params)
+    log_token = attach_simulation_log(sim_log)
+
     signals = []
-    approved_buy_days, approved_buy_prices = [], []
-    rejected_buy_days, rejected_buy_prices = [], []
-    approved_sell_days, approved_sell_prices = [], []
-    rejected_sell_days, rejected_sell_prices = [], []
 
     try:
         sim_logger.info("Initializing simulation components...")
         portfolio = PortfolioState(cash=params["sim_initial_cash"])
-        market_sim = MarketDataSimulator(
-            initial_price=params["sim_initial_price"],
-            volatility=params["sim_volatility"],
-            trend=params["sim_trend"],
-            history_size=params["alphabot_long_sma"]
-            + 20,  # Ensure enough history for longest SMA
-        )
+        market_sim = _create_market_data_source(params, sim_logger)
+        initial_price = market_sim.get_current_price()
+        # Seeded like the results chart, whose SMAs include the initial price.
+        sma_short = RollingSMA(params["alphabot_short_sma"])
+        sma_long = RollingSMA(params["alphabot_long_sma"])
+        sma_short.update(initial_price)
+        sma_long.update(initial_price)
 
         alphabot_url = params.get(
             "alphabot_url",
             os.environ.get("ALPHABOT_SERVICE_URL", defaults.DEFAULT_ALPHABOT_URL),
         ).rstrip("/")  # Ensure no trailing slash for A2AClient
-        sim_logger.info(f"Using AlphaBot Service URL: {alphabot_url}")
-
-        # The A2AClient needs an httpx.AsyncClient. Manage its lifecycle.
-        async with httpx.AsyncClient() as http_client:
-            client_factory = ClientFactory(
-                config=ClientConfig(httpx_client=http_client),
-            )
+        sim_logger.info("Using AlphaBot Service URL: %s", alphabot_url)
 
-            a2a_session_id = f"sim-session-{uuid.uuid4().hex[:8]}"
-            a2a_client_cache: dict[str, Any] = {}
-            sim_logger.info(f"Using A2A Session ID (contextId): {a2a_session_id}")
+        http_client = (
+            shared_clients.http_client
+            if shared_clients is not None
+            else http_pool.get_client()
+        )
+        # Each day's decision is a single response, so it is not streamed.
+        client_factory = ClientFactory(
+            config=ClientConfig(httpx_client=http_client, streaming=False),
+        )
 
-            initial_portfolio_str = f"Initial Portfolio: {portfolio}"
-            sim_logger.info(initial_portfolio_str)
-            signals.append({"day": 0, "log": initial_portfolio_str})
+        a2a_session_id = f"sim-session-{uuid.uuid4().hex[:8]}"
+        a2a_client_cache: dict[str, Any] = (
+            shared_clients.cache if shared_clients is not None else {}
+        )
+        sim_logger.info("Using A2A Session ID (contextId): %s", a2a_session_id)
+
+        initial_portfolio_str = f"Initial Portfolio: {portfolio}"
+        sim_logger.info(initial_portfolio_str)
+        signals.append({"day": 0, "log": initial_portfolio_str})
+
+        total_days = params["sim_days"]
+        remaining_days = market_sim.remaining_days
+        if remaining_days is not None and remaining_days < total_days:
+            sim_logger.warning(
+                "Market data only has %s more days; shortening the run.",
+                remaining_days,
+            )
+            total_days = remaining_days
+        recorder = SimulationRecorder(total_days)
+        day_errors = 0
+        sim_logger.info("Starting simulation loop for %s days...", total_days)
+
+        for day in range(1, total_days + 1):
+            sim_log.begin_day()
+            sim_logger.info("===== Day %s =====", day)
+            current_price = market_sim.next_price()
+            historical_prices = market_sim.get_history_view()
+            sim_logger.info(
+                "Market Data: Price = %s",
+                _LazyCurrency(current_price),
+            )
 
-            total_days = params["sim_days"]
-            sim_logger.info(f"Starting simulation loop for {total_days} days...")
+            portfolio.update_valuation(current_price)
+            sim_logger.info(
+                "Portfolio (Start Day %s): %s",
+                day,
+                replace(portfolio),
+            )
 
-            for day in range(1, total_days + 1):
-                sim_logger.info(f"===== Day {day} =====")
-                current_price = market_sim.next_price()
-                historical_prices = market_sim.get_historical_prices()
-                sim_logger.info(
-                    f"Market Data: Price = {format_currency(current_price)}",
-                )
+            day_index = recorder.record_day(
+                current_price,
+                portfolio.cash,
+                portfolio.shares,
+                portfolio.holdings_value,
+                portfolio.total_value,
+            )
 
-                sma_short = calculate_sma(
-                    historical_prices,
-                    params["alphabot_short_sma"],
+            alphabot_call_kwargs: dict[str, Any] = {
+                "client_factory": client_factory,
+                "httpx_client": http_client,
+                "alphabot_url": alphabot_url,
+                "session_id": a2a_session_id,
+                "day": day,
+                "current_price": current_price,
+                "historical_prices": historical_prices,
+                "portfolio": portfolio,
+                "params": params,
+                "sim_logger": sim_logger,
+                "cache": a2a_client_cache,
+            }
+            # Day 1 always sends the full window to seed AlphaBot's session.
+            a2a_outcome = await _call_alphabot_a2a(
+                **alphabot_call_kwargs,
+                incremental=bool(params.get("incremental_payloads")) and day > 1,
+            )
+            if a2a_outcome.get("resync_required"):
+                sim_logger.warning(
+                    "AlphaBot lost the price sequence on day %s; resending the full window.",
+                    day,
                 )
-                sma_long = calculate_sma(historical_prices, params["alphabot_long_sma"])
-
-                portfolio.update_valuation(current_price)
-                sim_logger.info(f"Portfolio (Start Day {day}): {portfolio}")
-
-                daily_results.append(
-                    {
-                        "Day": day,
-                        "Price": current_price,
-                        "SMA_Short": sma_short,
-                        "SMA_Long": sma_long,
-                        "Cash": portfolio.cash,
-                        "Shares": portfolio.shares,
-                        "HoldingsValue": portfolio.holdings_value,
-                        "TotalValue": portfolio.total_value,
-                    },
+                a2a_outcome = await _call_alphabot_a2a(**alphabot_call_kwargs)
+
+            approved_trade = a2a_outcome["approved_trade"]
+            rejected_trade = a2a_outcome["rejected_trade"]
+            reason_text = a2a_outcome["reason"]
+            a2a_error = a2a_outcome["error"]
+
+            trade_details = approved_trade or rejected_trade
+            is_approved = approved_trade is not None
+            action = trade_details.get("action") if trade_details else None
+
+            signal_log_entry: dict[str, Any] = {
+                "day": day,
+                "log": f"Price={format_currency(current_price)}",
+            }
+
+            if a2a_error:
+                day_errors += 1
+                signal_log_entry["log"] += f" | A2A ERROR: {a2a_error}"
+                sim_logger.error("A2A Error on day %s: %s", day, a2a_error)
+            elif trade_details:
+                qty = trade_details.get("quantity")
+                price = trade_details.get("price")
+                ticker = trade_details.get("ticker", "N/A")
+                status = "Approved" if is_approved else "Rejected"
+                reason_from_outcome = reason_text or (
+                    "OK" if is_approved else "Reason not captured."
                 )
-
-                a2a_outcome = await _call_alphabot_a2a(
-                    client_factory=client_factory,
-                    httpx_client=http_client,
-                    alphabot_url=alphabot_url,
-                    session_id=a2a_session_id,
-                    day=day,
-                    current_price=current_price,
-                    historical_prices=historical_prices,
-                    portfolio=portfolio,
-                    params=params,
-                    sim_logger=sim_logger,
-                    cache=a2a_client_cache,
+                signal_log_entry["log"] += (
+                    f" | {action} {qty} {ticker} @ {format_currency(price)} | {status}: {reason_from_outcome}"
                 )
 
-                approved_trade = a2a_outcome["approved_trade"]
-                rejected_trade = a2a_outcome["rejected_trade"]
-                reason_text = a2a_outcome["reason"]
-                a2a_error = a2a_outcome["error"]
-
-                trade_details = approved_trade or rejected_trade
-                is_approved = approved_trade is not None
-                action = trade_details.get("action") if trade_details else None
-
-                signal_log_entry: dict[str, Any] = {
-                    "day": day,
-                    "log": f"Price={format_currency(current_price)}",
-                }
-
-                if a2a_error:
-                    signal_log_entry["log"] += f" | A2A ERROR: {a2a_error}"
-                    sim_logger.error(f"A2A Error on day {day}: {a2a_error}")
-                elif trade_details:
-                    qty = trade_details.get("quantity")
-                    price = trade_details.get("price")
-                    ticker = trade_details.get("ticker", "N/A")
-                    status = "Approved" if is_approved else "Rejected"
-                    reason_from_outcome = reason_text or (
-                        "OK" if is_approved else "Reason not captured."
-                    )
-                    signal_log_entry["log"] += (
-                        f" | {action} {qty} {ticker} @ {format_currency(price)} | {status}: {reason_from_outcome}"
+                if action in ("BUY", "SELL"):
+                    recorder.record_trade(
+                        day_index,
+                        action,
+                        is_approved,
+                        quantity=qty,
+                        price=price,
+                        reason=reason_from_outcome,
                     )
 
-                    if action == "BUY":
-                        if is_approved:
-                            approved_buy_days.append(day)
-                            approved_buy_prices.append(current_price)
-                        else:
-                            rejected_buy_days.append(day)
-                            rejected_buy_prices.append(current_price)
-                    elif action == "SELL":
-                        if is_approved:
-                            approved_sell_days.append(day)
-                            approved_sell_prices.append(current_price)
-                        else:
-                            rejected_sell_days.append(day)
-                            rejected_sell_prices.append(current_price)
-
-                    if is_approved:
-                        sim_logger.info(
-                            f"--- Executing Approved Trade: {action} {qty} @ {price} ---",
-                        )
-                        exec_action = trade_details.get("action")
-                        exec_qty = trade_details.get("quantity")
-                        exec_price = trade_details.get("price")
-
-                        if (
-                            exec_action
-                            and exec_qty is not None
-                            and exec_price is not None
-                        ):
-                            trade_action_enum: TradeAction | None = None
-                            if exec_action.upper() == "BUY":
-                                trade_action_enum = TradeAction.BUY
-                            elif exec_action.upper() == "SELL":
-                                trade_action_enum = TradeAction.SELL
-
-                            if trade_action_enum:
-                                trade_executed = portfolio.execute_trade(
-                                    action=trade_action_enum,
-                                    quantity=exec_qty,
-                                    price=exec_price,
+                if is_approved:
+                    sim_logger.info(
+                        "--- Executing Approved Trade: %s %s @ %s ---",
+                        action,
+                        qty,
+                        price,
+                    )
+                    exec_action = trade_details.get("action")
+                    exec_qty = trade_details.get("quantity")
+                    exec_price = trade_details.get("price")
+
+                    if exec_action and exec_qty is not None and exec_price is not None:
+                        trade_action_enum: TradeAction | None = None
+                        if exec_action.upper() == "BUY":
+                            trade_action_enum = TradeAction.BUY
+                        elif exec_action.upper() == "SELL":
+                            trade_action_enum = TradeAction.SELL
+
+                        if trade_action_enum:
+                            trade_executed = portfolio.execute_trade(
+                                action=trade_action_enum,
+                                quantity=exec_qty,
+                                price=exec_price,
+                            )
+                            if trade_executed:
+                                portfolio.update_valuation(current_price)
+                                sim_logger.info(
+                                    "Portfolio (Post-Trade Day %s): %s",
+                                    day,
+                                    replace(portfolio),
                                 )
-                                if trade_executed:
-                                    portfolio.update_valuation(current_price)
-                                    sim_logger.info(
-                                        f"Portfolio (Post-Trade Day {day}): {portfolio}",
-                                    )
-                                    signal_log_entry["log"] += " | Executed."
-                                else:
-                                    sim_logger.warning(
-                                        "--- Trade Execution FAILED (Insufficient funds/shares?) ---",
-                                    )
-                                    signal_log_entry["log"] += " | Execution FAILED."
+                                signal_log_entry["log"] += " | Executed."
                             else:
-                                sim_logger.error(
-                                    f"--- Trade Execution SKIPPED - Unknown action '{exec_action}' ---",
-                                )
-                                signal_log_entry["log"] += (
-                                    f" | Execution SKIPPED (Unknown Action: {exec_action})."
+                                sim_logger.warning(
+                                    "--- Trade Execution FAILED (Insufficient funds/shares?) ---",
                                 )
+                                signal_log_entry["log"] += " | Execution FAILED."
                         else:
                             sim_logger.error(
-                                f"--- Trade Execution SKIPPED - Missing details: {trade_details} ---",
+                                "--- Trade Execution SKIPPED - Unknown action '%s' ---",
+                                exec_action,
                             )
                             signal_log_entry["log"] += (
-                                " | Execution SKIPPED (Missing Data)."
+                                f" | Execution SKIPPED (Unknown Action: {exec_action})."
                             )
-                        sim_logger.info(
-                            f"Portfolio (After {action} attempt Day {day}): {portfolio}",
-                        )
-                    else:  # Trade was rejected
-                        sim_logger.info(
-                            f"--- Trade Rejected: {action} {qty} @ {price} (Reason: {reason_from_outcome}) ---",
+                    else:
+                        sim_logger.error(
+                            "--- Trade Execution SKIPPED - Missing details: %s ---",
+                            trade_details,
                         )
-                        sim_logger.info(
-                            f"Portfolio (Rejected Trade Day {day}): {portfolio}",
+                        signal_log_entry["log"] += (
+                            " | Execution SKIPPED (Missing Data)."
                         )
-                else:  # No trade_details and no A2A error means no trade was proposed
-                    signal_log_entry["log"] += (
-                        f" | No trade proposed by AlphaBot. Reason: {reason_text or 'N/A'}"
+                    sim_logger.info(
+                        "Portfolio (After %s attempt Day %s): %s",
+                        action,
+                        day,
+                        replace(portfolio),
+                    )
+                else:  # Trade was rejected
+                    sim_logger.info(
+                        "--- Trade Rejected: %s %s @ %s (Reason: %s) ---",
+                        action,
+                        qty,
+                        price,
+                        reason_from_outcome,
+                    )
+                    sim_logger.info(
+                        "Portfolio (Rejected Trade Day %s): %s",
+                        day,
+                        replace(portfolio),
                     )
-                    sim_logger.info(f"Portfolio (No Trade Day {day}): {portfolio}")
+            else:  # No trade_details and no A2A error means no trade was proposed
+                signal_log_entry["log"] += (
+                    f" | No trade proposed by AlphaBot. Reason: {reason_text or 'N/A'}"
+                )
+                sim_logger.info(
+                    "Portfolio (No Trade Day %s): %s",
+                    day,
+                    replace(portfolio),
+                )
 
-                signals.append(signal_log_entry)
-        # End of httpx.AsyncClient context manager
+            sim_log.end_day(traded=trade_details is not None)
+            signals.append(signal_log_entry)
+            if on_day is not None:
+                await on_day(
+                    _day_progress_event(
+                        recorder,
+                        day_index,
+                        sma_short.update(current_price),
+                        sma_long.update(current_price),
+                        action,
+                        None if trade_details is None else is_approved,
+                        signal_log_entry["log"],
+                    ),
+                )
 
         sim_logger.info("--- Simulation End ---")
-        sim_logger.info(f"Final Portfolio: {portfolio}")
+        sim_logger.info("Final Portfolio: %s", portfolio)
         signals.append({"day": total_days + 1, "log": f"Final Portfolio: {portfolio}"})
 
-        results_df = (
-            pd.DataFrame(daily_results).set_index("Day")
-            if daily_results
-            else pd.DataFrame(
-                columns=[
-                    "Day",
-                    "Price",
-                    "SMA_Short",
-                    "SMA_Long",
-                    "Cash",
-                    "Shares",
-                    "HoldingsValue",
-                    "TotalValue",
-                ],
-            ).set_index("Day")
+        results_df = recorder.to_frame()
+        trade_markers = recorder.trade_markers()
+        return _build_simulation_results(
+            results_df,
+            initial_price,
+            params,
+            trade_markers,
+            recorder.trade_events,
+            signals,
+            sim_log,
+            portfolio,
+            build_charts=build_charts,
+            defer_charts=defer_charts,
+            day_errors=day_errors,
         )
-        trade_markers: dict[str, list[Any]] = {
-            "approved_buy_days": approved_buy_days,
-            "approved_buy_prices": approved_buy_prices,
-            "rejected_buy_days": rejected_buy_days,
-            "rejected_buy_prices": rejected_buy_prices,
-            "approved_sell_days": approved_sell_days,
-            "approved_sell_prices": approved_sell_prices,
-            "rejected_sell_days": rejected_sell_days,
-            "rejected_sell_prices": rejected_sell_prices,
-        }
-        fig = _create_results_figure(results_df, params, trade_markers)
-        charts = {"combined_chart_json": fig.to_json()}
-        signals_log = "\n".join([f"Day {s['day']}: {s['log']}" for s in signals])
-        detailed_log = "\n".join(sim_log_list)
-
-        return {
-            "success": True,
-            "final_portfolio": portfolio.__dict__,
-            "charts": charts,
-            "signals_log": signals_log,
-            "detailed_log": detailed_log,
-        }
 
     except (ConnectionError, httpx.ConnectError) as ce:
         error_msg = f"Connection Error: {ce}. Ensure AlphaBot A2A server is running and accessible."
@@ -770,7 +1231,7 @@ async def run_simulation_async(params: dict[str, Any]) -> dict[str, Any]:
         return {
             "success": False,
             "error": error_msg,
-            "detailed_log": "\n".join(sim_log_list),
+            "detailed_log": sim_log.format(),
         }
     except A2AClientError as a2a_err:
         error_msg = f"A2A Client Error: {a2a_err}. Check the AlphaBot server logs for more details."
@@ -783,7 +1244,7 @@ async def run_simulation_async(params: dict[str, Any]) -> dict[str, Any]:
         return {
             "success": False,
             "error": error_msg,
-            "detailed_log": "\n".join(sim_log_list),
+            "detailed_log": sim_log.format(),
         }
     except Exception as e:  # General fallback for other unexpected errors
         error_msg = f"Unexpected Simulation Error: {e}"
@@ -792,12 +1253,465 @@ async def run_simulation_async(params: dict[str, Any]) -> dict[str, Any]:
         return {
             "success": False,
             "error": error_msg,
-            "detailed_log": "\n".join(sim_log_list),
+            "detailed_log": sim_log.format(),
         }
     finally:
-        if ui_log_handler in sim_logger.handlers:
-            sim_logger.removeHandler(ui_log_handler)
-        sim_logger.propagate = True
+        detach_simulation_log(log_token)
+
+
+def _episode_chunk_days(parts: Any) -> list[EpisodeDayOutcome]:
+    """Return the day outcomes held in an episode artifact's parts."""
+    return [
+        day
+        for data in get_data_parts(parts)
+        for day in EpisodeChunk.model_validate(data).days
+    ]
+
+
+async def run_simulation_episode(
+    params: dict[str, Any],
+    shared_clients: SharedA2AClients | None = None,
+    build_charts: bool = True,
+    defer_charts: bool = False,
+    on_day: Callable[[dict[str, Any]], Awaitable[None]] | None = None,
+) -> dict[str, Any]:
+    """Run the simulation as one AlphaBot episode task instead of a task per day.
+
+    The whole price path is drawn up front and sent with the starting
+    portfolio; AlphaBot runs the day loop, RiskGuard checks and trade
+    execution, and streams the day outcomes back as chunks of its "episode"
+    artifact. Each day is recorded, logged and reported to `on_day` as its
+    chunk arrives. The output has the same structure as `run_simulation_async`.
+
+    Args:
+        params: Simulation parameters, as produced by `SimulationRunParams.to_dict()`.
+        shared_clients: Clients to reuse across runs; by default the run uses
+            the pooled httpx client and its own A2A client.
+        build_charts: Whether to build the results chart.
+        defer_charts: Whether to leave the chart to `/results/{run_id}/chart`.
+        on_day: Awaited with a progress event (see `_day_progress_event`) as
+            soon as each day's outcome arrives.
+
+    """
+    logger.info(f"--- Starting Episode Simulation with params: {params} ---")
+    sim_log = _new_simulation_log(params)
+    log_token = attach_simulation_log(sim_log)
+    signals: list[dict[str, Any]] = []
+    alphabot_url = params.get(
+        "alphabot_url",
+        os.environ.get("ALPHABOT_SERVICE_URL", defaults.DEFAULT_ALPHABOT_URL),
+    ).rstrip("/")
+
+    try:
+        portfolio = PortfolioState(cash=params["sim_initial_cash"])
+        market_sim = _create_market_data_source(params, sim_logger)
+        initial_price = market_sim.get_current_price()
+        # Copied, as the history view is only valid until the next price.
+        historical_prices = market_sim.get_history_view().tolist()
+        sma_short = RollingSMA(params["alphabot_short_sma"])
+        sma_long = RollingSMA(params["alphabot_long_sma"])
+        sma_short.update(initial_price)
+        sma_long.update(initial_price)
+
+        total_days = params["sim_days"]
+        remaining_days = market_sim.remaining_days
+        if remaining_days is not None and remaining_days < total_days:
+            sim_logger.warning(
+                "Market data only has %s more days; shortening the run.",
+                remaining_days,
+            )
+            total_days = remaining_days
+        prices = np.fromiter(
+            (market_sim.next_price() for _ in range(total_days)),
+            dtype=np.float64,
+            count=total_days,
+        )
+        recorder = SimulationRecorder(total_days)
+
+        initial_portfolio_str = f"Initial Portfolio: {portfolio}"
+        sim_logger.info(initial_portfolio_str)
+        signals.append({"day": 0, "log": initial_portfolio_str})
+
+        async def _record_outcome(outcome: EpisodeDayOutcome) -> None:
+            sim_log.begin_day()
+            sim_logger.info("===== Day %s =====", outcome.day)
+            price = outcome.price
+            portfolio.update_valuation(price)
+            sim_logger.info(
+                "Portfolio (Start Day %s): %s",
+                outcome.day,
+                replace(portfolio),
+            )
+            day_index = recorder.record_day(
+                price,
+                portfolio.cash,
+                portfolio.shares,
+                portfolio.holdings_value,
+                portfolio.total_value,
+            )
+            log_entry = f"Price={format_currency(price)}"
+            proposal = outcome.trade_proposal
+            approved = outcome.status == TradeStatus.APPROVED
+            if proposal is not None:
+                status = "Approved" if approved else "Rejected"
+                log_entry += (
+                    f" | {proposal.action} {proposal.quantity} {proposal.ticker} "
+                    f"@ {format_currency(proposal.price)} | {status}: {outcome.reason}"
+                )
+                if approved:
+                    log_entry += (
+                        " | Executed." if outcome.executed else " | Execution FAILED."
+                    )
+                recorder.record_trade(
+                    day_index,
+                    proposal.action,
+                    approved,
+                    quantity=proposal.quantity,
+                    price=proposal.price,
+                    reason=outcome.reason,
+                )
+            else:
+                log_entry += (
+                    f" | No trade proposed by AlphaBot. Reason: {outcome.reason}"
+                )
+            sim_logger.info("%s", log_entry)
+
+            portfolio.cash = outcome.portfolio_state.cash
+            portfolio.shares = outcome.portfolio_state.shares
+            portfolio.update_valuation(price)
+            sim_log.end_day(traded=proposal is not None)
+            signals.append({"day": outcome.day, "log": log_entry})
+            if on_day is not None:
+                await on_day(
+                    _day_progress_event(
+                        recorder,
+                        day_index,
+                        sma_short.update(price),
+                        sma_long.update(price),
+                        proposal.action if proposal is not None else None,
+                        approved if proposal is not None else None,
+                        log_entry,
+                    ),
+                )
+
+        episode_error = None
+        if total_days:
+            payload = AlphaBotEpisodePayload(
+                historical_prices=historical_prices,
+                prices=prices,
+                portfolio_state=CommonPortfolioState(
+                    cash=portfolio.cash,
+                    shares=portfolio.shares,
+                    total_value=portfolio.total_value,
+                ),
+                short_sma_period=params["alphabot_short_sma"],
+                long_sma_period=params["alphabot_long_sma"],
+                trade_quantity=params["alphabot_trade_qty"],
+                riskguard_url=params["riskguard_url"],
+                max_pos_size=params["riskguard_max_pos_size"],
+                max_concentration=params["riskguard_max_concentration"] / 100.0,
+            )
+            a2a_session_id = f"sim-session-{uuid.uuid4().hex[:8]}"
+            sim_logger.info(
+                "Sending a %s-day episode to %s (Session ID: %s)",
+                total_days,
+                alphabot_url,
+                a2a_session_id,
+            )
+            http_client = (
+                shared_clients.http_client
+                if shared_clients is not None
+                else http_pool.get_client()
+            )
+            a2a_sdk_client = await _resolve_alphabot_client(
+                ClientFactory(config=ClientConfig(httpx_client=http_client)),
+                http_client,
+                alphabot_url,
+                shared_clients.cache if shared_clients is not None else None,
+                cache_key="a2a_episode_client",
+            )
+            request = SendMessageRequest(
+                message=A2AMessage(
+                    message_id=f"msg-{uuid.uuid4().hex[:8]}",
+                    role=Role.ROLE_USER,
+                    parts=[new_data_part(payload.model_dump(mode="json"))],
+                    context_id=a2a_session_id,
+                ),
+            )
+            # Chunks arrive as artifact updates when streaming, or all in
+            # the completed task otherwise; days already recorded are skipped.
+            async for event in a2a_sdk_client.send_message(request):
+                outcomes: list[EpisodeDayOutcome] = []
+                if event.HasField("artifact_update"):
+                    if event.artifact_update.artifact.name == "episode":
+                        outcomes = _episode_chunk_days(
+                            event.artifact_update.artifact.parts,
+                        )
+                elif event.HasField("task"):
+                    for artifact in event.task.artifacts:
+                        if artifact.name == "episode":
+                            outcomes.extend(_episode_chunk_days(artifact.parts))
+                    if event.task.status.state == TaskState.TASK_STATE_FAILED:
+                        episode_error = "AlphaBot task execution failed."
+                elif (
+                    event.HasField("status_update")
+                    and event.status_update.status.state == TaskState.TASK_STATE_FAILED
+                ):
+                    episode_error = "AlphaBot task execution failed."
+                for outcome in outcomes:
+                    if outcome.day == recorder.num_recorded + 1:
+                        await _record_outcome(outcome)
+
+        if recorder.num_recorded < total_days:
+            error_msg = (
+                f"AlphaBot episode ended after {recorder.num_recorded} of {total_days} days"
+                f"{f': {episode_error}' if episode_error else '.'}"
+            )
+            sim_logger.error("%s", error_msg)
+            return {
+                "success": False,
+                "error": error_msg,
+                "detailed_log": sim_log.format(),
+            }
+
+        sim_logger.info("--- Simulation End ---")
+        sim_logger.info("Final Portfolio: %s", portfolio)
+        signals.append({"day": total_days + 1, "log": f"Final Portfolio: {portfolio}"})
+
+        return _build_simulation_results(
+            recorder.to_frame(),
+            initial_price,
+            params,
+            recorder.trade_markers(),
+            recorder.trade_events,
+            signals,
+            sim_log,
+            portfolio,
+            build_charts=build_charts,
+            defer_charts=defer_charts,
+        )
+
+    except (ConnectionError, httpx.ConnectError, A2AClientError) as ce:
+        if is_connection_error(ce):
+            agent_cards.invalidate(alphabot_url)
+        error_msg = f"Connection Error: {ce}. Ensure AlphaBot A2A server is running and accessible."
+        logger.exception(error_msg)
+        sim_logger.exception(error_msg)
+        return {
+            "success": False,
+            "error": error_msg,
+            "detailed_log": sim_log.format(),
+        }
+    except Exception as e:  # General fallback for other unexpected errors
+        error_msg = f"Unexpected Simulation Error: {e}"
+        logger.exception("Unexpected Simulation Error")
+        sim_logger.exception("Unexpected Simulation Error")
+        return {
+            "success": False,
+            "error": error_msg,
+            "detailed_log": sim_log.format(),
+        }
+    finally:
+        detach_simulation_log(log_token)
+
+
+def run_simulation_vectorized(
+    params: dict[str, Any],
+    build_charts: bool = True,
+    defer_charts: bool = False,
+) -> dict[str, Any]:
+    """Run the simulation in process with the vectorized backtest engine.
+
+    Prices come from the same market data source as `run_simulation_async`, so
+    a seeded or replayed run sees the same path, and the backtest applies
+    AlphaBot's crossover logic, RiskGuard's rules and the portfolio's trade
+    execution without any A2A calls. The output has the same structure as
+    `run_simulation_async`; the signals log lists trade days only.
+
+    Args:
+        params: Simulation parameters, as produced by `SimulationRunParams.to_dict()`.
+        build_charts: Whether to build the results chart.
+        defer_charts: Whether to leave the chart to `/results/{run_id}/chart`.
+
+    """
+    # RiskGuard's package loads its agent, so the rules are imported on first use.
+    from riskguard.rules import check_trade_risk_logic
+
+    logger.info(f"--- Starting Vectorized Simulation with params: {params} ---")
+    sim_log = _new_simulation_log(params)
+    log_token = attach_simulation_log(sim_log)
+    try:
+        portfolio = PortfolioState(cash=params["sim_initial_cash"])
+        market_sim = _create_market_data_source(params, sim_logger)
+        initial_price = market_sim.get_current_price()
+        signals: list[dict[str, Any]] = [
+            {"day": 0, "log": f"Initial Portfolio: {portfolio}"},
+        ]
+
+        total_days = params["sim_days"]
+        remaining_days = market_sim.remaining_days
+        if remaining_days is not None and remaining_days < total_days:
+            sim_logger.warning(
+                "Market data only has %s more days; shortening the run.",
+                remaining_days,
+            )
+            total_days = remaining_days
+        prices = np.fromiter(
+            (market_sim.next_price() for _ in range(total_days)),
+            dtype=np.float64,
+            count=total_days,
+        )
+        sim_logger.info("Running vectorized backtest over %s days...", total_days)
+
+        trade_quantity = params["alphabot_trade_qty"]
+        max_concentration = params["riskguard_max_concentration"] / 100.0
+        result = run_sma_crossover_backtest(
+            prices,
+            initial_price=initial_price,
+            short_period=params["alphabot_short_sma"],
+            long_period=params["alphabot_long_sma"],
+            trade_quantity=trade_quantity,
+            initial_cash=params["sim_initial_cash"],
+            max_pos_size=params["riskguard_max_pos_size"],
+            max_concentration=max_concentration,
+        )
+        cash, shares, total_value = (
+            result.cash[0],
+            result.shares[0],
+            result.total_value[0],
+        )
+        actions, approved = result.actions[0], result.approved[0]
+
+        recorder = SimulationRecorder.from_arrays(
+            prices,
+            cash,
+            shares,
+            total_value,
+            actions,
+            approved,
+        )
+
+        # Only trade days need a log line, so RiskGuard's scalar rules are re-run
+        # there to recover the reasons the vectorized check does not carry.
+        for index in np.flatnonzero(actions != ACTION_NONE):
+            action = "BUY" if actions[index] == ACTION_BUY else "SELL"
+            price = float(prices[index])
+            risk_result = check_trade_risk_logic(
+                TradeProposal(
+                    action=action,
+                    ticker=defaults.DEFAULT_TICKER,
+                    quantity=trade_quantity,
+                    price=price,
+                ),
+                CommonPortfolioState(
+                    cash=float(cash[index]),
+                    shares=int(shares[index]),
+                    total_value=float(total_value[index]),
+                ),
+                max_pos_size=params["riskguard_max_pos_size"],
+                max_concentration=max_concentration,
+            )
+            recorder.record_trade(
+                int(index),
+                action,
+                bool(approved[index]),
+                quantity=trade_quantity,
+                price=price,
+                reason=risk_result.reason,
+            )
+            status = "Approved" if approved[index] else "Rejected"
+            log_entry = (
+                f"Price={format_currency(price)} | {action} {trade_quantity} "
+                f"{defaults.DEFAULT_TICKER} @ {format_currency(price)} | {status}: {risk_result.reason}"
+            )
+            if approved[index]:
+                executed = (
+                    trade_quantity * price <= cash[index]
+                    if action == "BUY"
+                    else trade_quantity <= shares[index]
+                )
+                log_entry += " | Executed." if executed else " | Execution FAILED."
+            signals.append({"day": int(index) + 1, "log": log_entry})
+
+        if total_days:
+            portfolio.cash = float(result.final_cash[0])
+            portfolio.shares = int(result.final_shares[0])
+            portfolio.update_valuation(float(prices[-1]))
+        sim_logger.info(
+            "Vectorized backtest finished: %s trades executed.",
+            int(approved.sum()),
+        )
+        sim_logger.info("Final Portfolio: %s", portfolio)
+        signals.append({"day": total_days + 1, "log": f"Final Portfolio: {portfolio}"})
+
+        return _build_simulation_results(
+            recorder.to_frame(),
+            initial_price,
+            params,
+            recorder.trade_markers(),
+            recorder.trade_events,
+            signals,
+            sim_log,
+            portfolio,
+            build_charts=build_charts,
+            defer_charts=defer_charts,
+        )
+    except Exception as e:
+        error_msg = f"Unexpected Simulation Error: {e}"
+        logger.exception("Unexpected Simulation Error")
+        sim_logger.exception("Unexpected Simulation Error")
+        return {
+            "success": False,
+            "error": error_msg,
+            "detailed_log": sim_log.format(),
+        }
+    finally:
+        detach_simulation_log(log_token)
+
+
+def run_simulation_job(
+    params: dict[str, Any],
+    build_charts: bool = False,
+) -> dict[str, Any]:
+    """Run one simulation to completion, for use in a worker process.
+
+    A2A runs get their own event loop, and so their own pooled httpx client. Only the compact
+    results (no logs) are returned, to keep what crosses the process
+    boundary small.
+    """
+    if params.get("engine") == "vectorized":
+        results = run_simulation_vectorized(params, build_charts=build_charts)
+    else:
+        results = asyncio.run(run_simulation_async(params, build_charts=build_charts))
+    return compact_simulation_results(results)
+
+
+async def _run_queued_simulation(job: SimulationJob) -> dict[str, Any]:
+    """Run a queued simulation job, recording its progress on the job."""
+    if job.params["engine"] == "vectorized":
+        results = await asyncio.to_thread(run_simulation_vectorized, job.params)
+        job.days_completed = job.total_days
+        return results
+
+    async def _on_day(event: dict[str, Any]) -> None:
+        job.days_completed = event["day"]
+
+    return await run_simulation_async(job.params, on_day=_on_day)
+
+
+simulation_jobs = SimulationJobQueue(
+    _run_queued_simulation,
+    state_dir=os.environ.get("SIMULATION_JOB_DIR", defaults.DEFAULT_SIMULATION_JOB_DIR),
+    max_workers=int(
+        os.environ.get(
+            "SIMULATION_JOB_WORKERS",
+            defaults.DEFAULT_SIMULATION_JOB_WORKERS,
+        ),
+    ),
+    max_queued=defaults.MAX_QUEUED_SIMULATION_JOBS,
+    max_finished=defaults.DEFAULT_SIMULATION_JOB_RETENTION,
+    finished_ttl=timedelta(hours=defaults.DEFAULT_SIMULATION_JOB_TTL_HOURS),
+)
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -880,6 +1794,31 @@ class SimulationRunParams(BaseModel):
         le=0.1,
         description="Trend for market simulation (-0.1 to 0.1).",
     )
+    seed: int | None = Field(
+        None,
+        ge=0,
+        description="Seed for the market price path; leave unset for a random path.",
+    )
+    incremental_payloads: bool = Field(
+        False,
+        description="Send AlphaBot only each day's new price; it keeps the window in its session.",
+    )
+    engine: SimulationEngine = Field(
+        "a2a",
+        description="Run through the A2A agents (a call per day, or one episode call), or in process with the vectorized backtest.",
+    )
+    log_verbosity: LogVerbosity = Field(
+        "trades",
+        description="Days kept in the detailed log: trade and error days, error records only, or all.",
+    )
+    replay_file: str | None = Field(
+        None,
+        description="Replay file in the market data directory; replaces the generated path.",
+    )
+    replay_symbol: str | None = Field(
+        None,
+        description="Symbol to replay from the replay file (defaults to its first symbol).",
+    )
     riskguard_url: str = Field(
         defaults.DEFAULT_RISKGUARD_URL,
         description="URL for RiskGuard service.",
@@ -900,6 +1839,15 @@ class SimulationRunParams(BaseModel):
         description="URL for AlphaBot service.",
     )
 
+    def cache_key(self) -> str:
+        """Return a canonical hash of the parameters, for caching seeded runs."""
+        canonical = json.dumps(
+            self.model_dump(mode="json"),
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
     def to_dict(self) -> dict[str, Any]:
         """Return a dictionary representation of the model."""
         # Convert concentration back to float 0.0-1.0 for internal use if needed,
@@ -908,6 +1856,93 @@ class SimulationRunParams(BaseModel):
         return self.model_dump()
 
 
+class EnsembleRunParams(SimulationRunParams):
+    """Parameters for a Monte Carlo ensemble run over many simulated price paths."""
+
+    num_paths: int = Field(
+        defaults.DEFAULT_ENSEMBLE_PATHS,
+        gt=0,
+        le=100000,
+        description="Number of independent price paths to simulate (1-100000).",
+    )
+    bootstrap_samples: int = Field(
+        defaults.DEFAULT_ENSEMBLE_BOOTSTRAP_SAMPLES,
+        gt=0,
+        le=10000,
+        description="Bootstrap resamples per metric confidence interval (1-10000).",
+    )
+    confidence_level: float = Field(
+        defaults.DEFAULT_ENSEMBLE_CONFIDENCE_LEVEL,
+        gt=0,
+        lt=1,
+        description="Coverage of the bootstrap confidence intervals (0-1).",
+    )
+
+    @model_validator(mode="after")
+    def _check_ensemble_size(self) -> "EnsembleRunParams":
+        """Reject ensembles whose arrays would not fit comfortably in memory."""
+        path_days = self.num_paths * self.sim_days
+        if path_days > defaults.MAX_ENSEMBLE_PATH_DAYS:
+            msg = f"Ensemble has {path_days} path days (num_paths x sim_days); the limit is {defaults.MAX_ENSEMBLE_PATH_DAYS}."
+            raise ValueError(msg)
+        bootstrap_draws = self.bootstrap_samples * self.num_paths
+        if bootstrap_draws > defaults.MAX_ENSEMBLE_BOOTSTRAP_DRAWS:
+            msg = f"Ensemble has {bootstrap_draws} bootstrap draws (bootstrap_samples x num_paths); the limit is {defaults.MAX_ENSEMBLE_BOOTSTRAP_DRAWS}."
+            raise ValueError(msg)
+        return self
+
+
+class SweepRunParams(SimulationRunParams):
+    """Parameters for a sweep over combinations of simulation parameters.
+
+    The inherited fields are shared by every run; each swept parameter takes
+    its values from `sweep` instead.
+    """
+
+    alphabot_short_sma: int = Field(
+        defaults.DEFAULT_ALPHABOT_SHORT_SMA,
+        gt=0,
+        description="Short window for AlphaBot SMA (must be > 0).",
+    )
+    sweep: dict[SweepField, list[int | float] | SweepRange] = Field(
+        ...,
+        min_length=1,
+        description="Values, or a {start, stop, step} range, for each swept parameter.",
+    )
+    max_concurrency: int = Field(
+        defaults.DEFAULT_SWEEP_CONCURRENCY,
+        gt=0,
+        le=64,
+        description="Maximum number of simulations run at once (1-64).",
+    )
+    use_process_pool: bool = Field(
+        False,
+        description="Run each combination in a worker process, spreading the CPU work across cores.",
+    )
+
+    @model_validator(mode="after")
+    def _check_combinations(self) -> "SweepRunParams":
+        """Reject oversized sweeps and combinations that are not valid runs."""
+        _, combinations = expand_sweep(self.sweep)
+        if len(combinations) > defaults.MAX_SWEEP_COMBINATIONS:
+            msg = f"Sweep has {len(combinations)} combinations; the limit is {defaults.MAX_SWEEP_COMBINATIONS}."
+            raise ValueError(msg)
+        base_params = self.run_params()
+        for combination in combinations:
+            try:
+                SimulationRunParams.model_validate({**base_params, **combination})
+            except ValidationError as e:
+                msg = f"Invalid sweep combination {combination}: {e.errors()[0]['msg']}"
+                raise ValueError(msg) from e
+        return self
+
+    def run_params(self) -> dict[str, Any]:
+        """Return the parameters shared by every run, without the sweep settings."""
+        return self.model_dump(
+            exclude={"sweep", "max_concurrency", "use_process_pool"},
+        )
+
+
 def _render_error_page(
     request: Request,
     error_message: str,
@@ -958,6 +1993,12 @@ async def handle_run_simulation(
     sim_initial_price: Annotated[float, Form()] = defaults.DEFAULT_SIM_INITIAL_PRICE,
     sim_volatility: Annotated[float, Form()] = defaults.DEFAULT_SIM_VOLATILITY,
     sim_trend: Annotated[float, Form()] = defaults.DEFAULT_SIM_TREND,
+    seed: Annotated[int | None, Form()] = None,
+    incremental_payloads: Annotated[bool, Form()] = False,
+    engine: Annotated[SimulationEngine, Form()] = "a2a",
+    log_verbosity: Annotated[LogVerbosity, Form()] = "trades",
+    replay_file: Annotated[str | None, Form()] = None,
+    replay_symbol: Annotated[str | None, Form()] = None,
     riskguard_url: Annotated[str, Form()] = os.environ.get(
         "RISKGUARD_SERVICE_URL",
         defaults.DEFAULT_RISKGUARD_URL,
@@ -975,9 +2016,8 @@ async def handle_run_simulation(
     ),  # Get from env or default
 ):
     """Handle the simulation run request, validating parameters via Pydantic."""
-    # Note: We're removing the check for concurrent simulations as it was causing race conditions
-    # with the global simulation_status dictionary. In a production environment, you might want
-    # to implement a proper queuing mechanism or allow concurrent simulations with proper isolation.
+    # Form runs are not queued: each one runs in this request, concurrently with the
+    # others. POST /jobs queues runs behind the bounded simulation job workers instead.
 
     form_values = {
         "alphabot_short_sma": alphabot_short_sma,
@@ -988,6 +2028,12 @@ async def handle_run_simulation(
         "sim_initial_price": sim_initial_price,
         "sim_volatility": sim_volatility,
         "sim_trend": sim_trend,
+        "seed": seed,
+        "incremental_payloads": incremental_payloads,
+        "engine": engine,
+        "log_verbosity": log_verbosity,
+        "replay_file": replay_file,
+        "replay_symbol": replay_symbol,
         "riskguard_url": riskguard_url,
         "riskguard_max_pos_size": riskguard_max_pos_size,
         "riskguard_max_concentration": riskguard_max_concentration,
@@ -1004,6 +2050,12 @@ async def handle_run_simulation(
             sim_initial_price=sim_initial_price,
             sim_volatility=sim_volatility,
             sim_trend=sim_trend,
+            seed=seed,
+            incremental_payloads=incremental_payloads,
+            engine=engine,
+            log_verbosity=log_verbosity,
+            replay_file=replay_file or None,
+            replay_symbol=replay_symbol or None,
             riskguard_url=riskguard_url.rstrip("/"),  # Ensure no trailing slash
             riskguard_max_pos_size=riskguard_max_pos_size,
             riskguard_max_concentration=riskguard_max_concentration,
@@ -1027,7 +2079,24 @@ async def handle_run_simulation(
 
     logger.info(f"Received simulation request with validated params: {params_dict}")
 
-    results = await run_simulation_async(params_dict)
+    async def _run() -> dict[str, Any]:
+        if sim_params.engine == "vectorized":
+            # CPU-bound, so keep it off the event loop.
+            return await asyncio.to_thread(
+                run_simulation_vectorized,
+                params_dict,
+                defer_charts=True,
+            )
+        return await run_simulation_async(params_dict, defer_charts=True)
+
+    # A seed makes the run deterministic, so identical requests can share results.
+    if sim_params.seed is None:
+        results = await _run()
+    else:
+        results = await simulation_results_cache.get_or_run(
+            sim_params.cache_key(),
+            _run,
+        )
 
     # Render the results directly in the template
     template_context = {
@@ -1073,12 +2142,254 @@ async def handle_run_simulation(
     )
 
 
+async def _simulation_stream_events(
+    params: dict[str, Any],
+) -> AsyncIterator[dict[str, str]]:
+    """Run a simulation and yield its progress as server-sent events.
+
+    Yields a `start` event with the parameters, a `day` event per simulated
+    day and then either `complete` (final portfolio, metrics, chart and log)
+    or `error`. Vectorized runs finish in one step, so they skip the day
+    events. The day events go through a bounded queue: a slow client pauses
+    the run instead of buffering it, and a disconnect cancels it.
+    """
+    queue: asyncio.Queue[dict[str, str] | None] = asyncio.Queue(
+        maxsize=defaults.SIMULATION_STREAM_BUFFER_DAYS,
+    )
+
+    async def _on_day(event: dict[str, Any]) -> None:
+        await queue.put({"event": "day", "data": json.dumps(event)})
+
+    async def _produce() -> None:
+        try:
+            if params["engine"] == "vectorized":
+                results = await asyncio.to_thread(run_simulation_vectorized, params)
+            else:
+                results = await run_simulation_async(params, on_day=_on_day)
+            if results.get("success"):
+                event = {
+                    "event": "complete",
+                    "data": json.dumps(
+                        {
+                            **compact_simulation_results(results),
+                            "signals_log": results["signals_log"],
+                        },
+                    ),
+                }
+            else:
+                event = {
+                    "event": "error",
+                    "data": json.dumps(
+                        {
+                            "error": results.get("error"),
+                            "detailed_log": results.get("detailed_log"),
+                        },
+                    ),
+                }
+            await queue.put(event)
+        except Exception as e:
+            logger.exception("Streaming simulation failed")
+            await queue.put(
+                {
+                    "event": "error",
+                    "data": json.dumps(
+                        {"error": f"Unexpected error: {e}", "detailed_log": None},
+                    ),
+                },
+            )
+        finally:
+            # End the stream, unless the run was cancelled as its reader left.
+            task = asyncio.current_task()
+            if task is None or not task.cancelling():
+                await queue.put(None)
+
+    producer = asyncio.create_task(_produce())
+    try:
+        yield {"event": "start", "data": json.dumps(params)}
+        while (event := await queue.get()) is not None:
+            yield event
+    finally:
+        producer.cancel()
+
+
+@app.get("/run_simulation/stream")
+async def handle_run_simulation_stream(
+    sim_params: Annotated[SimulationRunParams, Query()],
+) -> EventSourceResponse:
+    """Stream a simulation's progress day by day as server-sent events.
+
+    Takes the same parameters as the form, as query parameters, so the page
+    can open it with an `EventSource`. See `_simulation_stream_events` for the
+    events sent.
+    """
+    params_dict = {
+        **sim_params.to_dict(),
+        "riskguard_url": sim_params.riskguard_url.rstrip("/"),
+        "alphabot_url": sim_params.alphabot_url.rstrip("/"),
+    }
+    logger.info(f"Received streaming simulation request with params: {params_dict}")
+    return EventSourceResponse(_simulation_stream_events(params_dict))
+
+
+@app.post("/jobs", status_code=202)
+async def handle_submit_job(sim_params: SimulationRunParams) -> SimulationJob:
+    """Queue a simulation and return its job at once.
+
+    The job runs on the simulation job queue's workers; poll
+    `GET /jobs/{job_id}` for its progress and fetch `GET /jobs/{job_id}/result`
+    once it has finished.
+    """
+    try:
+        return simulation_jobs.submit(sim_params.to_dict())
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e)) from e
+
+
+@app.get("/jobs/{job_id}")
+async def handle_get_job(job_id: str) -> SimulationJob:
+    """Return a simulation job's status and progress."""
+    job = simulation_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job '{job_id}'.")
+    return job
+
+
+@app.get("/jobs/{job_id}/result")
+async def handle_get_job_result(job_id: str) -> dict[str, Any]:
+    """Return a finished simulation job's results."""
+    job = simulation_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job '{job_id}'.")
+    results = simulation_jobs.result(job_id)
+    if results is None:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Job '{job_id}' has not finished (status: {job.status}).",
+        )
+    return results
+
+
+@app.post("/run_ensemble")
+def handle_run_ensemble(ensemble_params: EnsembleRunParams) -> EnsembleSummary:
+    """Run the strategy over many simulated paths and return outcome distributions.
+
+    The ensemble is evaluated in process with the vectorized backtest instead of
+    calling the agents over A2A, so it is declared sync and runs in FastAPI's
+    threadpool rather than blocking the event loop.
+    """
+    return run_monte_carlo_ensemble(
+        ensemble_params.to_dict(),
+        num_paths=ensemble_params.num_paths,
+        seed=ensemble_params.seed,
+        num_bootstrap=ensemble_params.bootstrap_samples,
+        confidence_level=ensemble_params.confidence_level,
+    )
+
+
+@app.post("/run_sweep")
+async def handle_run_sweep(sweep_params: SweepRunParams) -> SweepResult:
+    """Run the simulation for every combination of the swept parameters.
+
+    Every run uses the same price path: the given seed, or one seed drawn for
+    the whole sweep. A2A runs share the pooled httpx client and one A2A
+    client, but each gets its own context ID and so its own AlphaBot session.
+    With `use_process_pool`, runs go to the simulation process pool instead
+    (with at most `max_concurrency` in flight) and use that process's pool.
+    """
+    base_params = sweep_params.run_params()
+    if base_params["seed"] is None:
+        base_params["seed"] = random.randrange(2**32)
+
+    shared_clients = SharedA2AClients(http_pool.get_client())
+
+    async def _run(params: dict[str, Any]) -> dict[str, Any]:
+        run_params = SimulationRunParams.model_validate(params).to_dict()
+        if sweep_params.use_process_pool:
+            return await simulation_pool.run(run_simulation_job, run_params)
+        if sweep_params.engine == "vectorized":
+            return await asyncio.to_thread(
+                run_simulation_vectorized,
+                run_params,
+                build_charts=False,
+            )
+        return await run_simulation_async(
+            run_params,
+            shared_clients=shared_clients,
+            build_charts=False,
+        )
+
+    return await run_parameter_sweep(
+        base_params,
+        sweep_params.sweep,
+        _run,
+        max_concurrency=sweep_params.max_concurrency,
+    )
+
+
+@app.get("/results/{run_id}/chart")
+async def handle_get_results_chart(run_id: str) -> Response:
+    """Return a run's results chart as Plotly JSON, building it on first request."""
+    chart_json = await simulation_artifacts.get(run_id, "chart")
+    if chart_json is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No chart for run '{run_id}'; it may have expired.",
+        )
+    return Response(content=chart_json, media_type="application/json")
+
+
+@app.get("/results/{run_id}/log")
+async def handle_get_results_log(run_id: str) -> PlainTextResponse:
+    """Return a run's detailed log as text, formatting it on first request."""
+    detailed_log = await simulation_artifacts.get(run_id, "log")
+    if detailed_log is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No detailed log for run '{run_id}'; it may have expired.",
+        )
+    return PlainTextResponse(detailed_log)
+
+
+@app.get("/results/{run_id}/export/{table}")
+async def handle_export_results(
+    run_id: str,
+    table: ExportTable,
+    export_format: Annotated[ExportFormat, Query(alias="format")] = "arrow",
+) -> Response:
+    """Return a run's daily results or trade events as Arrow IPC or Parquet.
+
+    The table is written on first request. `daily` has one row per simulated
+    day (start-of-day portfolio); `trades` has one row per trade proposal
+    (day, action, quantity, price, approved, reason).
+    """
+    content = await simulation_artifacts.get(run_id, f"{table}.{export_format}")
+    if content is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No results for run '{run_id}'; they may have expired.",
+        )
+    media_type, extension = EXPORT_FORMATS[export_format]
+    return Response(
+        content=content,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{run_id}-{table}.{extension}"',
+        },
+    )
+
+
 @app.get("/health")
 async def health_check():
     """Return a simple health check endpoint."""
     return {"status": "ok"}
 
 
+@app.get("/http_pool")
+async def handle_get_http_pool_stats() -> HttpPoolStats:
+    """Return the statistics of the pooled HTTP client used for A2A calls."""
+    return http_pool.stats()
+
+
 if __name__ == "__main__":
     import uvicorn
 
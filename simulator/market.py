@@ -1,10 +1,106 @@
 """Simulates market price movements for trading algorithm testing."""
 
 import random
-from collections import deque
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
+import numpy as np
+import numpy.typing as npt
 
-class MarketDataSimulator:
+from common.config import DEFAULT_SIM_BLOCK_SIZE
+from common.utils.ring_buffer import PriceWindow
+
+MIN_PRICE: float = 1.0
+
+
+def simulate_price_paths(
+    initial_price: float | npt.ArrayLike,
+    volatility: float,
+    trend: float,
+    num_days: int,
+    rng: np.random.Generator,
+    num_paths: int | None = None,
+) -> npt.NDArray[np.float64]:
+    """Generate whole price paths in one vectorized draw.
+
+    Each day applies `price *= 1 + N(trend, volatility)` and floors the result
+    at `MIN_PRICE`, exactly like `MarketDataSimulator.next_price()`. The floor
+    makes the recursion path dependent, so it is evaluated in log space as a
+    random walk reflected at log(MIN_PRICE), which only needs a cumulative sum
+    and a running minimum.
+
+    Args:
+        initial_price: The price before the first simulated day. An array gives
+            one starting price per path.
+        volatility: The standard deviation of the daily price change percentage.
+        trend: The average daily price change percentage (drift).
+        num_days: The number of days to generate.
+        rng: The NumPy generator to draw the daily changes from.
+        num_paths: If given, generate this many independent paths.
+
+    Returns:
+        An array of shape `(num_days,)`, or `(num_paths, num_days)` when
+        `num_paths` is given, excluding the initial price.
+
+    """
+    shape = (num_days,) if num_paths is None else (num_paths, num_days)
+    changes = rng.normal(trend, volatility, size=shape)
+    start = np.asarray(initial_price, dtype=np.float64)
+    if num_paths is not None and start.ndim == 1:
+        start = start[:, np.newaxis]
+    return _apply_daily_changes(start, changes)
+
+
+def _apply_daily_changes(
+    initial_price: float | npt.NDArray[np.float64],
+    changes: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """Compound daily percentage changes along the last axis, flooring at MIN_PRICE."""
+    # A change of -100% or worse sends the price straight to the floor.
+    log_returns = np.log(np.maximum(1.0 + changes, np.finfo(np.float64).tiny))
+    log_start = np.log(np.asarray(initial_price, dtype=np.float64) / MIN_PRICE)
+    walk = log_start + np.cumsum(log_returns, axis=-1)
+    reflected = walk - np.minimum(np.minimum.accumulate(walk, axis=-1), 0.0)
+    return MIN_PRICE * np.exp(reflected)
+
+
+class MarketDataSource(ABC):
+    """A day-by-day stream of prices for the simulation loop.
+
+    `next_price()` advances one day; `get_historical_prices()` returns the
+    recent window (oldest first, ending with the current price) that AlphaBot
+    uses for its indicators.
+    """
+
+    @abstractmethod
+    def next_price(self) -> float:
+        """Advance one day and return the new price."""
+
+    @abstractmethod
+    def get_historical_prices(self) -> list[float]:
+        """Return the recent price window, oldest first."""
+
+    @abstractmethod
+    def get_current_price(self) -> float:
+        """Return the most recent price."""
+
+    def get_history_view(self) -> npt.NDArray[np.float64]:
+        """Return the recent price window as a read-only array, oldest first.
+
+        Sources that store prices in an array return a view of it without
+        copying; the view is only valid until the next call to `next_price()`.
+        """
+        window = np.array(self.get_historical_prices(), dtype=np.float64)
+        window.flags.writeable = False
+        return window
+
+    @property
+    def remaining_days(self) -> int | None:
+        """Return how many more days can be streamed, or None if unbounded."""
+        return None
+
+
+class MarketDataSimulator(MarketDataSource):
     """Generates a stream of simulated market prices."""
 
     def __init__(
@@ -13,33 +109,73 @@ class MarketDataSimulator:
         volatility: float = 0.02,
         trend: float = 0.0005,
         history_size: int = 60,
+        seed: int | None = None,
+        block_size: int | None = None,
     ) -> None:
         """Initialize the market data simulator.
 
+        Passing a `seed` or a `block_size` switches the simulator to block mode:
+        prices are drawn `block_size` days at a time from a dedicated NumPy
+        generator and `next_price()` reads them from that buffer. Without either,
+        each price is drawn from the global `random` module as before.
+
         Args:
             initial_price: The starting price for the simulation.
             volatility: The standard deviation of the daily price change percentage.
             trend: The average daily price change percentage (drift).
             history_size: The maximum number of historical prices to store.
+            seed: Seed for the NumPy generator, making the price path reproducible.
+            block_size: The number of days generated per vectorized draw.
 
         """
         self.current_price: float = initial_price
         self.volatility: float = volatility
         self.trend: float = trend
+        self.seed: int | None = seed
         # Store a rolling window of historical prices.
-        self.history: deque[float] = deque(maxlen=history_size)
+        self.history = PriceWindow(history_size)
         self.history.append(self.current_price)  # Start history with the initial price
 
+        self._rng: np.random.Generator | None = None
+        self._block_size = 0
+        self._buffer: list[float] = []
+        self._buffer_index = 0
+        if seed is not None or block_size is not None:
+            if block_size is not None and block_size <= 0:
+                msg = f"Block size must be positive, got {block_size}."
+                raise ValueError(msg)
+            self._rng = np.random.default_rng(seed)
+            self._block_size = block_size or DEFAULT_SIM_BLOCK_SIZE
+
     def _generate_and_add_price(self) -> None:
         """Generate the next price based on trend and volatility, and add it to history."""
+        if self._rng is not None:
+            if self._buffer_index == len(self._buffer):
+                self._fill_buffer(self._rng)
+            self.current_price = self._buffer[self._buffer_index]
+            self._buffer_index += 1
+            self.history.append(self.current_price)
+            return
+
         change_pct = random.normalvariate(self.trend, self.volatility)
         self.current_price *= 1 + change_pct
         self.current_price = max(
-            1.0,
+            MIN_PRICE,
             self.current_price,
         )  # Ensure price doesn't go below 1.0
         self.history.append(self.current_price)
 
+    def _fill_buffer(self, rng: np.random.Generator) -> None:
+        """Draw the next block of prices, continuing from the current price."""
+        self._buffer = simulate_price_paths(
+            self.current_price,
+            self.volatility,
+            self.trend,
+            self._block_size,
+            rng,
+        ).tolist()
+        self._buffer_index = 0
+
     def next_price(self) -> float:
         """Generate, store, and return the next market price."""
         self._generate_and_add_price()
@@ -47,8 +183,159 @@ class MarketDataSimulator:
 
     def get_historical_prices(self) -> list[float]:
         """Return the current list of historical prices."""
-        return list(self.history)
+        return self.history.tolist()
+
+    def get_history_view(self) -> npt.NDArray[np.float64]:
+        """Return the historical prices as a read-only view of the ring buffer."""
+        return self.history.view()
 
     def get_current_price(self) -> float:
         """Return the most recently generated price."""
         return self.current_price
+
+
+def _correlation_factor(
+    correlation: npt.ArrayLike, num_assets: int
+) -> npt.NDArray[np.float64]:
+    """Validate a correlation matrix and return a factor `L` with `L @ L.T == correlation`.
+
+    Raises:
+        ValueError: If the matrix is not a symmetric, unit-diagonal, positive
+            semi-definite matrix of shape `(num_assets, num_assets)`.
+
+    """
+    matrix = np.asarray(correlation, dtype=np.float64)
+    if matrix.shape != (num_assets, num_assets):
+        msg = (
+            f"Correlation matrix must have shape ({num_assets}, {num_assets}), "
+            f"got {matrix.shape}."
+        )
+        raise ValueError(msg)
+    if not np.allclose(matrix, matrix.T) or not np.allclose(np.diag(matrix), 1.0):
+        msg = "Correlation matrix must be symmetric with ones on the diagonal."
+        raise ValueError(msg)
+    try:
+        return np.linalg.cholesky(matrix).astype(np.float64, copy=False)
+    except np.linalg.LinAlgError:
+        # Singular but valid matrices (e.g. perfectly correlated names) have no
+        # Cholesky factor; fall back to the symmetric square root.
+        eigenvalues, eigenvectors = np.linalg.eigh(matrix)
+        if eigenvalues.min() < -1e-8:
+            msg = "Correlation matrix must be positive semi-definite."
+            raise ValueError(msg) from None
+        return eigenvectors * np.sqrt(np.clip(eigenvalues, 0.0, None))
+
+
+class MultiAssetMarketSimulator:
+    """Generates correlated price streams for a basket of tickers.
+
+    Daily changes are `trend + volatility * (L @ z)` for independent standard
+    normals `z` and a factor `L` of the correlation matrix, so each ticker keeps
+    the same marginal dynamics (and price floor) as `MarketDataSimulator`.
+    Changes are drawn `block_size` days at a time in a single matrix product.
+    """
+
+    def __init__(
+        self,
+        tickers: Sequence[str],
+        correlation: npt.ArrayLike,
+        initial_prices: float | npt.ArrayLike = 100.0,
+        volatility: float | npt.ArrayLike = 0.02,
+        trend: float | npt.ArrayLike = 0.0005,
+        history_size: int = 60,
+        seed: int | None = None,
+        block_size: int = DEFAULT_SIM_BLOCK_SIZE,
+    ) -> None:
+        """Initialize the multi-asset market simulator.
+
+        Args:
+            tickers: The ticker symbols, one per asset.
+            correlation: The `(K, K)` correlation matrix of daily changes.
+            initial_prices: The starting price, either shared or one per ticker.
+            volatility: The daily change standard deviation, shared or per ticker.
+            trend: The average daily change (drift), shared or per ticker.
+            history_size: The maximum number of historical prices kept per ticker.
+            seed: Seed for the NumPy generator, making the paths reproducible.
+            block_size: The number of days generated per vectorized draw.
+
+        """
+        if len(set(tickers)) != len(tickers) or not tickers:
+            msg = "Tickers must be a non-empty sequence of unique symbols."
+            raise ValueError(msg)
+        if history_size <= 0 or block_size <= 0:
+            msg = (
+                "History size and block size must be positive, "
+                f"got {history_size} and {block_size}."
+            )
+            raise ValueError(msg)
+        num_assets = len(tickers)
+        self.tickers: list[str] = list(tickers)
+        self._ticker_index = {ticker: i for i, ticker in enumerate(self.tickers)}
+        self._factor = _correlation_factor(correlation, num_assets)
+        self.volatility = np.broadcast_to(
+            np.asarray(volatility, dtype=np.float64), (num_assets,)
+        )
+        self.trend = np.broadcast_to(np.asarray(trend, dtype=np.float64), (num_assets,))
+        self.current_prices = np.array(
+            np.broadcast_to(np.asarray(initial_prices, dtype=np.float64), (num_assets,))
+        )
+        self.seed = seed
+        self._rng = np.random.default_rng(seed)
+        self._block_size = block_size
+
+        # Ring buffer of the last `history_size` days, one column per ticker.
+        self._history = np.empty((history_size, num_assets))
+        self._history[0] = self.current_prices
+        self._history_next = 1 % history_size
+        self._history_count = 1
+
+        self._buffer = np.empty((0, num_assets))
+        self._buffer_index = 0
+
+    def _fill_buffer(self) -> None:
+        """Draw the next block of correlated prices, continuing from today's prices."""
+        shocks = self._rng.standard_normal((self._block_size, len(self.tickers)))
+        changes = self.trend + self.volatility * (shocks @ self._factor.T)
+        self._buffer = _apply_daily_changes(
+            self.current_prices[:, np.newaxis],
+            changes.T,
+        ).T
+        self._buffer_index = 0
+
+    def next_prices(self) -> npt.NDArray[np.float64]:
+        """Advance one day and return the new prices in ticker order."""
+        if self._buffer_index == len(self._buffer):
+            self._fill_buffer()
+        self.current_prices = self._buffer[self._buffer_index].copy()
+        self._buffer_index += 1
+        self._history[self._history_next] = self.current_prices
+        self._history_next = (self._history_next + 1) % len(self._history)
+        self._history_count = min(self._history_count + 1, len(self._history))
+        return self.current_prices
+
+    def get_history_window(self) -> npt.NDArray[np.float64]:
+        """Return the stored history, oldest day first, with one column per ticker."""
+        if self._history_count < len(self._history):
+            return self._history[: self._history_count].copy()
+        return np.roll(self._history, -self._history_next, axis=0)
+
+    def get_historical_prices(self, ticker: str) -> list[float]:
+        """Return one ticker's price history, like `MarketDataSimulator.get_historical_prices`."""
+        column = self._history[:, self._index(ticker)]
+        if self._history_count < len(column):
+            return column[: self._history_count].tolist()
+        return np.concatenate(
+            (column[self._history_next :], column[: self._history_next])
+        ).tolist()
+
+    def get_current_price(self, ticker: str) -> float:
+        """Return the most recent price of one ticker."""
+        return float(self.current_prices[self._index(ticker)])
+
+    def _index(self, ticker: str) -> int:
+        """Return the column of a ticker, raising KeyError for unknown symbols."""
+        try:
+            return self._ticker_index[ticker]
+        except KeyError:
+            msg = f"Unknown ticker '{ticker}'."
+            raise KeyError(msg) from None
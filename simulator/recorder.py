@@ -0,0 +1,186 @@
+"""Columnar recording of a simulation run's daily results.
+
+`SimulationRecorder` preallocates one typed NumPy array per results column,
+sized to the number of simulated days, so recording a day writes a few
+scalars instead of allocating a dict, and the results frame is built over
+the arrays without copying them. Trades are recorded as an action code and
+an approval flag per day, from which `TradeMarkers` derives index arrays,
+and as a `TradeEvent` with the proposal's details for exports.
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+import numpy.typing as npt
+
+from .backtest import ACTION_BUY, ACTION_NONE, ACTION_SELL
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+ACTION_CODES = {"BUY": ACTION_BUY, "SELL": ACTION_SELL}
+
+
+@dataclass
+class TradeEvent:
+    """A trade proposal and RiskGuard's decision on it."""
+
+    day: int
+    action: str
+    quantity: int | None
+    price: float | None
+    approved: bool
+    reason: str | None
+
+
+@dataclass(eq=False)
+class TradeMarkers:
+    """Row positions of the days with a trade proposal, by action and outcome.
+
+    Positions index the results frame (day `d` is row `d - 1`), so the days
+    and prices of the markers are `frame.index[positions]` and
+    `frame["Price"].to_numpy()[positions]`.
+    """
+
+    approved_buy: npt.NDArray[np.intp]
+    rejected_buy: npt.NDArray[np.intp]
+    approved_sell: npt.NDArray[np.intp]
+    rejected_sell: npt.NDArray[np.intp]
+
+    @classmethod
+    def from_actions(
+        cls,
+        actions: npt.NDArray[np.int8],
+        approved: npt.NDArray[np.bool_],
+    ) -> "TradeMarkers":
+        """Build the markers from per-day action codes and approval flags."""
+        buys, sells = actions == ACTION_BUY, actions == ACTION_SELL
+        return cls(
+            approved_buy=np.flatnonzero(buys & approved),
+            rejected_buy=np.flatnonzero(buys & ~approved),
+            approved_sell=np.flatnonzero(sells & approved),
+            rejected_sell=np.flatnonzero(sells & ~approved),
+        )
+
+    @property
+    def trade_count(self) -> int:
+        """Return the number of approved trades."""
+        return len(self.approved_buy) + len(self.approved_sell)
+
+    @property
+    def rejected_count(self) -> int:
+        """Return the number of rejected proposals."""
+        return len(self.rejected_buy) + len(self.rejected_sell)
+
+    def all_positions(self) -> npt.NDArray[np.intp]:
+        """Return the sorted positions of every marker."""
+        return np.unique(
+            np.concatenate(
+                (
+                    self.approved_buy,
+                    self.rejected_buy,
+                    self.approved_sell,
+                    self.rejected_sell,
+                ),
+            ),
+        )
+
+
+class SimulationRecorder:
+    """Preallocated columns of start-of-day results and trade outcomes."""
+
+    def __init__(self, num_days: int) -> None:
+        """Allocate the columns for a run.
+
+        Args:
+            num_days: The number of days that will be recorded.
+
+        """
+        self.prices = np.empty(num_days, dtype=np.float64)
+        self.cash = np.empty(num_days, dtype=np.float64)
+        self.shares = np.empty(num_days, dtype=np.int64)
+        self.holdings_value = np.empty(num_days, dtype=np.float64)
+        self.total_value = np.empty(num_days, dtype=np.float64)
+        self.actions = np.full(num_days, ACTION_NONE, dtype=np.int8)
+        self.approved = np.zeros(num_days, dtype=bool)
+        self.trade_events: list[TradeEvent] = []
+        self.num_recorded = 0
+
+    @classmethod
+    def from_arrays(
+        cls,
+        prices: npt.NDArray[np.float64],
+        cash: npt.NDArray[np.float64],
+        shares: npt.NDArray[np.int64],
+        total_value: npt.NDArray[np.float64],
+        actions: npt.NDArray[np.int8],
+        approved: npt.NDArray[np.bool_],
+    ) -> "SimulationRecorder":
+        """Wrap complete columns, such as those of a vectorized backtest."""
+        recorder = cls(0)
+        recorder.prices, recorder.cash, recorder.shares = prices, cash, shares
+        recorder.holdings_value = shares * prices
+        recorder.total_value = total_value
+        recorder.actions, recorder.approved = actions, approved
+        recorder.num_recorded = len(prices)
+        return recorder
+
+    def record_day(
+        self,
+        price: float,
+        cash: float,
+        shares: int,
+        holdings_value: float,
+        total_value: float,
+    ) -> int:
+        """Record the start-of-day portfolio and return the day's row position."""
+        index = self.num_recorded
+        self.prices[index] = price
+        self.cash[index] = cash
+        self.shares[index] = shares
+        self.holdings_value[index] = holdings_value
+        self.total_value[index] = total_value
+        self.num_recorded += 1
+        return index
+
+    def record_trade(
+        self,
+        index: int,
+        action: str,
+        approved: bool,
+        quantity: int | None = None,
+        price: float | None = None,
+        reason: str | None = None,
+    ) -> None:
+        """Record the trade proposed on a day and whether it was approved."""
+        self.actions[index] = ACTION_CODES[action]
+        self.approved[index] = approved
+        self.trade_events.append(
+            TradeEvent(index + 1, action, quantity, price, approved, reason),
+        )
+
+    def to_frame(self) -> "pd.DataFrame":
+        """Return the recorded days as a frame indexed by Day, sharing the arrays."""
+        import pandas as pd
+
+        count = self.num_recorded
+        return pd.DataFrame(
+            {
+                "Price": self.prices[:count],
+                "Cash": self.cash[:count],
+                "Shares": self.shares[:count],
+                "HoldingsValue": self.holdings_value[:count],
+                "TotalValue": self.total_value[:count],
+            },
+            index=pd.RangeIndex(1, count + 1, name="Day"),
+            copy=False,
+        )
+
+    def trade_markers(self) -> TradeMarkers:
+        """Return the positions of the recorded trade proposals."""
+        count = self.num_recorded
+        return TradeMarkers.from_actions(
+            self.actions[:count],
+            self.approved[:count],
+        )
@@ -0,0 +1,184 @@
+"""Replay of historical closing prices from memory-mapped binary files.
+
+A replay file is a NumPy `.npy` array of closes with one row per trading day
+and one column per symbol, next to a `.json` sidecar listing the symbols and
+date range. `HistoricalReplaySource` opens the array with `mmap_mode="r"`, so
+opening a multi-decade, many-symbol file is near-instant and only the pages
+for the days actually replayed are read.
+
+Files are created from CSV with `import_csv_closes`, or from the command line:
+
+    python -m simulator.replay prices.csv data/prices.npy
+"""
+
+import json
+import logging
+from pathlib import Path
+
+import click
+import numpy as np
+import numpy.typing as npt
+
+from .market import MarketDataSource
+
+logger = logging.getLogger(__name__)
+
+
+def _metadata_path(path: Path) -> Path:
+    """Return the sidecar metadata path for a replay file."""
+    return path.with_suffix(".json")
+
+
+def import_csv_closes(
+    csv_path: str | Path,
+    output_path: str | Path,
+    date_column: str = "Date",
+) -> list[str]:
+    """Convert a CSV of closing prices into a replay file.
+
+    The CSV is expected in wide format: a date column followed by one column of
+    closes per symbol. Rows are sorted by date; missing closes are carried
+    forward from the previous day, and rows before every symbol has its first
+    close are dropped, so no close is taken from a later day.
+
+    Args:
+        csv_path: The CSV file to import.
+        output_path: Where to write the `.npy` array; the `.json` sidecar is
+            written next to it.
+        date_column: The name of the date column.
+
+    Returns:
+        The symbols in column order.
+
+    Raises:
+        ValueError: If the CSV has no date column, no symbols, or no row from
+            which every symbol has a close.
+
+    """
+    import pandas as pd
+
+    frame = pd.read_csv(csv_path)
+    if date_column not in frame.columns:
+        msg = f"CSV file has no '{date_column}' column."
+        raise ValueError(msg)
+    frame = frame.set_index(pd.to_datetime(frame.pop(date_column))).sort_index()
+    if frame.empty or frame.columns.empty:
+        msg = "CSV file must contain at least one row and one symbol column."
+        raise ValueError(msg)
+
+    closes = frame.apply(pd.to_numeric, errors="coerce").ffill()
+    # Only rows before some symbol's first close are still missing prices.
+    closes = closes.dropna()
+    if closes.empty:
+        msg = "CSV file has no row from which every symbol has a close."
+        raise ValueError(msg)
+    if len(closes) < len(frame):
+        logger.warning(
+            f"Dropped {len(frame) - len(closes)} leading rows of {csv_path} "
+            "that are missing a close.",
+        )
+    output_path = Path(output_path).with_suffix(".npy")
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    np.save(output_path, closes.to_numpy(dtype=np.float64))
+    symbols = [str(column) for column in closes.columns]
+    _metadata_path(output_path).write_text(
+        json.dumps(
+            {
+                "symbols": symbols,
+                "start_date": closes.index[0].date().isoformat(),
+                "end_date": closes.index[-1].date().isoformat(),
+            },
+        ),
+    )
+    logger.info(
+        f"Imported {len(closes)} days x {len(symbols)} symbols from {csv_path} to {output_path}",
+    )
+    return symbols
+
+
+class HistoricalReplaySource(MarketDataSource):
+    """Streams one symbol's historical closes from a memory-mapped replay file."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        symbol: str | None = None,
+        history_size: int = 60,
+        start_index: int = 0,
+    ) -> None:
+        """Open a replay file.
+
+        Args:
+            path: The `.npy` replay file written by `import_csv_closes`.
+            symbol: The symbol to replay; defaults to the first one in the file.
+            history_size: The maximum number of historical prices to return.
+            start_index: The row used as the initial price; replay starts on the
+                following row.
+
+        Raises:
+            ValueError: If the symbol is unknown or `start_index` is out of range.
+
+        """
+        path = Path(path)
+        self.symbols: list[str] = json.loads(_metadata_path(path).read_text())[
+            "symbols"
+        ]
+        self._closes: npt.NDArray[np.float64] = np.load(path, mmap_mode="r")
+        self.symbol = symbol or self.symbols[0]
+        if self.symbol not in self.symbols:
+            msg = f"Symbol '{self.symbol}' not found in {path.name}. Available: {', '.join(self.symbols)}."
+            raise ValueError(msg)
+        if not 0 <= start_index < len(self._closes):
+            msg = f"Start index {start_index} is outside the {len(self._closes)} days in {path.name}."
+            raise ValueError(msg)
+        self._column = self.symbols.index(self.symbol)
+        self.history_size = history_size
+        self._start_index = start_index
+        self._index = start_index
+
+    @property
+    def remaining_days(self) -> int:
+        """Return how many more days can be replayed."""
+        return len(self._closes) - 1 - self._index
+
+    def next_price(self) -> float:
+        """Advance one day and return that day's close.
+
+        Raises:
+            EOFError: If the replay file has no more days.
+
+        """
+        if self.remaining_days <= 0:
+            msg = f"Replay of {self.symbol} has no more days."
+            raise EOFError(msg)
+        self._index += 1
+        return self.get_current_price()
+
+    def get_historical_prices(self) -> list[float]:
+        """Return up to `history_size` closes ending with the current day."""
+        return self.get_history_view().tolist()
+
+    def get_history_view(self) -> npt.NDArray[np.float64]:
+        """Return up to `history_size` closes as a read-only view of the memory map."""
+        first = max(self._start_index, self._index + 1 - self.history_size)
+        return self._closes[first : self._index + 1, self._column]
+
+    def get_current_price(self) -> float:
+        """Return the current day's close."""
+        return float(self._closes[self._index, self._column])
+
+
+@click.command()
+@click.argument("csv_path", type=click.Path(exists=True, dir_okay=False))
+@click.argument("output_path", type=click.Path(dir_okay=False))
+@click.option("--date-column", default="Date", help="Name of the date column.")
+def main(csv_path: str, output_path: str, date_column: str) -> None:
+    """Import CSV_PATH (date plus one close column per symbol) as a replay file."""
+    symbols = import_csv_closes(csv_path, output_path, date_column=date_column)
+    click.echo(
+        f"Wrote {len(symbols)} symbols to {Path(output_path).with_suffix('.npy')}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Capture of a simulation run's detailed log.
+
+Each run collects the records of the simulation logic logger into its own
+`SimulationLog`: a bounded ring buffer of raw `LogRecord`s, which are only
+formatted when the log is viewed. The records are routed by a context
+variable, so concurrent runs in one process each get their own log.
+
+Records logged between `begin_day()` and `end_day()` are held back until
+the day is over and then kept or dropped according to the run's verbosity:
+
+- "errors": only warning and error records.
+- "trades": every record of days with a trade proposal or a warning/error.
+- "all": every record.
+
+Records outside a day (setup and the final summary) are always kept.
+"""
+
+import logging
+from collections import deque
+from contextvars import ContextVar, Token
+from typing import Literal
+
+LogVerbosity = Literal["errors", "trades", "all"]
+
+DETAILED_LOG_FORMAT = "%(levelname)s:%(name)s: %(message)s"
+
+_active_log: ContextVar["SimulationLog | None"] = ContextVar(
+    "active_simulation_log",
+    default=None,
+)
+
+
+class SimulationLog:
+    """A run's captured log records, kept raw in a bounded ring buffer."""
+
+    def __init__(self, max_records: int, verbosity: LogVerbosity = "trades") -> None:
+        """Initialize the log.
+
+        Args:
+            max_records: The number of records kept; older ones are dropped.
+            verbosity: Which day records to keep (see the module docstring).
+
+        """
+        self.verbosity = verbosity
+        self._records: deque[logging.LogRecord] = deque(maxlen=max_records)
+        self._day_records: list[logging.LogRecord] | None = None
+        self._day_has_warning = False
+        self.num_kept = 0
+
+    def __len__(self) -> int:
+        """Return the number of records held."""
+        return len(self._records)
+
+    @property
+    def num_dropped(self) -> int:
+        """Return how many kept records were pushed out of the buffer."""
+        return self.num_kept - len(self._records)
+
+    def add(self, record: logging.LogRecord) -> None:
+        """Add a record, holding it back if a day is in progress."""
+        if self._day_records is None:
+            self._keep([record])
+            return
+        if record.levelno >= logging.WARNING:
+            self._day_has_warning = True
+        elif self.verbosity == "errors":
+            return
+        self._day_records.append(record)
+
+    def begin_day(self) -> None:
+        """Start holding back records until `end_day()`."""
+        self._day_records = []
+        self._day_has_warning = False
+
+    def end_day(self, traded: bool) -> None:
+        """Keep or drop the day's records.
+
+        Args:
+            traded: Whether a trade was proposed on the day.
+
+        """
+        records, self._day_records = self._day_records or [], None
+        if self.verbosity != "trades" or traded or self._day_has_warning:
+            self._keep(records)
+
+    def _keep(self, records: list[logging.LogRecord]) -> None:
+        self._records.extend(records)
+        self.num_kept += len(records)
+
+    def format(self, formatter: logging.Formatter | None = None) -> str:
+        """Format the held records, oldest first, one per line."""
+        if self._day_records is not None:
+            # The run stopped mid-day (e.g. on an error); the day ends here.
+            self.end_day(traded=False)
+        formatter = formatter or logging.Formatter(DETAILED_LOG_FORMAT)
+        lines = [formatter.format(record) for record in self._records]
+        if self.num_dropped:
+            lines.insert(
+                0,
+                f"... {self.num_dropped} earlier log records were dropped ...",
+            )
+        return "\n".join(lines)
+
+
+class SimulationLogHandler(logging.Handler):
+    """Routes records to the log of the run that emitted them."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Add the record to the active run's log, if there is one."""
+        log = _active_log.get()
+        if log is not None:
+            log.add(record)
+
+
+def attach_simulation_log(log: SimulationLog) -> Token["SimulationLog | None"]:
+    """Route the simulation logic logger's records to `log` in this context.
+
+    Returns:
+        The token to pass to `detach_simulation_log` when the run ends.
+
+    """
+    return _active_log.set(log)
+
+
+def detach_simulation_log(token: Token["SimulationLog | None"]) -> None:
+    """Undo `attach_simulation_log`."""
+    _active_log.reset(token)
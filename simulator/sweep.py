@@ -0,0 +1,160 @@
+"""Parameter sweeps: run the simulation for every combination of a value grid.
+
+A sweep varies a few parameters over lists or ranges of values, runs every
+combination concurrently (bounded by a semaphore) and arranges each run's
+metrics into an array shaped like the grid, ready to plot as a heatmap when
+two parameters are swept.
+"""
+
+import asyncio
+import itertools
+import logging
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from typing import Any, Literal
+
+import numpy as np
+from pydantic import BaseModel, Field, model_validator
+
+logger = logging.getLogger(__name__)
+
+SweepField = Literal[
+    "alphabot_short_sma",
+    "alphabot_long_sma",
+    "alphabot_trade_qty",
+    "riskguard_max_pos_size",
+    "riskguard_max_concentration",
+    "sim_volatility",
+    "sim_trend",
+]
+
+
+class SweepRange(BaseModel):
+    """An inclusive range of evenly spaced values."""
+
+    start: float
+    stop: float
+    step: float = Field(..., gt=0)
+
+    @model_validator(mode="after")
+    def _check_order(self) -> "SweepRange":
+        if self.stop < self.start:
+            msg = f"Range stop {self.stop} is below its start {self.start}."
+            raise ValueError(msg)
+        return self
+
+    def values(self) -> list[float]:
+        """Return the values from start to stop (inclusive), step apart.
+
+        Ranges with a whole-number start and step yield ints, so they can
+        sweep integer parameters such as SMA windows.
+        """
+        # The small tolerance keeps `stop` when the step does not divide exactly in binary.
+        count = int(np.floor((self.stop - self.start) / self.step + 1e-9)) + 1
+        values = np.round(self.start + self.step * np.arange(count), 10)
+        if float(self.start).is_integer() and float(self.step).is_integer():
+            return values.astype(np.int64).tolist()
+        return values.tolist()
+
+
+class SweepRun(BaseModel):
+    """One combination of a sweep and its outcome."""
+
+    params: dict[str, int | float]
+    metrics: dict[str, float] | None = None
+    error: str | None = None
+
+
+class SweepResult(BaseModel):
+    """Outcome of a parameter sweep.
+
+    `metrics` maps each metric name to a nested list indexed like `axes`
+    (first axis outermost); cells of failed runs are None.
+    """
+
+    axes: dict[str, list[int | float]]
+    seed: int | None
+    metrics: dict[str, list[Any]]
+    runs: list[SweepRun]
+
+
+def expand_sweep(
+    sweep: Mapping[SweepField, Sequence[float] | SweepRange],
+) -> tuple[dict[str, list[float]], list[dict[str, float]]]:
+    """Expand a sweep specification into its axes and combinations.
+
+    Args:
+        sweep: Values (or a range of values) for each swept parameter.
+
+    Returns:
+        The values of each axis, and every combination as a parameter dict in
+        row-major order (the last axis varies fastest).
+
+    """
+    axes: dict[str, list[float]] = {
+        name: spec.values() if isinstance(spec, SweepRange) else list(spec)
+        for name, spec in sweep.items()
+    }
+    combinations = [
+        dict(zip(axes, values, strict=True))
+        for values in itertools.product(*axes.values())
+    ]
+    return axes, combinations
+
+
+async def run_parameter_sweep(
+    base_params: dict[str, Any],
+    sweep: Mapping[SweepField, Sequence[float] | SweepRange],
+    run: Callable[[dict[str, Any]], Awaitable[dict[str, Any]]],
+    max_concurrency: int,
+) -> SweepResult:
+    """Run a simulation for every combination of the swept parameters.
+
+    Args:
+        base_params: The parameters shared by every run.
+        sweep: Values (or a range of values) for each swept parameter.
+        run: Runs one simulation and returns its results dictionary, with a
+            `metrics` dict on success.
+        max_concurrency: The maximum number of runs in flight at once.
+
+    Returns:
+        A SweepResult with one metric array per metric.
+
+    """
+    axes, combinations = expand_sweep(sweep)
+    logger.info(
+        f"Running parameter sweep over {', '.join(axes)}: {len(combinations)} combinations, "
+        f"{max_concurrency} at a time",
+    )
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _run_combination(overrides: dict[str, float]) -> SweepRun:
+        async with semaphore:
+            results = await run({**base_params, **overrides})
+        if not results.get("success"):
+            return SweepRun(
+                params=overrides,
+                error=results.get("error", "Unknown error"),
+            )
+        return SweepRun(params=overrides, metrics=results["metrics"])
+
+    runs = await asyncio.gather(*(_run_combination(c) for c in combinations))
+
+    shape = tuple(len(values) for values in axes.values())
+    metric_names = next((list(r.metrics) for r in runs if r.metrics), [])
+    metrics = {}
+    for name in metric_names:
+        # An object array keeps None for failed runs (NaN is not valid JSON).
+        grid = np.array(
+            [r.metrics[name] if r.metrics else None for r in runs],
+            dtype=object,
+        )
+        metrics[name] = grid.reshape(shape).tolist()
+    failed = sum(r.error is not None for r in runs)
+    if failed:
+        logger.warning(f"Parameter sweep finished with {failed} failed runs.")
+    return SweepResult(
+        axes=axes,
+        seed=base_params.get("seed"),
+        metrics=metrics,
+        runs=runs,
+    )
@@ -24,6 +24,7 @@ from google.adk.tools import ToolContext
 from alphabot.a2a_risk_tool import A2ARiskCheckTool
 from alphabot.agent import AlphaBotAgent
 from common.models import RiskCheckResult
+from common.utils.http_pool import http_pool
 from tests.conftest import create_async_error_iterator
 
 
@@ -441,9 +442,9 @@ async def test_risk_tool_missing_arguments(
 
 @pytest.mark.asyncio
 async def test_risk_tool_close_client_default() -> None:
-    """Test that closing the tool closes the default internal httpx client when not injected."""
+    """Test that a tool without an injected client uses, and leaves open, the shared pool."""
     with patch("httpx.AsyncClient.aclose", new_callable=AsyncMock) as mock_aclose:
         tool = A2ARiskCheckTool()
-        assert tool.httpx_client is not None
+        assert tool.httpx_client is http_pool.get_client()
         await tool.close()
-        mock_aclose.assert_called_once()
+        mock_aclose.assert_not_called()
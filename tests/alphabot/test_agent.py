@@ -10,7 +10,11 @@ from google.adk.agents.invocation_context import InvocationContext
 from google.adk.events import Event
 from google.genai import types as genai_types
 
-from alphabot.agent import A2ARiskCheckTool, AlphaBotAgent
+from alphabot.agent import (
+    A2ARiskCheckTool,
+    AlphaBotAgent,
+    determine_trade_proposal,
+)
 from common.config import DEFAULT_TICKER
 from common.models import PortfolioState
 
@@ -229,10 +233,10 @@ def test_generate_signal_scenarios(
     assert signal == expected_signal
 
 
-def test_determine_trade_proposal_no_buy_when_long(agent: AlphaBotAgent) -> None:
-    """Tests that _determine_trade_proposal returns None for a BUY signal when already long."""
+def test_determine_trade_proposal_no_buy_when_long() -> None:
+    """Tests that determine_trade_proposal returns None for a BUY signal when already long."""
     portfolio_state = PortfolioState(cash=10000, shares=10, total_value=11000)
-    proposal = agent._determine_trade_proposal(
+    proposal = determine_trade_proposal(
         signal="BUY",
         should_be_long=True,
         portfolio_state=portfolio_state,
@@ -314,10 +318,10 @@ async def test_alphabot_run_async_impl_buy_rejected(
         assert "rejected_trade_proposal" in final_event.actions.state_delta
 
 
-def test_determine_trade_proposal_no_sell_when_not_long(agent: AlphaBotAgent) -> None:
-    """Tests that _determine_trade_proposal returns None for a SELL signal when not long."""
+def test_determine_trade_proposal_no_sell_when_not_long() -> None:
+    """Tests that determine_trade_proposal returns None for a SELL signal when not long."""
     portfolio_state = PortfolioState(cash=10000, shares=0, total_value=10000)
-    proposal = agent._determine_trade_proposal(
+    proposal = determine_trade_proposal(
         signal="SELL",
         should_be_long=False,
         portfolio_state=portfolio_state,
@@ -328,12 +332,10 @@ def test_determine_trade_proposal_no_sell_when_not_long(agent: AlphaBotAgent) ->
     assert proposal is None
 
 
-def test_determine_trade_proposal_no_sell_when_long_no_shares(
-    agent: AlphaBotAgent,
-) -> None:
-    """Tests that _determine_trade_proposal returns None for a SELL signal when long but with no shares."""
+def test_determine_trade_proposal_no_sell_when_long_no_shares() -> None:
+    """Tests that determine_trade_proposal returns None for a SELL signal when long but with no shares."""
     portfolio_state = PortfolioState(cash=10000, shares=0, total_value=10000)
-    proposal = agent._determine_trade_proposal(
+    proposal = determine_trade_proposal(
         signal="SELL",
         should_be_long=True,
         portfolio_state=portfolio_state,
@@ -547,17 +549,15 @@ async def test_alphabot_does_not_repropose_rejected_trade(
         )
 
 
-def test_determine_trade_proposal_rejects_sell_if_quantity_exceeds_shares(
-    agent: AlphaBotAgent,
-) -> None:
-    """Test that `_determine_trade_proposal` returns None for a SELL signal.
+def test_determine_trade_proposal_rejects_sell_if_quantity_exceeds_shares() -> None:
+    """Test that `determine_trade_proposal` returns None for a SELL signal.
 
     This occurs when the configured trade quantity exceeds the number of
     shares held.
     """
     portfolio_state = PortfolioState(cash=10000, shares=5, total_value=10500)
     trade_quantity = 10  # Attempting to sell more than owned
-    proposal = agent._determine_trade_proposal(
+    proposal = determine_trade_proposal(
         signal="SELL",
         should_be_long=True,
         portfolio_state=portfolio_state,
@@ -675,8 +675,8 @@ def test_calculate_indicators_edge_cases(agent: AlphaBotAgent) -> None:
     assert prev_sma_long is None
 
 
-def test_determine_trade_proposal_rejected_history(agent: AlphaBotAgent) -> None:
-    """Test _determine_trade_proposal respects rejected trade history."""
+def test_determine_trade_proposal_rejected_history() -> None:
+    """Test determine_trade_proposal respects rejected trade history."""
     portfolio_state = PortfolioState(cash=10000, shares=0, total_value=10000)
     last_rejected = {
         "action": "BUY",
@@ -685,40 +685,218 @@ def test_determine_trade_proposal_rejected_history(agent: AlphaBotAgent) -> None
         "price": 100.0,
     }
 
-    agent.ticker = "TECH"
-
     # 1. Identical trade proposal should be skipped
-    proposal = agent._determine_trade_proposal(
+    proposal = determine_trade_proposal(
         signal="BUY",
         should_be_long=False,
         portfolio_state=portfolio_state,
         current_price=100.0,
         trade_quantity=10,
         last_rejected_trade=last_rejected,
+        ticker="TECH",
     )
     assert proposal is None
 
     # 2. Proposal with different quantity is allowed
-    proposal = agent._determine_trade_proposal(
+    proposal = determine_trade_proposal(
         signal="BUY",
         should_be_long=False,
         portfolio_state=portfolio_state,
         current_price=100.0,
         trade_quantity=20,
         last_rejected_trade=last_rejected,
+        ticker="TECH",
     )
     assert proposal is not None
     assert proposal["quantity"] == 20
 
     # 3. Proposal with different ticker is allowed
-    agent.ticker = "OTHER"
-    proposal = agent._determine_trade_proposal(
+    proposal = determine_trade_proposal(
         signal="BUY",
         should_be_long=False,
         portfolio_state=portfolio_state,
         current_price=100.0,
         trade_quantity=10,
         last_rejected_trade=last_rejected,
+        ticker="OTHER",
     )
     assert proposal is not None
     assert proposal["ticker"] == "OTHER"
+
+
+def _sequenced_content(alphabot_input_data_factory, **overrides) -> genai_types.Content:
+    input_data = alphabot_input_data_factory(
+        **{"short_sma_period": 2, "long_sma_period": 4, **overrides},
+    )
+    return genai_types.Content(
+        parts=[genai_types.Part(text=input_data.model_dump_json())],
+    )
+
+
+async def _run_sequenced(agent, adk_ctx, content) -> list:
+    """Run the agent and apply its state deltas to the session, as ADK does."""
+    adk_ctx.user_content = content
+    events = [event async for event in agent._run_async_impl(adk_ctx)]
+    for event in events:
+        if event.actions and event.actions.state_delta:
+            adk_ctx.session.state.update(event.actions.state_delta)
+    return events
+
+
+@pytest.mark.asyncio
+async def test_alphabot_full_sync_stores_only_sequence(
+    agent: AlphaBotAgent,
+    adk_ctx: InvocationContext,
+    alphabot_input_data_factory,
+) -> None:
+    """Tests that a sequenced full sync keeps the SMAs in process, not in the session."""
+    adk_ctx.session.state = {"should_be_long": False}
+
+    events = await _run_sequenced(
+        agent,
+        adk_ctx,
+        _sequenced_content(
+            alphabot_input_data_factory,
+            historical_prices=[100, 101, 102, 103, 104, 105],
+            current_price=105.5,
+            day=6,
+            sequence=6,
+        ),
+    )
+
+    assert len(events) == 2
+    sync_event = events[0]
+    assert sync_event.content is None
+    assert sync_event.actions.state_delta == {
+        "price_sequence": 6,
+        "resync_required": False,
+    }
+    assert "No signal (Conditions not met)" in _get_text(events[1])
+
+
+@pytest.mark.asyncio
+async def test_alphabot_incremental_payloads_match_full_history(
+    agent: AlphaBotAgent,
+    adk_ctx: InvocationContext,
+    alphabot_input_data_factory,
+) -> None:
+    """Tests that incremental payloads decide as the full price history does each day."""
+    prices = [100.0, 100.0, 100.0, 100.0, 99.0, 103.0, 104.0, 96.0, 95.0, 101.0]
+    sequenced_state: dict = {"should_be_long": False}
+    full_state: dict = {"should_be_long": False}
+
+    with patch.object(A2ARiskCheckTool, "run_async") as mock_run_async:
+        mock_run_async.return_value = Event(
+            author="a2a_risk_check",
+            content=genai_types.Content(
+                parts=[
+                    genai_types.Part(
+                        function_response=genai_types.FunctionResponse(
+                            name="risk_check_result",
+                            response={"approved": True, "reason": "Approved."},
+                        ),
+                    ),
+                ],
+            ),
+            turn_complete=True,
+        )
+        decisions = []
+        for day in range(5, len(prices) + 1):
+            adk_ctx.session.state = sequenced_state
+            sequenced = await _run_sequenced(
+                agent,
+                adk_ctx,
+                _sequenced_content(
+                    alphabot_input_data_factory,
+                    historical_prices=prices[:day] if day == 5 else [],
+                    current_price=prices[day - 1],
+                    day=day,
+                    sequence=day,
+                ),
+            )
+            sequenced_state = adk_ctx.session.state
+            assert sequenced[0].actions.state_delta == {
+                "price_sequence": day,
+                "resync_required": False,
+            }
+
+            adk_ctx.session.state = full_state
+            full = await _run_sequenced(
+                agent,
+                adk_ctx,
+                _sequenced_content(
+                    alphabot_input_data_factory,
+                    historical_prices=prices[:day],
+                    current_price=prices[day - 1],
+                    day=day,
+                ),
+            )
+            full_state = adk_ctx.session.state
+            assert _get_text(sequenced[-1]) == _get_text(full[-1])
+            decisions.append(_get_text(sequenced[-1]))
+
+    assert sequenced_state["price_sequence"] == len(prices)
+    assert "price_window" not in sequenced_state
+    assert decisions.count("Trade Approved (A2A): Approved.") == 2  # BUY and SELL
+
+
+@pytest.mark.asyncio
+async def test_alphabot_incremental_payload_requests_resync_after_restart(
+    agent: AlphaBotAgent,
+    adk_ctx: InvocationContext,
+    alphabot_input_data_factory,
+) -> None:
+    """Tests that a session whose SMAs this process does not hold is resynced."""
+    adk_ctx.session.state = {"should_be_long": False, "price_sequence": 6}
+
+    events = await _run_sequenced(
+        agent,
+        adk_ctx,
+        _sequenced_content(
+            alphabot_input_data_factory,
+            historical_prices=[],
+            current_price=105.0,
+            day=7,
+            sequence=7,
+        ),
+    )
+
+    assert len(events) == 1
+    assert "Resync required" in _get_text(events[0])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "session_state",
+    [
+        {"should_be_long": False},
+        {"should_be_long": False, "price_sequence": 3},
+    ],
+    ids=["no_window", "sequence_gap"],
+)
+async def test_alphabot_incremental_payload_requests_resync(
+    agent: AlphaBotAgent,
+    adk_ctx: InvocationContext,
+    alphabot_input_data_factory,
+    session_state: dict,
+) -> None:
+    """Tests that an incremental payload without a usable window requests a resync."""
+    adk_ctx.session.state = session_state
+
+    input_data = alphabot_input_data_factory(
+        historical_prices=[],
+        current_price=105.0,
+        short_sma_period=2,
+        long_sma_period=4,
+        day=7,
+        sequence=7,
+    )
+    adk_ctx.user_content = genai_types.Content(
+        parts=[genai_types.Part(text=input_data.model_dump_json())],
+    )
+
+    events = [event async for event in agent._run_async_impl(adk_ctx)]
+
+    assert len(events) == 1
+    assert "Resync required" in _get_text(events[0])
+    assert events[0].actions.state_delta == {"resync_required": True}
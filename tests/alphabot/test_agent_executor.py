@@ -1,6 +1,6 @@
 """Tests for the AlphaBot agent executor."""
 
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from a2a.helpers import get_data_parts, new_data_part
@@ -9,6 +9,7 @@ from a2a.server.context import ServerCallContext
 from a2a.types import (
     Message,
     Role,
+    Task,
     TaskState,
 )
 from a2a.types import (
@@ -19,6 +20,13 @@ from google.adk.events import Event, EventActions
 from google.genai import types as genai_types
 
 from alphabot.agent_executor import AlphaBotAgentExecutor
+from common.models import (
+    AlphaBotEpisodePayload,
+    EpisodeChunk,
+    EpisodeDayOutcome,
+    PortfolioState,
+    TradeStatus,
+)
 from tests.conftest import get_executor_results
 
 
@@ -351,6 +359,52 @@ async def test_execute_no_action_path(
     assert data_parts[0]["reason"] == "No trades today."
 
 
+@pytest.mark.asyncio
+async def test_execute_resync_required_path(
+    mock_runner_factory,
+    event_queue,
+    alphabot_message_factory,
+    adk_session,
+) -> None:
+    """Test executor when the agent cannot extend its session price window."""
+    mock_runner_instance = mock_runner_factory("alphabot.agent_executor")
+    request_message = alphabot_message_factory(historical_prices=[], sequence=5)
+    context = RequestContext(
+        ServerCallContext(),
+        request=MessageSendParams(message=request_message),
+        context_id="test-context-123",
+        task_id="test-task-123",
+    )
+
+    mock_runner_instance.session_service.get_session = AsyncMock(
+        return_value=adk_session,
+    )
+
+    async def mock_run_async_generator():
+        yield Event(
+            author="test",
+            content=genai_types.Content(
+                parts=[genai_types.Part(text="Resync required.")],
+            ),
+            actions=EventActions(state_delta={"resync_required": True}),
+            turn_complete=True,
+        )
+
+    mock_runner_instance.run_async.return_value = mock_run_async_generator()
+
+    executor = AlphaBotAgentExecutor()
+    executor._adk_runner = mock_runner_instance
+    await executor.execute(context, event_queue)
+
+    enqueued_message, _events = await get_executor_results(event_queue)
+    await event_queue.close()
+
+    assert isinstance(enqueued_message, TaskArtifactUpdateEvent)
+    data_parts = get_data_parts(enqueued_message.artifact.parts)
+    assert data_parts[0]["status"] == "RESYNC_REQUIRED"
+    assert data_parts[0]["reason"] == "Resync required."
+
+
 @pytest.mark.asyncio
 async def test_execute_cancel(
     event_queue,
@@ -416,3 +470,147 @@ async def test_execute_missing_context_id_raises_value_error(
     with pytest.raises(ValueError, match="Context ID is missing, cannot execute."):
         await executor.execute(context, event_queue)
     await event_queue.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fast_response", [False, True])
+async def test_execute_episode_streams_chunks(
+    mock_runner_factory,
+    event_queue,
+    fast_response,
+) -> None:
+    """Test that an episode streams its days as chunks of one artifact, in either mode."""
+    mock_runner_instance = mock_runner_factory("alphabot.agent_executor")
+    payload = AlphaBotEpisodePayload(
+        prices=[100.0, 101.0, 102.0, 103.0, 104.0],
+        portfolio_state=PortfolioState(cash=1000.0, shares=0, total_value=1000.0),
+        chunk_days=2,
+    )
+    request_message = Message(
+        message_id="test_message_id",
+        role=Role.ROLE_USER,
+        parts=[new_data_part(payload.model_dump(mode="json"))],
+    )
+
+    async def _run_episode(agent, episode_payload, context_id):
+        assert context_id == "test-context-456"
+        for day, price in enumerate(episode_payload.prices, start=1):
+            yield EpisodeDayOutcome(
+                day=day,
+                price=price,
+                status=TradeStatus.NO_ACTION,
+                reason="No signal (Conditions not met).",
+                portfolio_state=episode_payload.portfolio_state,
+            )
+
+    executor = AlphaBotAgentExecutor(fast_response=fast_response)
+    executor._adk_runner = mock_runner_instance
+    with patch("alphabot.agent_executor.run_episode", _run_episode):
+        await executor.execute(
+            context=RequestContext(
+                ServerCallContext(),
+                request=MessageSendParams(message=request_message),
+                context_id="test-context-456",
+                task_id="test-task-123",
+            ),
+            event_queue=event_queue,
+        )
+
+    _, events = await get_executor_results(event_queue)
+    await event_queue.close()
+
+    assert isinstance(events[0], Task)
+    assert events[0].status.state == TaskState.TASK_STATE_SUBMITTED
+    chunks = [e for e in events if isinstance(e, TaskArtifactUpdateEvent)]
+    assert [e.artifact.name for e in chunks] == ["episode"] * 3
+    assert len({e.artifact.artifact_id for e in chunks}) == 1
+    assert [e.append for e in chunks] == [False, True, True]
+    assert [e.last_chunk for e in chunks] == [False, False, True]
+    days = [
+        EpisodeChunk.model_validate(get_data_parts(e.artifact.parts)[0]).days
+        for e in chunks
+    ]
+    assert [[day.day for day in chunk] for chunk in days] == [[1, 2], [3, 4], [5]]
+    assert isinstance(events[-1], TaskStatusUpdateEvent)
+    assert events[-1].status.state == TaskState.TASK_STATE_COMPLETED
+    mock_runner_instance.run_async.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute_fast_response_single_message(
+    mock_runner_factory,
+    event_queue,
+    alphabot_message_factory,
+    adk_session,
+) -> None:
+    """Test that fast response mode answers with only a result message."""
+    mock_runner_instance = mock_runner_factory("alphabot.agent_executor")
+    mock_runner_instance.session_service.get_session = AsyncMock(
+        return_value=adk_session,
+    )
+
+    async def mock_run_async_generator():
+        yield Event(
+            author="test_author",
+            content=genai_types.Content(
+                parts=[genai_types.Part(text="No signal (Conditions not met).")],
+            ),
+            turn_complete=True,
+        )
+
+    mock_runner_instance.run_async.return_value = mock_run_async_generator()
+
+    executor = AlphaBotAgentExecutor(fast_response=True)
+    executor._adk_runner = mock_runner_instance
+    await executor.execute(
+        context=RequestContext(
+            ServerCallContext(),
+            request=MessageSendParams(message=alphabot_message_factory()),
+            context_id="test-context-456",
+            task_id="test-task-123",
+        ),
+        event_queue=event_queue,
+    )
+
+    _, events = await get_executor_results(event_queue)
+    await event_queue.close()
+
+    assert len(events) == 1
+    assert isinstance(events[0], Message)
+    assert events[0].role == Role.ROLE_AGENT
+    assert events[0].context_id == "test-context-456"
+    assert get_data_parts(events[0].parts)[0] == {
+        "status": "NO_ACTION",
+        "reason": "No signal (Conditions not met).",
+        "trade_proposal": None,
+    }
+
+
+@pytest.mark.asyncio
+async def test_execute_fast_response_failure_single_task(event_queue) -> None:
+    """Test that fast response mode reports an invalid request as one failed task."""
+    request_message = Message(
+        message_id="test_message_id",
+        role=Role.ROLE_USER,
+        parts=[new_data_part({"unexpected": "payload"})],
+    )
+
+    executor = AlphaBotAgentExecutor(fast_response=True)
+    await executor.execute(
+        context=RequestContext(
+            ServerCallContext(),
+            request=MessageSendParams(message=request_message),
+            context_id="test-context-456",
+            task_id="test-task-123",
+        ),
+        event_queue=event_queue,
+    )
+
+    _, events = await get_executor_results(event_queue)
+    await event_queue.close()
+
+    assert len(events) == 1
+    assert isinstance(events[0], Task)
+    assert events[0].id == "test-task-123"
+    assert events[0].status.state == TaskState.TASK_STATE_FAILED
+    assert "validation error" in events[0].status.message.parts[0].text
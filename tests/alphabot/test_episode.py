@@ -0,0 +1,117 @@
+"""Tests for AlphaBot's episode skill."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from alphabot.episode import run_episode
+from common.models import AlphaBotEpisodePayload, PortfolioState, TradeStatus
+
+# With SMA periods 2 and 3, day 3 crosses up and day 7 crosses down.
+HISTORY = [100.0, 100.0, 100.0]
+PRICES = [100.0, 100.0, 110.0, 120.0, 120.0, 120.0, 80.0, 80.0]
+
+
+def _payload(**overrides) -> AlphaBotEpisodePayload:
+    fields = {
+        "historical_prices": HISTORY,
+        "prices": PRICES,
+        "portfolio_state": PortfolioState(cash=10000.0, shares=0, total_value=10000.0),
+        "short_sma_period": 2,
+        "long_sma_period": 3,
+        "trade_quantity": 10,
+    }
+    return AlphaBotEpisodePayload.model_validate({**fields, **overrides})
+
+
+async def _outcomes(agent, payload, approved=True):
+    check_risk = AsyncMock(
+        return_value={"approved": approved, "reason": "Risk checked."},
+    )
+    agent.risk_check_tool().check_risk = check_risk
+    outcomes = [outcome async for outcome in run_episode(agent, payload, "ctx-1")]
+    return outcomes, check_risk
+
+
+@pytest.mark.asyncio
+async def test_run_episode_applies_approved_trades(agent) -> None:
+    """Test that approved crossovers are traded and the portfolio carried forward."""
+    outcomes, check_risk = await _outcomes(agent, _payload())
+
+    assert [outcome.day for outcome in outcomes] == list(range(1, 9))
+    assert [outcome.status for outcome in outcomes] == [
+        TradeStatus.NO_ACTION,
+        TradeStatus.NO_ACTION,
+        TradeStatus.APPROVED,
+        TradeStatus.NO_ACTION,
+        TradeStatus.NO_ACTION,
+        TradeStatus.NO_ACTION,
+        TradeStatus.APPROVED,
+        TradeStatus.NO_ACTION,
+    ]
+    assert outcomes[0].reason == "No signal (Conditions not met)."
+    assert outcomes[2].reason == "Trade Approved (A2A): Risk checked."
+    assert outcomes[2].trade_proposal is not None
+    assert outcomes[2].trade_proposal.action == "BUY"
+    assert outcomes[2].executed is True
+    assert outcomes[2].portfolio_state == PortfolioState(
+        cash=8900.0,
+        shares=10,
+        total_value=10000.0,
+    )
+    assert outcomes[5].portfolio_state.total_value == 10100.0
+    assert outcomes[6].trade_proposal is not None
+    assert outcomes[6].trade_proposal.action == "SELL"
+    assert outcomes[7].portfolio_state == PortfolioState(
+        cash=9700.0,
+        shares=0,
+        total_value=9700.0,
+    )
+
+    assert check_risk.await_count == 2
+    buy_check = check_risk.await_args_list[0]
+    assert buy_check.args[0].portfolio_state == PortfolioState(
+        cash=10000.0,
+        shares=0,
+        total_value=10000.0,
+    )
+    assert buy_check.kwargs["context_id"] == "ctx-1"
+
+
+@pytest.mark.asyncio
+async def test_run_episode_keeps_portfolio_on_rejection(agent) -> None:
+    """Test that a rejected BUY leaves the portfolio flat and the SELL unproposed."""
+    outcomes, check_risk = await _outcomes(agent, _payload(), approved=False)
+
+    assert outcomes[2].status == TradeStatus.REJECTED
+    assert outcomes[2].reason == "Trade Rejected (A2A): Risk checked."
+    assert outcomes[2].executed is None
+    assert outcomes[6].status == TradeStatus.NO_ACTION
+    assert outcomes[6].trade_proposal is None
+    assert all(outcome.portfolio_state.shares == 0 for outcome in outcomes)
+    assert check_risk.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_run_episode_reports_unaffordable_buy(agent) -> None:
+    """Test that an approved BUY the cash does not cover is not executed."""
+    payload = _payload(
+        portfolio_state=PortfolioState(cash=500.0, shares=0, total_value=500.0),
+    )
+
+    outcomes, _ = await _outcomes(agent, payload)
+
+    assert outcomes[2].status == TradeStatus.APPROVED
+    assert outcomes[2].executed is False
+    assert outcomes[2].portfolio_state.cash == 500.0
+    # AlphaBot still counts itself long, so the SELL finds no shares.
+    assert outcomes[6].reason.startswith("State correction")
+
+
+@pytest.mark.asyncio
+async def test_run_episode_warms_up_from_history(agent) -> None:
+    """Test that days before the long SMA is ready report no signal yet."""
+    outcomes, _ = await _outcomes(agent, _payload(historical_prices=[]))
+
+    assert outcomes[0].reason == "No signal yet (calculating SMAs)."
+    assert outcomes[2].reason == "No signal (Not enough history for previous SMAs)."
@@ -78,12 +78,13 @@ def test_alphabot_agent_card_wiring() -> None:
         assert agent_card is not None
         assert agent_card.name == "AlphaBot Agent"
         assert agent_card.version == "1.0.0"
-        assert agent_card.capabilities.streaming is False
+        assert agent_card.capabilities.streaming is True
         assert agent_card.capabilities.push_notifications is False
-        assert len(agent_card.skills) == 1
+        assert len(agent_card.skills) == 2
         skill = agent_card.skills[0]
         assert skill.id == "provide_trade_signal"
         assert skill.name == "Provide Trade Signal"
+        assert agent_card.skills[1].id == "run_episode"
         assert agent_card.default_input_modes == ["data"]
         assert agent_card.default_output_modes == ["data"]
 
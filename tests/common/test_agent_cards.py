@@ -0,0 +1,121 @@
+"""Tests for the process-wide agent card cache."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from a2a.client import A2AClientError
+from a2a.types import AgentCard
+
+from common.utils import agent_cards as agent_cards_module
+from common.utils.agent_cards import AgentCardCache, is_connection_error
+
+URL = "http://alphabot.test"
+
+
+@pytest.fixture
+def mock_resolver():
+    """Patch the card resolver to return a new card on every fetch."""
+    with patch("common.utils.agent_cards.A2ACardResolver") as resolver_class:
+        resolver_class.return_value.get_agent_card = AsyncMock(
+            side_effect=lambda: AgentCard(name="AlphaBot"),
+        )
+        yield resolver_class
+
+
+@pytest.mark.asyncio
+async def test_get_card_is_cached_until_ttl(mock_resolver, monkeypatch) -> None:
+    """Test that a card is reused within its TTL and fetched again after."""
+    now = 1000.0
+    monkeypatch.setattr(agent_cards_module.time, "monotonic", lambda: now)
+    cache = AgentCardCache(ttl_seconds=60.0)
+    client = MagicMock()
+
+    first = await cache.get_card(URL, client)
+    now += 59.0
+    assert await cache.get_card(URL, client) is first
+    now += 1.0
+    refreshed = await cache.get_card(URL, client)
+
+    assert refreshed is not first
+    assert mock_resolver.call_count == 2
+    mock_resolver.assert_called_with(httpx_client=client, base_url=URL)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_calls_share_one_fetch(mock_resolver) -> None:
+    """Test that concurrent calls for an uncached card fetch it once."""
+    cache = AgentCardCache(ttl_seconds=60.0)
+
+    cards = await asyncio.gather(*(cache.get_card(URL, MagicMock()) for _ in range(5)))
+
+    assert all(card is cards[0] for card in cards)
+    assert mock_resolver.call_count == 1
+    assert len(cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_forces_a_fetch(mock_resolver) -> None:
+    """Test that an invalidated card is fetched again on the next call."""
+    cache = AgentCardCache(ttl_seconds=60.0)
+    first = await cache.get_card(URL, MagicMock())
+
+    cache.invalidate(URL)
+
+    assert await cache.get_card(URL, MagicMock()) is not first
+    assert mock_resolver.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_trailing_slash_shares_the_cached_card(mock_resolver) -> None:
+    """Test that a prewarmed URL with a trailing slash serves the stripped URL."""
+    cache = AgentCardCache(ttl_seconds=60.0)
+
+    await cache.start_prewarm([f"{URL}/"], MagicMock())
+    card = await cache.get_card(URL, MagicMock())
+
+    assert await cache.get_card(f"{URL}/", MagicMock()) is card
+    assert mock_resolver.call_count == 1
+    assert mock_resolver.call_args.kwargs["base_url"] == URL
+
+    cache.invalidate(f"{URL}/")
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_prewarm_caches_cards_and_tolerates_failures(mock_resolver) -> None:
+    """Test that prewarm caches reachable agents and logs the others."""
+    down_url = "http://riskguard.test"
+
+    async def _get_agent_card():
+        if mock_resolver.call_args.kwargs["base_url"] == down_url:
+            msg = "Connection refused"
+            raise A2AClientError(msg)
+        return AgentCard(name="AlphaBot")
+
+    mock_resolver.return_value.get_agent_card = AsyncMock(side_effect=_get_agent_card)
+    cache = AgentCardCache(ttl_seconds=60.0)
+
+    with patch.object(agent_cards_module.logger, "warning") as mock_warning:
+        await cache.start_prewarm([URL, down_url], MagicMock())
+
+    assert len(cache) == 1
+    assert (await cache.get_card(URL, MagicMock())).name == "AlphaBot"
+    mock_warning.assert_called_once()
+    assert down_url in mock_warning.call_args.args[0]
+
+
+def test_is_connection_error() -> None:
+    """Test that transport errors are found through the exception chain."""
+    try:
+        try:
+            raise httpx.ConnectError("Connection refused")
+        except httpx.ConnectError as e:
+            msg = "Network error"
+            raise A2AClientError(msg) from e
+    except A2AClientError as wrapped:
+        assert is_connection_error(wrapped)
+
+    assert not is_connection_error(A2AClientError("Invalid response"))
+    assert not is_connection_error(ValueError("Bad value"))
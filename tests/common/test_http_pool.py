@@ -0,0 +1,141 @@
+"""Tests for the shared pooled HTTP client."""
+
+import asyncio
+import sys
+import threading
+from collections.abc import AsyncIterator
+
+import pytest
+import pytest_asyncio
+
+from common.utils.http_pool import HttpClientPool
+
+
+async def _serve_ok(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+) -> None:
+    """Answer every request on a keep-alive connection with a short 200."""
+    try:
+        while await reader.readuntil(b"\r\n\r\n"):
+            await asyncio.sleep(0.01)
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+@pytest_asyncio.fixture
+async def server_url() -> AsyncIterator[str]:
+    """Provide the URL of a local keep-alive HTTP server."""
+    server = await asyncio.start_server(_serve_ok, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        yield f"http://127.0.0.1:{port}"
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_connections(server_url) -> None:
+    """Test that sequential requests share one kept-alive connection."""
+    pool = HttpClientPool(max_connections=2)
+    client = pool.get_client()
+
+    for _ in range(3):
+        response = await pool.get_client().get(server_url)
+        assert response.text == "ok"
+
+    assert pool.get_client() is client
+    stats = pool.stats()
+    assert stats.connections == 1
+    assert stats.idle_connections == 1
+    assert stats.requests_sent == 3
+    assert stats.clients_created == 1
+    await pool.aclose()
+    assert client.is_closed
+    assert pool.stats().connections == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_bounds_concurrent_connections(server_url) -> None:
+    """Test that concurrent requests wait for a connection beyond the limit."""
+    pool = HttpClientPool(max_connections=2, max_keepalive_connections=2)
+    client = pool.get_client()
+
+    responses = await asyncio.gather(*(client.get(server_url) for _ in range(6)))
+
+    assert all(response.status_code == 200 for response in responses)
+    assert pool.stats().connections == 2
+    await pool.aclose()
+
+
+def test_pool_replaces_client_per_event_loop() -> None:
+    """Test that each event loop gets its own client."""
+    pool = HttpClientPool()
+
+    async def _get_client():
+        return pool.get_client()
+
+    first = asyncio.run(_get_client())
+    second = asyncio.run(_get_client())
+
+    assert first is not second
+    assert not first.is_closed  # Its loop is closed, so it is dropped.
+    assert pool.stats().clients_created == 2
+
+
+@pytest.mark.asyncio
+async def test_pool_closes_client_of_a_running_loop() -> None:
+    """Test that a replaced client is closed on its loop if that loop still runs."""
+    pool = HttpClientPool()
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+    thread.start()
+
+    async def _get_client():
+        return pool.get_client()
+
+    try:
+        old_client = await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(_get_client(), other_loop),
+        )
+        new_client = pool.get_client()
+        for _ in range(100):
+            if old_client.is_closed:
+                break
+            await asyncio.sleep(0.01)
+
+        assert new_client is not old_client
+        assert old_client.is_closed
+        assert not new_client.is_closed
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        thread.join()
+        other_loop.close()
+        await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_pool_falls_back_without_h2(monkeypatch) -> None:
+    """Test that HTTP/2 falls back to HTTP/1.1 when h2 is not installed."""
+    monkeypatch.setitem(sys.modules, "h2", None)
+    pool = HttpClientPool(http2=True)
+
+    pool.get_client()
+
+    assert pool.stats().http2 is False
+    await pool.aclose()
+
+
+def test_pool_from_env(monkeypatch) -> None:
+    """Test that the pool limits can be set from the environment."""
+    monkeypatch.setenv("HTTP_POOL_MAX_CONNECTIONS", "7")
+    monkeypatch.setenv("HTTP_POOL_MAX_KEEPALIVE_CONNECTIONS", "3")
+    monkeypatch.setenv("HTTP_POOL_HTTP2", "true")
+
+    pool = HttpClientPool.from_env()
+
+    assert pool.limits.max_connections == 7
+    assert pool.limits.max_keepalive_connections == 3
+    assert pool.http2 is True
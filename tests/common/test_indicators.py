@@ -1,8 +1,26 @@
 """Tests for the indicator calculation utilities."""
 
+import math
+import random
+
+import numpy as np
 import pytest
 
-from common.utils.indicators import calculate_sma
+from common.utils.indicators import (
+    INDICATORS,
+    RollingEMA,
+    RollingMACD,
+    RollingSMA,
+    calculate_bollinger_series,
+    calculate_ema_series,
+    calculate_rsi_series,
+    calculate_sma,
+    calculate_sma_series,
+    get_indicator,
+)
+
+# calculate_sma_series is documented to match the scalar SMA to this relative error.
+SMA_SERIES_TOLERANCE = 1e-12
 
 
 @pytest.mark.parametrize(
@@ -21,3 +39,156 @@ def test_calculate_sma_scenarios(
 ) -> None:
     """Test SMA calculation with various parameterized scenarios."""
     assert calculate_sma(prices, period) == expected_result
+
+
+def test_rolling_sma_matches_calculate_sma() -> None:
+    """Test that RollingSMA tracks calculate_sma over a stream of prices."""
+    prices = [100.0, 101.5, 99.25, 102.0, 98.75, 103.5, 104.0, 97.5, 105.25, 106.0]
+    period = 4
+    sma = RollingSMA(period)
+    for i, price in enumerate(prices, start=1):
+        value = sma.update(price)
+        expected = calculate_sma(prices[:i], period)
+        if expected is None:
+            assert value is None
+        else:
+            assert value == pytest.approx(expected, rel=1e-12)
+
+
+def test_rolling_sma_previous_value() -> None:
+    """Test that RollingSMA reports the value before the latest update."""
+    sma = RollingSMA(3)
+    assert sma.extend([1.0, 2.0, 3.0]) == 2.0
+    assert sma.previous is None
+    assert sma.update(4.0) == 3.0
+    assert sma.previous == 2.0
+    assert sma.is_ready
+
+
+def test_rolling_sma_invalid_period() -> None:
+    """Test that RollingSMA rejects non-positive periods."""
+    with pytest.raises(ValueError, match="must be positive"):
+        RollingSMA(0)
+
+
+@pytest.mark.parametrize("period", [0, -3])
+def test_calculate_sma_series_invalid_period(period: int) -> None:
+    """Test that calculate_sma_series rejects non-positive periods."""
+    with pytest.raises(ValueError, match="must be positive"):
+        calculate_sma_series([1.0, 2.0, 3.0], period)
+
+
+def test_rolling_sma_no_drift_over_long_runs() -> None:
+    """Test that compensated summation keeps the running sum drift-free."""
+    rng = random.Random(42)
+    period = 50
+    sma = RollingSMA(period)
+    prices = [1e6 + rng.uniform(-1.0, 1.0) for _ in range(100_000)]
+    sma.extend(prices)
+    assert sma.value == pytest.approx(
+        math.fsum(prices[-period:]) / period,
+        rel=0,
+        abs=1e-9,
+    )
+
+
+@pytest.mark.parametrize("period", [1, 2, 5, 30, 250])
+def test_calculate_sma_series_matches_calculate_sma(period: int) -> None:
+    """Test that the vectorized series matches calculate_sma at every point.
+
+    The cumulative sum rounds differently from summing each window, so the
+    values are compared with a relative tolerance rather than for equality.
+    """
+    rng = random.Random(period)
+    prices = [100.0]
+    for _ in range(2_000):
+        prices.append(prices[-1] * (1 + rng.gauss(0.0005, 0.02)))
+
+    series = calculate_sma_series(prices, period)
+
+    assert series.shape == (len(prices),)
+    for i in range(len(prices)):
+        expected = calculate_sma(prices[: i + 1], period)
+        if expected is None:
+            assert math.isnan(series[i])
+        else:
+            assert series[i] == pytest.approx(expected, rel=SMA_SERIES_TOLERANCE)
+
+
+def test_calculate_sma_series_edge_cases() -> None:
+    """Test warm-up, short input and 2-D input."""
+    assert np.isnan(calculate_sma_series([1.0, 2.0], 5)).all()
+    assert calculate_sma_series([], 3).shape == (0,)
+
+    rows = np.array([[1.0, 2.0, 3.0, 4.0], [10.0, 20.0, 30.0, 40.0]])
+    series = calculate_sma_series(rows, 2)
+    np.testing.assert_allclose(series[:, 1:], [[1.5, 2.5, 3.5], [15.0, 25.0, 35.0]])
+    assert np.isnan(series[:, 0]).all()
+
+
+def _random_walk(length: int, seed: int) -> list[float]:
+    """Build a reproducible price path for indicator tests."""
+    rng = random.Random(seed)
+    prices = [100.0]
+    for _ in range(length - 1):
+        prices.append(prices[-1] * (1 + rng.gauss(0.0003, 0.02)))
+    return prices
+
+
+@pytest.mark.parametrize(
+    ("name", "params"),
+    [
+        ("sma", {"period": 10}),
+        ("ema", {"period": 10}),
+        ("rsi", {"period": 14}),
+        ("macd", {"fast_period": 12, "slow_period": 26, "signal_period": 9}),
+        ("bollinger", {"period": 20, "num_std": 2.0}),
+    ],
+)
+def test_streaming_and_batch_indicators_agree(name: str, params: dict) -> None:
+    """Test that every registered indicator's two forms produce the same values."""
+    prices = _random_walk(1_000, seed=len(name))
+    spec = get_indicator(name)
+
+    streaming = spec.streaming(**params)
+    streamed = [streaming.update(price) for price in prices]
+    batch = spec.batch(prices, **params)
+    batch_rows = list(zip(*batch, strict=True)) if isinstance(batch, tuple) else batch
+
+    for streamed_value, batch_value in zip(streamed, batch_rows, strict=True):
+        expected = np.atleast_1d(np.asarray(batch_value, dtype=np.float64))
+        if streamed_value is None:
+            assert np.isnan(expected[-1])
+        else:
+            actual = np.atleast_1d(np.asarray(streamed_value, dtype=np.float64))
+            np.testing.assert_allclose(actual, expected, rtol=1e-9, atol=1e-9)
+
+
+def test_indicator_registry_lookup() -> None:
+    """Test registry contents and unknown-name handling."""
+    assert set(INDICATORS) == {"sma", "ema", "rsi", "macd", "bollinger"}
+    assert get_indicator("EMA") is INDICATORS["ema"]
+    with pytest.raises(ValueError, match="Unknown indicator"):
+        get_indicator("vwap")
+
+
+def test_indicator_known_values() -> None:
+    """Test a few hand-checked indicator values and boundary behaviours."""
+    ema = RollingEMA(3)
+    for price in (1.0, 2.0, 3.0):
+        ema.update(price)
+    assert ema.value == 2.0  # Seeded with the SMA of the first three prices.
+    assert ema.update(6.0) == pytest.approx(4.0)
+
+    rising = [float(p) for p in range(1, 30)]
+    assert calculate_rsi_series(rising, 14)[-1] == 100.0
+    assert np.isnan(calculate_rsi_series(rising, 14)[13])
+    assert calculate_rsi_series([5.0] * 20, 14)[-1] == 50.0
+
+    bands = calculate_bollinger_series([10.0] * 25, period=20)
+    assert bands.upper[-1] == bands.lower[-1] == 10.0
+
+    with pytest.raises(ValueError, match="must be shorter"):
+        RollingMACD(fast_period=26, slow_period=12)
+    with pytest.raises(ValueError, match="must be positive"):
+        calculate_ema_series([1.0, 2.0], 0)
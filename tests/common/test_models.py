@@ -1,5 +1,6 @@
 """Tests for the common data models."""
 
+import numpy as np
 import pytest
 from pydantic import ValidationError
 
@@ -105,9 +106,16 @@ def test_trade_status_enum() -> None:
     assert TradeStatus.REJECTED == "REJECTED"
     assert TradeStatus.NO_ACTION == "NO_ACTION"
     assert TradeStatus.ERROR == "ERROR"
+    assert TradeStatus.RESYNC_REQUIRED == "RESYNC_REQUIRED"
 
     # Ensure all enum values are checked
-    expected_members = {"APPROVED", "REJECTED", "NO_ACTION", "ERROR"}
+    expected_members = {
+        "APPROVED",
+        "REJECTED",
+        "NO_ACTION",
+        "ERROR",
+        "RESYNC_REQUIRED",
+    }
     assert {status.name for status in TradeStatus} == expected_members
 
 
@@ -174,3 +182,19 @@ def test_alphabot_task_payload_defaults_and_boundaries(base_portfolio_state) ->
                 "day": 5,
             },
         )
+
+
+def test_alphabot_task_payload_accepts_price_array(base_portfolio_state) -> None:
+    """Tests that a read-only NumPy history view is accepted as the price list."""
+    prices = np.array([100.0, 101.5, 99.25])
+    prices.flags.writeable = False
+
+    payload = AlphaBotTaskPayload(
+        historical_prices=prices,
+        current_price=99.25,
+        portfolio_state=base_portfolio_state,
+        day=3,
+    )
+
+    assert payload.historical_prices == [100.0, 101.5, 99.25]
+    assert all(type(price) is float for price in payload.historical_prices)
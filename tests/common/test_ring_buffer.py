@@ -0,0 +1,48 @@
+"""Tests for the array-backed price window."""
+
+from collections import deque
+
+import numpy as np
+import pytest
+
+from common.utils.ring_buffer import PriceWindow
+
+
+def test_price_window_matches_deque() -> None:
+    """Test that the window holds the same prices as a bounded deque."""
+    window = PriceWindow(5)
+    expected: deque[float] = deque(maxlen=5)
+    for price in range(1, 13):
+        window.append(float(price))
+        expected.append(float(price))
+        assert window.tolist() == list(expected)
+        assert len(window) == len(expected)
+
+    assert window[0] == 8.0
+    assert window[-1] == 12.0
+    assert list(window) == [8.0, 9.0, 10.0, 11.0, 12.0]
+    assert window[-3:].tolist() == [10.0, 11.0, 12.0]
+
+
+def test_price_window_view_is_contiguous_read_only_and_zero_copy() -> None:
+    """Test that view() is a contiguous, read-only view of the buffer."""
+    window = PriceWindow(4, [1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+
+    view = window.view()
+
+    assert view.tolist() == [3.0, 4.0, 5.0, 6.0]
+    assert view.flags.c_contiguous
+    assert not view.flags.writeable
+    assert np.shares_memory(view, window.view())
+    with pytest.raises(ValueError, match="read-only"):
+        view[0] = 0.0
+
+
+def test_price_window_partial_and_invalid() -> None:
+    """Test a partly filled window and a non-positive size."""
+    window = PriceWindow(3, [7.0])
+
+    assert window.view().tolist() == [7.0]
+    assert len(window) == 1
+    with pytest.raises(ValueError, match="Window size must be positive"):
+        PriceWindow(0)
@@ -14,6 +14,15 @@ from google.adk.sessions import InMemorySessionService, Session
 from google.genai import types as genai_types
 
 from common.models import PortfolioState, TradeProposal
+from common.utils.agent_cards import agent_cards
+
+
+@pytest.fixture(autouse=True)
+def clear_agent_cards():
+    """Start every test with an empty process-wide agent card cache."""
+    agent_cards.clear()
+    yield
+    agent_cards.clear()
 
 
 @pytest.fixture
@@ -257,7 +266,7 @@ def mock_alphabot_a2a():
     from a2a.types import AgentCard, AgentInterface
 
     with (
-        patch("alphabot.a2a_risk_tool.A2ACardResolver") as mock_resolver_class,
+        patch("common.utils.agent_cards.A2ACardResolver") as mock_resolver_class,
         patch("alphabot.a2a_risk_tool.ClientFactory") as mock_factory_class,
     ):
         mock_resolver_instance = mock_resolver_class.return_value
@@ -302,7 +311,7 @@ def mock_simulator_a2a():
     from a2a.types import AgentCard, AgentInterface
 
     with (
-        patch("simulator.main.A2ACardResolver") as mock_resolver_class,
+        patch("common.utils.agent_cards.A2ACardResolver") as mock_resolver_class,
         patch("simulator.main.ClientFactory") as mock_factory_class,
     ):
         mock_resolver_instance = mock_resolver_class.return_value
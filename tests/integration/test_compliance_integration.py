@@ -65,9 +65,10 @@ async def _parse_a2a_stream(stream) -> tuple[list[Any], Any]:
 
 
 # Helper to create RiskGuard app
-def make_riskguard_app(mock_run_async_generator) -> FastAPI:
+def make_riskguard_app(mock_run_async_generator=None) -> FastAPI:
     executor = RiskGuardAgentExecutor()
-    executor._adk_runner.run_async = mock_run_async_generator
+    if mock_run_async_generator is not None:
+        executor._adk_runner.run_async = mock_run_async_generator
     card = AgentCard(
         name="RiskGuard",
         description="Evaluates proposed trades against predefined risk rules.",
@@ -108,16 +109,18 @@ def make_riskguard_app(mock_run_async_generator) -> FastAPI:
 
 # Helper to create AlphaBot app
 def make_alphabot_app(
-    mock_run_async_generator,
+    mock_run_async_generator=None,
     risk_client: httpx.AsyncClient | None = None,
 ) -> FastAPI:
     executor = AlphaBotAgentExecutor()
-    executor._adk_runner.run_async = mock_run_async_generator
+    if mock_run_async_generator is not None:
+        executor._adk_runner.run_async = mock_run_async_generator
     if risk_client is not None:
         tools = executor._adk_agent.tools or []
         for tool in tools:
             if isinstance(tool, A2ARiskCheckTool):
                 tool.httpx_client = risk_client
+                tool._a2a_sdk_clients.clear()  # Drop clients bound to older apps
                 tool.risk_guard_url = (
                     "http://localhost:8080"  # Base url to route through ASGITransport
                 )
@@ -0,0 +1,75 @@
+"""Conformance of the vectorized simulation engine with the full A2A path."""
+
+import json
+
+import httpx
+import pytest
+
+from simulator.main import (
+    SharedA2AClients,
+    run_simulation_async,
+    run_simulation_vectorized,
+)
+from tests.integration.test_compliance_integration import (
+    make_alphabot_app,
+    make_riskguard_app,
+)
+
+PARAMS = {
+    "alphabot_short_sma": 3,
+    "alphabot_long_sma": 8,
+    "alphabot_trade_qty": 40,
+    "sim_days": 60,
+    "sim_initial_cash": 10000.0,
+    "sim_initial_price": 100.0,
+    "sim_volatility": 0.03,
+    "sim_trend": 0.0,
+    "seed": 7,
+    "riskguard_url": "http://localhost:8080",
+    "riskguard_max_pos_size": 5000.0,
+    "riskguard_max_concentration": 30,
+    "alphabot_url": "http://localhost:8081",
+}
+
+
+def _chart_traces(results: dict) -> dict[str, dict]:
+    """Return the chart's traces keyed by trace name."""
+    figure = json.loads(results["charts"]["combined_chart_json"])
+    return {trace["name"]: trace for trace in figure["data"]}
+
+
+@pytest.mark.asyncio
+async def test_vectorized_engine_matches_a2a_path() -> None:
+    """Run the real AlphaBot and RiskGuard over in-memory A2A and the vectorized engine."""
+    risk_client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=make_riskguard_app()),
+        base_url="http://localhost:8080",
+    )
+    alphabot_client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(
+            app=make_alphabot_app(risk_client=risk_client),
+        ),
+    )
+    try:
+        a2a_results = await run_simulation_async(
+            PARAMS,
+            shared_clients=SharedA2AClients(alphabot_client),
+        )
+    finally:
+        await alphabot_client.aclose()
+        await risk_client.aclose()
+    vectorized_results = run_simulation_vectorized(PARAMS)
+
+    assert a2a_results["success"] is True, a2a_results.get("error")
+    assert vectorized_results["success"] is True
+    assert vectorized_results.keys() == a2a_results.keys()
+    assert vectorized_results["final_portfolio"] == pytest.approx(
+        a2a_results["final_portfolio"],
+    )
+
+    a2a_traces = _chart_traces(a2a_results)
+    vectorized_traces = _chart_traces(vectorized_results)
+    assert vectorized_traces.keys() == a2a_traces.keys()
+    assert {"Approved Buy", "Approved Sell", "Rejected Buy"} <= a2a_traces.keys()
+    for name, trace in a2a_traces.items():
+        assert vectorized_traces[name] == trace, name
@@ -0,0 +1,112 @@
+"""Tests shared by the remote (A2A) and local (in-process) RiskGuard paths."""
+
+import sys
+from collections.abc import AsyncIterator
+from typing import Literal
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from alphabot.a2a_risk_tool import A2ARiskCheckTool, is_local_riskguard_url
+from common.config import DEFAULT_RISKGUARD_URL, LOCAL_RISKGUARD_URL
+from common.models import (
+    PortfolioState,
+    RiskCheckPayload,
+    RiskCheckResult,
+    TradeProposal,
+)
+from riskguard.rules import check_trade_risk_logic
+from tests.integration.test_compliance_integration import make_riskguard_app
+
+REMOTE_RISKGUARD_URL = "http://localhost:8080"
+
+
+@pytest_asyncio.fixture(params=["remote", "local"])
+async def risk_check(request) -> AsyncIterator[tuple[A2ARiskCheckTool, str]]:
+    """Provide the risk tool and the RiskGuard URL for each path.
+
+    The remote path calls a real RiskGuard app over A2A; the local path
+    applies the same rules in process.
+    """
+    if request.param == "local":
+        yield A2ARiskCheckTool(), LOCAL_RISKGUARD_URL
+        return
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=make_riskguard_app()),
+        base_url=REMOTE_RISKGUARD_URL,
+    ) as client:
+        yield A2ARiskCheckTool(httpx_client=client), REMOTE_RISKGUARD_URL
+
+
+def _payload(
+    action: Literal["BUY", "SELL"], quantity: int, price: float = 100.0
+) -> RiskCheckPayload:
+    return RiskCheckPayload(
+        trade_proposal=TradeProposal(
+            action=action,
+            ticker="TECH",
+            quantity=quantity,
+            price=price,
+        ),
+        portfolio_state=PortfolioState(cash=10000.0, shares=20, total_value=12000.0),
+        max_pos_size=3000.0,
+        max_concentration=0.5,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("payload", "approved"),
+    [
+        (_payload("BUY", 10), True),
+        (_payload("BUY", 200), False),  # Insufficient cash
+        (_payload("BUY", 50), False),  # Concentration
+        (_payload("SELL", 10), True),
+        (_payload("SELL", 30), False),  # Insufficient shares
+        (_payload("SELL", 20, price=200.0), False),  # Position size
+        (_payload("BUY", 40), False),  # Position size
+    ],
+)
+async def test_risk_check_matches_rules(risk_check, payload, approved) -> None:
+    """Test that both paths return RiskGuard's rule result in the same shape."""
+    tool, riskguard_url = risk_check
+
+    result = await tool.check_risk(
+        payload,
+        riskguard_url=riskguard_url,
+        context_id="ctx-risk-paths",
+        log_id="test",
+    )
+
+    expected = check_trade_risk_logic(
+        trade_proposal=payload.trade_proposal,
+        portfolio_state=payload.portfolio_state,
+        max_pos_size=payload.max_pos_size,
+        max_concentration=payload.max_concentration,
+    )
+    assert result == expected.model_dump()
+    assert result["approved"] is approved
+
+
+@pytest.mark.asyncio
+async def test_local_risk_check_without_riskguard(monkeypatch) -> None:
+    """Test that local mode rejects trades if RiskGuard's rules cannot be imported."""
+    monkeypatch.setitem(sys.modules, "riskguard.rules", None)
+
+    result = await A2ARiskCheckTool().check_risk(
+        _payload("BUY", 10),
+        riskguard_url=LOCAL_RISKGUARD_URL,
+        context_id="ctx-risk-paths",
+        log_id="test",
+    )
+
+    assert RiskCheckResult.model_validate(result).approved is False
+    assert "not installed" in result["reason"]
+
+
+def test_is_local_riskguard_url() -> None:
+    """Test that only local:// URLs select the in-process rules."""
+    assert is_local_riskguard_url(LOCAL_RISKGUARD_URL)
+    assert is_local_riskguard_url("local://")
+    assert not is_local_riskguard_url(DEFAULT_RISKGUARD_URL)
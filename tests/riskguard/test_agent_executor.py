@@ -6,7 +6,7 @@ import pytest
 from a2a.helpers import get_data_parts, new_data_part
 from a2a.server.agent_execution import RequestContext
 from a2a.server.context import ServerCallContext
-from a2a.types import Message, Role, TaskState
+from a2a.types import Message, Role, Task, TaskState
 from a2a.types import SendMessageRequest as MessageSendParams
 from a2a.types.a2a_pb2 import TaskArtifactUpdateEvent, TaskStatusUpdateEvent
 
@@ -322,3 +322,79 @@ async def test_execute_pydantic_validation_error_sanitization(
     assert isinstance(enqueued_message, TaskStatusUpdateEvent)
     assert enqueued_message.status.state == TaskState.TASK_STATE_FAILED
     assert enqueued_message.status.message.parts[0].text == "Input validation failed."
+
+
+@pytest.mark.asyncio
+async def test_execute_fast_response_single_message(
+    riskguard_message_factory,
+    mock_runner_factory,
+    event_queue,
+    adk_mock_riskguard_generator,
+) -> None:
+    """Test that fast response mode answers with only a result message."""
+    mock_runner_instance = mock_runner_factory("riskguard.agent_executor")
+    mock_runner_instance.run_async.return_value = adk_mock_riskguard_generator(
+        result_name="risk_check_result",
+        result_data={"approved": True, "reason": "Within risk parameters."},
+    )
+
+    executor = RiskGuardAgentExecutor(fast_response=True)
+    executor._adk_runner = mock_runner_instance
+    await executor.execute(
+        context=RequestContext(
+            ServerCallContext(),
+            request=MessageSendParams(message=riskguard_message_factory()),
+            context_id="test-context-456",
+            task_id="test-task-123",
+        ),
+        event_queue=event_queue,
+    )
+
+    _, events = await get_executor_results(event_queue)
+    await event_queue.close()
+
+    assert len(events) == 1
+    assert isinstance(events[0], Message)
+    assert events[0].context_id == "test-context-456"
+    assert get_data_parts(events[0].parts) == [
+        {"approved": True, "reason": "Within risk parameters."},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_execute_fast_response_failure_single_task(
+    riskguard_message_factory,
+    mock_runner_factory,
+    event_queue,
+) -> None:
+    """Test that fast response mode reports an error as one failed task."""
+    mock_runner_instance = mock_runner_factory("riskguard.agent_executor")
+    mock_runner_instance.run_async.side_effect = RuntimeError("ADK Borked")
+
+    executor = RiskGuardAgentExecutor(fast_response=True)
+    executor._adk_runner = mock_runner_instance
+    await executor.execute(
+        context=RequestContext(
+            ServerCallContext(),
+            request=MessageSendParams(message=riskguard_message_factory()),
+            context_id="test-context-456",
+            task_id="test-task-123",
+        ),
+        event_queue=event_queue,
+    )
+
+    _, events = await get_executor_results(event_queue)
+    await event_queue.close()
+
+    assert len(events) == 1
+    assert isinstance(events[0], Task)
+    assert events[0].status.state == TaskState.TASK_STATE_FAILED
+    assert events[0].status.message.parts[0].text == "ADK Borked"
+
+
+def test_fast_response_from_env(monkeypatch) -> None:
+    """Test that fast response mode can be enabled from the environment."""
+    monkeypatch.setenv("A2A_FAST_RESPONSE", "true")
+    assert RiskGuardAgentExecutor().fast_response is True
+    monkeypatch.setenv("A2A_FAST_RESPONSE", "false")
+    assert RiskGuardAgentExecutor().fast_response is False
@@ -1,9 +1,10 @@
 """Tests for the RiskGuard rules."""
 
+import numpy as np
 import pytest
 
 from common.models import PortfolioState, TradeProposal
-from riskguard.rules import check_trade_risk_logic
+from riskguard.rules import check_trade_risk_logic, check_trade_risk_vectorized
 
 
 @pytest.mark.parametrize(
@@ -210,3 +211,45 @@ def test_check_trade_risk_logic_scenarios(
 
     assert result.approved == expected_approved
     assert expected_reason in result.reason
+
+
+def test_check_trade_risk_vectorized_matches_scalar_rules() -> None:
+    """Test that the vectorized rules approve exactly what the scalar rules approve."""
+    rng = np.random.default_rng(0)
+    size = 2000
+    is_buy = rng.random(size) < 0.5
+    quantity = rng.integers(1, 200, size)
+    price = rng.uniform(1.0, 300.0, size)
+    cash = rng.uniform(0.0, 50000.0, size)
+    shares = rng.integers(0, 300, size)
+    total_value = cash + shares * price
+
+    approved = check_trade_risk_vectorized(
+        is_buy,
+        quantity,
+        price,
+        cash,
+        shares,
+        total_value,
+        max_pos_size=10000.0,
+        max_concentration=0.5,
+    )
+
+    expected = [
+        check_trade_risk_logic(
+            TradeProposal(
+                action="BUY" if buy else "SELL",
+                ticker="TECH",
+                quantity=int(qty),
+                price=float(px),
+            ),
+            PortfolioState(cash=float(c), shares=int(sh), total_value=float(tv)),
+            max_pos_size=10000.0,
+            max_concentration=0.5,
+        ).approved
+        for buy, qty, px, c, sh, tv in zip(
+            is_buy, quantity, price, cash, shares, total_value, strict=True
+        )
+    ]
+    assert approved.tolist() == expected
+    assert 0 < approved.sum() < size
@@ -0,0 +1,54 @@
+"""Tests for deferred run artifacts."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from simulator.artifacts import RunArtifactStore
+
+
+@pytest.mark.asyncio
+async def test_artifact_is_built_once_on_first_request() -> None:
+    """Test that each builder runs on its first request only."""
+    store = RunArtifactStore(max_runs=2)
+    chart = MagicMock(return_value='{"data": []}')
+    log = MagicMock(return_value="INFO: ...")
+
+    run_id = store.add({"chart": chart, "log": log})
+    chart.assert_not_called()
+
+    assert await store.get(run_id, "chart") == '{"data": []}'
+    assert await store.get(run_id, "chart") == '{"data": []}'
+    chart.assert_called_once()
+    log.assert_not_called()
+    assert await store.get(run_id, "log") == "INFO: ..."
+    assert await store.get(run_id, "unknown") is None
+
+
+@pytest.mark.asyncio
+async def test_artifact_store_drops_least_recently_used_runs() -> None:
+    """Test that the store keeps at most max_runs runs."""
+    store = RunArtifactStore(max_runs=2)
+    first = store.add({"chart": lambda: "first"})
+    second = store.add({"chart": lambda: "second"})
+    assert await store.get(first, "chart") == "first"  # "second" is now the oldest.
+    third = store.add({"chart": lambda: "third"})
+
+    assert len(store) == 2
+    assert await store.get(second, "chart") is None
+    assert await store.get(first, "chart") == "first"
+    assert await store.get(third, "chart") == "third"
+    assert await store.get("unknown", "chart") is None
+
+
+def test_touch_reports_dropped_runs() -> None:
+    """Test that touch keeps a run recently used and reports dropped runs."""
+    store = RunArtifactStore(max_runs=2)
+    first = store.add({"chart": lambda: "first"})
+    second = store.add({"chart": lambda: "second"})
+
+    assert store.touch(first) is True  # "second" is now the oldest.
+    store.add({"chart": lambda: "third"})
+
+    assert store.touch(second) is False
+    assert store.touch(first) is True
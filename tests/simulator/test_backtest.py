@@ -0,0 +1,148 @@
+"""Tests for the vectorized SMA-crossover backtest."""
+
+from typing import Any
+
+import numpy as np
+import pytest
+
+from alphabot.agent import AlphaBotAgent, determine_trade_proposal, warmed_up_sma
+from common.models import PortfolioState as CommonPortfolioState
+from common.models import TradeProposal
+from riskguard.rules import check_trade_risk_logic
+from simulator.backtest import (
+    ACTION_BUY,
+    ACTION_NONE,
+    ACTION_SELL,
+    run_sma_crossover_backtest,
+)
+from simulator.market import simulate_price_paths
+from simulator.portfolio import PortfolioState, TradeAction
+
+STRATEGY: dict[str, Any] = {
+    "short_period": 3,
+    "long_period": 8,
+    "trade_quantity": 40,
+    "initial_cash": 10000.0,
+    "max_pos_size": 5000.0,
+    "max_concentration": 0.5,
+}
+
+
+def _reference_backtest(prices: list[float], initial_price: float) -> dict:
+    """Replay one path through AlphaBot's and RiskGuard's scalar decision logic."""
+    agent = AlphaBotAgent()
+    portfolio = PortfolioState(cash=STRATEGY["initial_cash"])
+    history = [initial_price]
+    should_be_long = False
+    last_rejected = None
+    actions, approvals, totals = [], [], []
+
+    for price in prices:
+        history.append(price)
+        portfolio.update_valuation(price)
+        totals.append(portfolio.total_value)
+        short = warmed_up_sma(history, STRATEGY["short_period"])
+        long = warmed_up_sma(history, STRATEGY["long_period"])
+        sma_short, sma_long = short.value, long.value
+        signal = agent._generate_signal(
+            sma_short, sma_long, short.previous, long.previous, "reference"
+        )
+        if sma_short is None or sma_long is None:
+            signal = None
+        if signal == "SELL" and should_be_long and portfolio.shares == 0:
+            should_be_long = False
+            signal = None
+        proposal = determine_trade_proposal(
+            signal=signal,
+            should_be_long=should_be_long,
+            portfolio_state=CommonPortfolioState(
+                cash=portfolio.cash,
+                shares=portfolio.shares,
+                total_value=portfolio.total_value,
+            ),
+            current_price=price,
+            trade_quantity=STRATEGY["trade_quantity"],
+            last_rejected_trade=last_rejected,
+        )
+        if proposal is None:
+            actions.append(ACTION_NONE)
+            approvals.append(False)
+            continue
+
+        result = check_trade_risk_logic(
+            TradeProposal(**proposal),
+            CommonPortfolioState(
+                cash=portfolio.cash,
+                shares=portfolio.shares,
+                total_value=portfolio.total_value,
+            ),
+            max_pos_size=STRATEGY["max_pos_size"],
+            max_concentration=STRATEGY["max_concentration"],
+        )
+        actions.append(ACTION_BUY if proposal["action"] == "BUY" else ACTION_SELL)
+        approvals.append(result.approved)
+        if result.approved:
+            should_be_long = proposal["action"] == "BUY"
+            portfolio.execute_trade(
+                TradeAction[proposal["action"]], proposal["quantity"], price
+            )
+        else:
+            last_rejected = proposal
+
+    portfolio.update_valuation(prices[-1])
+    return {
+        "actions": actions,
+        "approved": approvals,
+        "total_value": totals,
+        "final_value": portfolio.total_value,
+    }
+
+
+def test_backtest_matches_scalar_decision_logic() -> None:
+    """Test that every path reproduces the scalar AlphaBot/RiskGuard decisions."""
+    paths = simulate_price_paths(
+        100.0, 0.03, 0.0, 150, np.random.default_rng(21), num_paths=20
+    )
+
+    result = run_sma_crossover_backtest(paths, 100.0, **STRATEGY)
+
+    assert result.approved.any()
+    assert (result.actions[~result.approved] != ACTION_NONE).any()  # Some rejections
+    for i, path in enumerate(paths):
+        expected = _reference_backtest(path.tolist(), 100.0)
+        assert result.actions[i].tolist() == expected["actions"]
+        assert result.approved[i].tolist() == expected["approved"]
+        assert result.total_value[i].tolist() == pytest.approx(expected["total_value"])
+        assert result.final_value[i] == pytest.approx(expected["final_value"])
+
+
+def test_backtest_single_path_and_metrics() -> None:
+    """Test a 1-D path, trade counts and drawdown on a hand-built series."""
+    prices = [100.0, 100.0, 100.0, 110.0, 120.0, 90.0, 60.0, 60.0]
+
+    result = run_sma_crossover_backtest(
+        prices,
+        100.0,
+        short_period=1,
+        long_period=2,
+        trade_quantity=10,
+        initial_cash=10000.0,
+        max_pos_size=10000.0,
+        max_concentration=1.0,
+    )
+
+    assert result.actions.shape == (1, len(prices))
+    assert result.actions[0].tolist() == [0, 0, 0, ACTION_BUY, 0, ACTION_SELL, 0, 0]
+    assert result.trade_count.tolist() == [2]
+    assert result.final_value[0] == pytest.approx(10000.0 - 1100.0 + 900.0)
+    peak = 10000.0 + 10 * (120.0 - 110.0)
+    assert result.max_drawdown[0] == pytest.approx((peak - 9800.0) / peak)
+
+
+def test_backtest_zero_days() -> None:
+    """Test that an empty path keeps the initial cash."""
+    result = run_sma_crossover_backtest(np.empty((3, 0)), 100.0, **STRATEGY)
+
+    assert result.final_value.tolist() == [10000.0] * 3
+    assert result.trade_count.tolist() == [0, 0, 0]
+    assert result.max_drawdown.tolist() == [0.0, 0.0, 0.0]
@@ -0,0 +1,68 @@
+"""Tests for process-pool execution of simulation batches."""
+
+import asyncio
+import operator
+
+import pytest
+
+from simulator.batch import SimulationProcessPool, compact_simulation_results
+from simulator.main import SimulationRunParams, run_simulation_job
+
+
+def test_compact_simulation_results_drops_logs() -> None:
+    """Test that only the compact keys survive."""
+    results = {
+        "success": True,
+        "final_portfolio": {"cash": 1.0},
+        "metrics": {"final_value": 1.0},
+        "charts": {},
+        "signals_log": "Day 0: ...",
+        "detailed_log": "INFO: ...",
+    }
+
+    assert compact_simulation_results(results) == {
+        "success": True,
+        "final_portfolio": {"cash": 1.0},
+        "metrics": {"final_value": 1.0},
+        "charts": {},
+    }
+    assert compact_simulation_results({"success": False, "error": "x"}) == {
+        "success": False,
+        "error": "x",
+    }
+
+
+def test_simulation_process_pool_size(monkeypatch) -> None:
+    """Test the worker count from the argument, the environment and the CPU count."""
+    monkeypatch.setenv("SIMULATION_PROCESS_WORKERS", "3")
+    assert SimulationProcessPool().max_workers == 3
+    assert SimulationProcessPool(max_workers=2).max_workers == 2
+    monkeypatch.delenv("SIMULATION_PROCESS_WORKERS")
+    assert SimulationProcessPool().max_workers >= 1
+
+
+@pytest.mark.asyncio
+async def test_simulation_process_pool_runs_jobs() -> None:
+    """Test a batch of vectorized runs in worker processes."""
+    pool = SimulationProcessPool(max_workers=2)
+    params = [
+        SimulationRunParams(
+            alphabot_short_sma=short_sma,
+            sim_days=300,
+            seed=11,
+            engine="vectorized",
+        ).to_dict()
+        for short_sma in (3, 5, 8)
+    ]
+    try:
+        assert await pool.run(operator.add, 2, 3) == 5
+        results = await asyncio.gather(
+            *(pool.run(run_simulation_job, p) for p in params),
+        )
+    finally:
+        pool.shutdown()
+
+    assert [r["success"] for r in results] == [True, True, True]
+    assert all("detailed_log" not in r for r in results)
+    assert results[0]["metrics"] == run_simulation_job(params[0])["metrics"]
+    pool.shutdown()  # A second shutdown is a no-op
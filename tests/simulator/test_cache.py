@@ -0,0 +1,141 @@
+"""Tests for the simulation result cache."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from simulator.cache import SimulationResultCache
+
+
+class FakeClock:
+    """A clock that only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    """Test that the least recently used entry is evicted when full."""
+    cache = SimulationResultCache(max_entries=2, ttl_seconds=60)
+    cache.put("a", {"success": True, "run": "a"})
+    cache.put("b", {"success": True, "run": "b"})
+    assert cache.get("a") is not None  # "b" is now the least recently used.
+    cache.put("c", {"success": True, "run": "c"})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"success": True, "run": "a"}
+    assert cache.get("c") == {"success": True, "run": "c"}
+    assert len(cache) == 2
+
+
+def test_cache_entries_expire() -> None:
+    """Test that entries are not served after their time to live."""
+    clock = FakeClock()
+    cache = SimulationResultCache(max_entries=4, ttl_seconds=10, clock=clock)
+    cache.put("a", {"success": True})
+
+    clock.now = 9.9
+    assert cache.get("a") == {"success": True}
+    clock.now = 10.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_cache_disabled_with_zero_entries() -> None:
+    """Test that a cache without entries never stores results."""
+    cache = SimulationResultCache(max_entries=0, ttl_seconds=60)
+    cache.put("a", {"success": True})
+    assert cache.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_get_or_run_shares_in_flight_runs() -> None:
+    """Test that concurrent identical requests share one run and its results."""
+    cache = SimulationResultCache(max_entries=4, ttl_seconds=60)
+    release = asyncio.Event()
+    calls = 0
+
+    async def run() -> dict[str, Any]:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"success": True, "calls": calls}
+
+    waiters = [asyncio.create_task(cache.get_or_run("key", run)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*waiters)
+
+    assert calls == 1
+    assert all(result is results[0] for result in results)
+    assert await cache.get_or_run("key", run) is results[0]
+    assert calls == 1
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+@pytest.mark.asyncio
+async def test_get_or_run_does_not_cache_failures() -> None:
+    """Test that failed runs, runs with failed days and exceptions are retried."""
+    cache = SimulationResultCache(max_entries=4, ttl_seconds=60)
+    outcomes: list[Any] = [
+        {"success": False, "error": "Connection Error"},
+        RuntimeError("boom"),
+        {"success": True, "day_errors": 2},
+        {"success": True},
+    ]
+
+    async def run() -> dict[str, Any]:
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    assert (await cache.get_or_run("key", run))["success"] is False
+    with pytest.raises(RuntimeError, match="boom"):
+        await cache.get_or_run("key", run)
+    assert (await cache.get_or_run("key", run))["day_errors"] == 2
+    assert cache.get("key") is None
+    assert await cache.get_or_run("key", run) == {"success": True}
+    assert cache.get("key") == {"success": True}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_run() -> None:
+    """Test that a caller going away leaves the run going for the others."""
+    cache = SimulationResultCache(max_entries=4, ttl_seconds=60)
+    release = asyncio.Event()
+
+    async def run() -> dict[str, Any]:
+        await release.wait()
+        return {"success": True}
+
+    first = asyncio.create_task(cache.get_or_run("key", run))
+    second = asyncio.create_task(cache.get_or_run("key", run))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    assert await second == {"success": True}
+    assert first.cancelled()
+    assert cache.get("key") == {"success": True}
+
+
+def test_cache_drops_results_that_are_no_longer_valid() -> None:
+    """Test that results rejected by is_valid are treated as a miss."""
+    kept = {"a"}
+    cache = SimulationResultCache(
+        max_entries=4,
+        ttl_seconds=60,
+        is_valid=lambda results: results["run"] in kept,
+    )
+    cache.put("a", {"success": True, "run": "a"})
+    assert cache.get("a") is not None
+
+    kept.clear()
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
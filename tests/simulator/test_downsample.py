@@ -0,0 +1,51 @@
+"""Tests for chart downsampling."""
+
+import numpy as np
+import pytest
+
+from simulator.downsample import min_max_downsample_indices
+
+
+def test_short_series_is_kept_whole() -> None:
+    """Test that a series within the target keeps every point."""
+    np.testing.assert_array_equal(
+        min_max_downsample_indices([3.0, 1.0, 2.0], 4),
+        [0, 1, 2],
+    )
+
+
+def test_downsampling_keeps_extremes_endpoints_and_kept_days() -> None:
+    """Test the point budget and that peaks, troughs and kept days survive."""
+    rng = np.random.default_rng(0)
+    values = np.cumsum(rng.normal(size=10_000))
+    keep = np.array([17, 4_321, 9_998])
+
+    indices = min_max_downsample_indices(values, 200, keep=keep)
+
+    assert len(indices) <= 200 + len(keep)
+    assert np.all(np.diff(indices) > 0)
+    assert {0, len(values) - 1, *keep} <= set(indices.tolist())
+    assert values.argmax() in indices
+    assert values.argmin() in indices
+    # Every bucket contributes its own minimum and maximum.
+    bounds = np.linspace(0, len(values) - 2, 100).astype(int)
+    buckets = np.split(values[1:-1], bounds[1:-1])
+    drawn = set(values[indices].tolist())
+    assert all(bucket.min() in drawn and bucket.max() in drawn for bucket in buckets)
+
+
+def test_downsampling_skips_nan_warm_up() -> None:
+    """Test that NaN points are only drawn as endpoints."""
+    values = np.arange(100, dtype=np.float64)
+    values[:30] = np.nan
+
+    indices = min_max_downsample_indices(values, 10)
+
+    assert 0 in indices
+    assert not np.isnan(values[indices[1:]]).any()
+
+
+def test_downsampling_rejects_tiny_targets() -> None:
+    """Test that fewer than four points is rejected."""
+    with pytest.raises(ValueError, match="at least 4 points"):
+        min_max_downsample_indices(np.arange(10), 3)
@@ -0,0 +1,84 @@
+"""Tests for the Monte Carlo ensemble backtest."""
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from simulator.ensemble import run_monte_carlo_ensemble, summarize_metric
+from simulator.main import app
+
+PARAMS = {
+    "alphabot_short_sma": 5,
+    "alphabot_long_sma": 20,
+    "alphabot_trade_qty": 50,
+    "sim_days": 120,
+    "sim_initial_cash": 100000.0,
+    "sim_initial_price": 100.0,
+    "sim_volatility": 0.02,
+    "sim_trend": 0.0005,
+    "riskguard_max_pos_size": 10000.0,
+    "riskguard_max_concentration": 50,
+}
+
+
+def test_summarize_metric_percentiles_and_intervals() -> None:
+    """Test that summaries report percentiles and intervals around the estimates."""
+    values = np.random.default_rng(0).normal(10.0, 2.0, size=5000)
+
+    summary = summarize_metric(values, np.random.default_rng(1), num_bootstrap=500)
+
+    assert summary.mean == pytest.approx(values.mean())
+    assert summary.percentiles["p50"] == pytest.approx(np.median(values))
+    assert summary.mean_ci[0] < summary.mean < summary.mean_ci[1]
+    assert summary.median_ci[0] < summary.percentiles["p50"] < summary.median_ci[1]
+    assert summary.mean_ci[1] - summary.mean_ci[0] < 0.5
+
+
+def test_run_monte_carlo_ensemble_is_reproducible() -> None:
+    """Test that a seeded ensemble gives identical summaries."""
+    first = run_monte_carlo_ensemble(PARAMS, num_paths=300, seed=5, num_bootstrap=200)
+    second = run_monte_carlo_ensemble(PARAMS, num_paths=300, seed=5, num_bootstrap=200)
+    other = run_monte_carlo_ensemble(PARAMS, num_paths=300, seed=6, num_bootstrap=200)
+
+    assert first == second
+    assert first != other
+    assert first.num_paths == 300
+    assert first.trade_count.max > 0
+    assert 0.0 <= first.max_drawdown.min <= first.max_drawdown.max < 1.0
+
+
+def test_run_ensemble_endpoint() -> None:
+    """Test the JSON ensemble endpoint and its validation."""
+    client = TestClient(app)
+
+    response = client.post(
+        "/run_ensemble",
+        json={**PARAMS, "num_paths": 50, "bootstrap_samples": 100, "seed": 3},
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["num_paths"] == 50
+    assert body["seed"] == 3
+    assert set(body["final_value"]["percentiles"]) == {"p5", "p25", "p50", "p75", "p95"}
+
+    response = client.post("/run_ensemble", json={**PARAMS, "num_paths": 0})
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize(
+    ("overrides", "message"),
+    [
+        ({"num_paths": 100000, "sim_days": 10000}, "path days"),
+        (
+            {"num_paths": 100000, "sim_days": 10, "bootstrap_samples": 10000},
+            "bootstrap draws",
+        ),
+    ],
+)
+def test_run_ensemble_rejects_oversized_ensembles(overrides, message) -> None:
+    """Test that ensembles are capped by their total size, not only per field."""
+    response = TestClient(app).post("/run_ensemble", json={**PARAMS, **overrides})
+
+    assert response.status_code == 422
+    assert message in response.text
+    assert "the limit is" in response.text
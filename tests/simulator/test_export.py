@@ -0,0 +1,86 @@
+"""Tests for the columnar export of simulation results."""
+
+import io
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from simulator.export import (
+    daily_results_table,
+    serialize_table,
+    trade_events_table,
+)
+from simulator.recorder import SimulationRecorder
+
+
+@pytest.fixture
+def recorder() -> SimulationRecorder:
+    """Return a three-day run with a rejected and an approved proposal."""
+    recorder = SimulationRecorder(3)
+    recorder.record_day(100.0, 1000.0, 0, 0.0, 1000.0)
+    recorder.record_day(101.0, 1000.0, 0, 0.0, 1000.0)
+    recorder.record_day(99.0, 900.0, 1, 99.0, 999.0)
+    recorder.record_trade(
+        0, "SELL", approved=False, quantity=1, price=100.0, reason="No shares"
+    )
+    recorder.record_trade(1, "BUY", approved=True, quantity=1, price=101.0, reason="OK")
+    return recorder
+
+
+def test_daily_results_table(recorder) -> None:
+    """Test that the daily table starts with Day and keeps the column types."""
+    table = daily_results_table(recorder.to_frame())
+
+    assert table.column_names == [
+        "Day",
+        "Price",
+        "Cash",
+        "Shares",
+        "HoldingsValue",
+        "TotalValue",
+    ]
+    assert table.column("Day").to_pylist() == [1, 2, 3]
+    assert table.schema.field("Shares").type == pa.int64()
+    assert table.to_pandas().index.name == "Day"
+
+
+def test_trade_events_table(recorder) -> None:
+    """Test that each trade proposal becomes one typed row."""
+    table = trade_events_table(recorder.trade_events)
+
+    assert table.to_pylist() == [
+        {
+            "day": 1,
+            "action": "SELL",
+            "quantity": 1,
+            "price": 100.0,
+            "approved": False,
+            "reason": "No shares",
+        },
+        {
+            "day": 2,
+            "action": "BUY",
+            "quantity": 1,
+            "price": 101.0,
+            "approved": True,
+            "reason": "OK",
+        },
+    ]
+    empty = trade_events_table([])
+    assert empty.num_rows == 0
+    assert empty.schema == table.schema
+
+
+@pytest.mark.parametrize("export_format", ["arrow", "parquet"])
+def test_serialize_table_round_trips(recorder, export_format) -> None:
+    """Test that both formats read back to the same table."""
+    table = trade_events_table(recorder.trade_events)
+
+    content = serialize_table(table, export_format)
+
+    if export_format == "arrow":
+        restored = pa.ipc.open_stream(content).read_all()
+    else:
+        restored = pq.read_table(io.BytesIO(content))
+    assert restored.equals(table)
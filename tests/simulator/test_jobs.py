@@ -0,0 +1,220 @@
+"""Tests for the background simulation job queue."""
+
+import asyncio
+from datetime import timedelta
+from typing import Any
+
+import pytest
+
+from simulator.jobs import (
+    JobQueueFullError,
+    JobStatus,
+    SimulationJob,
+    SimulationJobQueue,
+)
+
+PARAMS = {"sim_days": 3}
+
+
+def make_queue(run, state_dir=None, **kwargs: Any) -> SimulationJobQueue:
+    """Create a job queue with small limits."""
+    options: dict[str, Any] = {
+        "max_workers": 2,
+        "max_queued": 10,
+        "max_finished": 10,
+        "finished_ttl": timedelta(hours=1),
+        **kwargs,
+    }
+    return SimulationJobQueue(run, state_dir=state_dir, **options)
+
+
+async def wait_for_status(
+    queue: SimulationJobQueue,
+    job_id: str,
+    status: JobStatus,
+) -> SimulationJob:
+    """Wait until a job reaches a status."""
+    async with asyncio.timeout(5):
+        while (job := queue.get(job_id)) is None or job.status != status:
+            await asyncio.sleep(0.01)
+    return job
+
+
+async def succeed(job: SimulationJob) -> dict[str, Any]:
+    """Finish a job at once."""
+    job.days_completed = job.total_days
+    return {"success": True, "metrics": {"job": job.job_id}}
+
+
+@pytest.mark.asyncio
+async def test_jobs_run_with_bounded_concurrency() -> None:
+    """Test that submit returns at once and at most max_workers jobs run together."""
+    release = asyncio.Event()
+    running = 0
+    peak = 0
+
+    async def run(job: SimulationJob) -> dict[str, Any]:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await release.wait()
+        running -= 1
+        return await succeed(job)
+
+    queue = make_queue(run)
+    await queue.start()
+    try:
+        jobs = [queue.submit(PARAMS) for _ in range(5)]
+        assert all(job.status == JobStatus.QUEUED for job in jobs)
+        assert jobs[0].total_days == 3
+
+        await wait_for_status(queue, jobs[1].job_id, JobStatus.RUNNING)
+        await asyncio.sleep(0.05)
+        assert [job.status for job in jobs].count(JobStatus.RUNNING) == 2
+        assert queue.result(jobs[0].job_id) is None
+
+        release.set()
+        for job in jobs:
+            await wait_for_status(queue, job.job_id, JobStatus.SUCCEEDED)
+    finally:
+        await queue.stop()
+
+    assert peak == 2
+    assert queue.result(jobs[0].job_id) == {
+        "success": True,
+        "metrics": {"job": jobs[0].job_id},
+    }
+    assert jobs[0].days_completed == 3
+    assert jobs[0].started_at is not None
+    assert jobs[0].finished_at is not None
+
+
+@pytest.mark.asyncio
+async def test_failed_and_raising_jobs() -> None:
+    """Test that unsuccessful results and exceptions both mark the job failed."""
+
+    async def run(job: SimulationJob) -> dict[str, Any]:
+        if job.params.get("raise"):
+            msg = "boom"
+            raise RuntimeError(msg)
+        return {"success": False, "error": "Connection Error"}
+
+    queue = make_queue(run)
+    await queue.start()
+    try:
+        failed = queue.submit(PARAMS)
+        raised = queue.submit({**PARAMS, "raise": True})
+        await wait_for_status(queue, failed.job_id, JobStatus.FAILED)
+        await wait_for_status(queue, raised.job_id, JobStatus.FAILED)
+    finally:
+        await queue.stop()
+
+    assert failed.error == "Connection Error"
+    assert raised.error == "Unexpected error: boom"
+    assert queue.result(raised.job_id) == {
+        "success": False,
+        "error": "Unexpected error: boom",
+    }
+
+
+@pytest.mark.asyncio
+async def test_result_save_errors_fail_the_job(tmp_path, monkeypatch) -> None:
+    """Test that a disk error fails the job and the queue keeps draining."""
+    queue = make_queue(succeed, state_dir=tmp_path, max_workers=1)
+    save_result = queue._save_result
+
+    def fail_first_save(job_id: str, results: dict[str, Any]) -> None:
+        monkeypatch.setattr(queue, "_save_result", save_result)
+        msg = "No space left on device"
+        raise OSError(msg)
+
+    monkeypatch.setattr(queue, "_save_result", fail_first_save)
+    await queue.start()
+    try:
+        failed = queue.submit(PARAMS)
+        succeeded = queue.submit(PARAMS)
+        await wait_for_status(queue, failed.job_id, JobStatus.FAILED)
+        await wait_for_status(queue, succeeded.job_id, JobStatus.SUCCEEDED)
+    finally:
+        await queue.stop()
+
+    assert failed.error == "Unexpected error: No space left on device"
+    assert queue.result(succeeded.job_id) == {
+        "success": True,
+        "metrics": {"job": succeeded.job_id},
+    }
+
+
+def test_queue_rejects_jobs_when_full() -> None:
+    """Test that submit refuses jobs beyond max_queued."""
+    queue = make_queue(succeed, max_queued=2)
+    queue.submit(PARAMS)
+    queue.submit(PARAMS)
+
+    with pytest.raises(JobQueueFullError):
+        queue.submit(PARAMS)
+
+
+@pytest.mark.asyncio
+async def test_jobs_survive_a_restart(tmp_path) -> None:
+    """Test that queued and interrupted jobs run again after a restart."""
+    started = asyncio.Event()
+
+    async def hang(job: SimulationJob) -> dict[str, Any]:
+        started.set()
+        await asyncio.Event().wait()
+        return {}
+
+    first = make_queue(hang, tmp_path, max_workers=1)
+    await first.start()
+    interrupted = first.submit(PARAMS)
+    queued = first.submit({**PARAMS, "sim_days": 5})
+    await started.wait()
+    await first.stop()
+    assert interrupted.status == JobStatus.RUNNING
+
+    second = make_queue(succeed, tmp_path)
+    await second.start()
+    try:
+        await wait_for_status(second, interrupted.job_id, JobStatus.SUCCEEDED)
+        reloaded = await wait_for_status(second, queued.job_id, JobStatus.SUCCEEDED)
+    finally:
+        await second.stop()
+
+    assert reloaded.total_days == 5
+
+    # Finished jobs and their results are reloaded too.
+    third = make_queue(succeed, tmp_path)
+    await third.start()
+    await third.stop()
+    assert third.get(queued.job_id) is not None
+    assert third.result(queued.job_id) == {
+        "success": True,
+        "metrics": {"job": queued.job_id},
+    }
+
+
+@pytest.mark.asyncio
+async def test_finished_jobs_are_evicted(tmp_path) -> None:
+    """Test eviction by retention count and by age, including the job files."""
+    queue = make_queue(succeed, tmp_path, max_finished=2)
+    await queue.start()
+    try:
+        jobs = []
+        for _ in range(3):
+            jobs.append(queue.submit(PARAMS))
+            await wait_for_status(queue, jobs[-1].job_id, JobStatus.SUCCEEDED)
+    finally:
+        await queue.stop()
+
+    assert queue.get(jobs[0].job_id) is None
+    assert queue.get(jobs[2].job_id) is not None
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(
+        f"{job.job_id}.{kind}.json" for job in jobs[1:] for kind in ("job", "result")
+    )
+
+    expired = make_queue(succeed, tmp_path, finished_ttl=timedelta(0))
+    await expired.start()
+    await expired.stop()
+    assert expired.get(jobs[2].job_id) is None
+    assert list(tmp_path.iterdir()) == []
@@ -1,12 +1,17 @@
 """Tests for the simulator's main application."""
 
+import base64
+import json
+import re
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pytest
 from a2a.client import ClientFactory
-from a2a.helpers import new_data_part
+from a2a.helpers import get_data_parts, new_data_part
 from a2a.types import (
+    AgentCard,
     Message,
     Role,
 )
@@ -14,8 +19,17 @@ from fastapi.testclient import TestClient
 
 import common.config as defaults
 from common.models import TradeOutcome, TradeProposal, TradeStatus
-from simulator.main import _call_alphabot_a2a, app
+from common.utils.agent_cards import agent_cards
+from simulator.backtest import ACTION_BUY, ACTION_NONE
+from simulator.main import (
+    SimulationRunParams,
+    _call_alphabot_a2a,
+    _create_results_figure,
+    _resolve_alphabot_client,
+    app,
+)
 from simulator.portfolio import PortfolioState
+from simulator.recorder import TradeMarkers
 
 client = TestClient(app)
 
@@ -46,6 +60,15 @@ def test_health_check() -> None:
     assert response.json() == {"status": "ok"}
 
 
+def test_http_pool_stats() -> None:
+    """Test that the pooled HTTP client's statistics are served."""
+    response = client.get("/http_pool")
+    assert response.status_code == 200
+    stats = response.json()
+    assert stats["max_connections"] == defaults.DEFAULT_HTTP_MAX_CONNECTIONS
+    assert {"connections", "idle_connections", "requests_sent"} <= stats.keys()
+
+
 def test_read_main() -> None:
     """Test the main endpoint."""
     response = client.get("/")
@@ -138,7 +161,7 @@ async def test_call_alphabot_a2a_factory_raises_transport_error() -> None:
         "Resolution failed",
     )
 
-    with patch("simulator.main.A2ACardResolver") as mock_resolver:
+    with patch("common.utils.agent_cards.A2ACardResolver") as mock_resolver:
         mock_resolver.return_value.get_agent_card.side_effect = A2AClientError(
             "Resolution failed",
         )
@@ -165,6 +188,37 @@ async def test_call_alphabot_a2a_factory_raises_transport_error() -> None:
             )
 
 
+@pytest.mark.asyncio
+async def test_resolve_alphabot_client_reuses_cached_card(mock_simulator_a2a) -> None:
+    """Test that runs share AlphaBot's card and rebuild the client once it is dropped."""
+    mock_simulator_a2a["mock_resolver_instance"].get_agent_card = AsyncMock(
+        side_effect=lambda: AgentCard(name="AlphaBot"),
+    )
+    factory = mock_simulator_a2a["mock_factory_instance"]
+    httpx_client = MagicMock()
+    first_run: dict[str, Any] = {}
+    second_run: dict[str, Any] = {}
+
+    await _resolve_alphabot_client(
+        factory, httpx_client, "http://alphabot.test", first_run
+    )
+    await _resolve_alphabot_client(
+        factory, httpx_client, "http://alphabot.test", second_run
+    )
+    await _resolve_alphabot_client(
+        factory, httpx_client, "http://alphabot.test", second_run
+    )
+    assert mock_simulator_a2a["mock_resolver_class"].call_count == 1
+    assert factory.create.call_count == 2
+
+    agent_cards.invalidate("http://alphabot.test")
+    await _resolve_alphabot_client(
+        factory, httpx_client, "http://alphabot.test", second_run
+    )
+    assert mock_simulator_a2a["mock_resolver_class"].call_count == 2
+    assert factory.create.call_count == 3
+
+
 def test_run_simulation_success(mock_a2a_call) -> None:
     """Test a successful simulation run."""
     response = client.post(
@@ -379,19 +433,56 @@ def test_format_currency() -> None:
         assert format_currency(1234.56) == "€1.234,56"
 
 
-def test_ui_log_handler() -> None:
-    """Tests that UILogHandler appends records correctly."""
-    import logging
-
-    from simulator.main import UILogHandler
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("verbosity", "logged_days"),
+    [("trades", [2]), ("errors", []), ("all", [1, 2, 3])],
+)
+async def test_run_simulation_async_detailed_log_verbosity(
+    verbosity,
+    logged_days,
+) -> None:
+    """Tests that the detailed log keeps the days selected by the run's verbosity."""
+    from simulator.main import run_simulation_async
 
-    log_list: list[str] = []
-    handler = UILogHandler(log_list)
-    handler.setFormatter(logging.Formatter("%(message)s"))
-    logger = logging.getLogger("test_ui_log")
-    logger.addHandler(handler)
-    logger.warning("hello logging world")
-    assert "hello logging world" in log_list
+    no_action = {
+        "approved_trade": None,
+        "rejected_trade": None,
+        "reason": "No action",
+        "error": None,
+    }
+    buy = {
+        **no_action,
+        "approved_trade": {"action": "BUY", "quantity": 1, "price": 100.0},
+        "reason": "OK",
+    }
+    params = {
+        "alphabot_short_sma": 2,
+        "alphabot_long_sma": 3,
+        "alphabot_trade_qty": 1,
+        "sim_days": 3,
+        "sim_initial_cash": 10000.0,
+        "sim_initial_price": 100.0,
+        "sim_volatility": 0.02,
+        "sim_trend": 0.0,
+        "riskguard_url": "http://127.0.0.1:8080",
+        "riskguard_max_pos_size": 1000.0,
+        "riskguard_max_concentration": 50,
+        "alphabot_url": "http://127.0.0.1:8081",
+        "log_verbosity": verbosity,
+    }
+    with patch(
+        "simulator.main._call_alphabot_a2a",
+        side_effect=[no_action, buy, no_action],
+    ):
+        res = await run_simulation_async(params, build_charts=False)
+
+    assert res["success"] is True
+    detailed_log = res["detailed_log"]
+    assert [day for day in (1, 2, 3) if f"===== Day {day} =====" in detailed_log] == (
+        logged_days
+    )
+    assert "Final Portfolio: Cash=" in detailed_log
 
 
 def test_simulation_run_params() -> None:
@@ -457,16 +548,10 @@ def test_create_results_figure() -> None:
     )
     df.index.name = "Day"
     params = {"alphabot_short_sma": 5, "alphabot_long_sma": 30}
-    trade_markers: dict[str, list[Any]] = {
-        "approved_buy_days": [1],
-        "approved_buy_prices": [100.0],
-        "rejected_buy_days": [],
-        "rejected_buy_prices": [],
-        "approved_sell_days": [],
-        "approved_sell_prices": [],
-        "rejected_sell_days": [],
-        "rejected_sell_prices": [],
-    }
+    trade_markers = TradeMarkers.from_actions(
+        np.array([ACTION_BUY, ACTION_NONE], dtype=np.int8),
+        np.array([True, False]),
+    )
     fig = _create_results_figure(df, params, trade_markers)
     assert fig is not None
     trace_names = [getattr(t, "name", "") for t in fig.data]
@@ -485,10 +570,50 @@ def test_create_results_figure() -> None:
         ],
     )
     empty_df.index.name = "Day"
-    fig_empty = _create_results_figure(empty_df, params, trade_markers)
+    fig_empty = _create_results_figure(
+        empty_df,
+        params,
+        TradeMarkers.from_actions(
+            np.array([], dtype=np.int8), np.array([], dtype=bool)
+        ),
+    )
     assert fig_empty is not None
 
 
+def decode_plotly_array(value: Any) -> np.ndarray:
+    """Decode a trace array from Plotly JSON, which may be base64 encoded."""
+    if isinstance(value, dict):
+        return np.frombuffer(base64.b64decode(value["bdata"]), dtype=value["dtype"])
+    return np.asarray(value)
+
+
+def test_create_results_figure_downsamples_long_runs() -> None:
+    """Tests that long runs are drawn with bounded WebGL traces that keep trade days."""
+    from simulator.main import run_simulation_vectorized
+
+    params = SimulationRunParams(
+        alphabot_short_sma=5,
+        alphabot_long_sma=20,
+        sim_days=10000,
+        seed=4,
+        engine="vectorized",
+    ).to_dict()
+    results = run_simulation_vectorized(params)
+
+    traces = json.loads(results["charts"]["combined_chart_json"])["data"]
+    by_name = {trace["name"]: trace for trace in traces}
+    assert {trace["type"] for trace in traces} == {"scattergl"}
+    price_days = set(decode_plotly_array(by_name["Price"]["x"]).tolist())
+    marker_days = set()
+    for name in ("Approved Buy", "Rejected Buy", "Approved Sell", "Rejected Sell"):
+        if name in by_name:
+            marker_days |= set(decode_plotly_array(by_name[name]["x"]).tolist())
+    assert marker_days <= price_days
+    assert len(price_days) <= defaults.CHART_MAX_POINTS_PER_TRACE + len(marker_days)
+    assert {1, 10000} <= price_days
+    assert len(results["charts"]["combined_chart_json"]) < 1_000_000
+
+
 def test_render_error_page() -> None:
     """Tests that _render_error_page properly formats and renders the page."""
     from fastapi import Request
@@ -677,6 +802,7 @@ async def test_run_simulation_async_edge_cases() -> None:
         res_error = await run_simulation_async(params_error)
         assert res_error["success"] is True
         assert "A2A ERROR: Failed request mock" in res_error["signals_log"]
+        assert res_error["day_errors"] == 1
 
     # Trade execution fails (insufficient funds)
     async def mock_call_buy(*args, **kwargs):
@@ -699,3 +825,916 @@ async def test_run_simulation_async_edge_cases() -> None:
         res_fail = await run_simulation_async(params_fail)
         assert res_fail["success"] is True
         assert "Execution FAILED." in res_fail["signals_log"]
+
+
+@pytest.mark.asyncio
+async def test_run_simulation_async_sma_columns_match_history() -> None:
+    """Tests that the chart SMA columns match calculate_sma to within rounding."""
+    import math
+
+    from common.utils.indicators import calculate_sma
+    from simulator.main import _create_results_figure, run_simulation_async
+
+    params = {
+        "alphabot_short_sma": 3,
+        "alphabot_long_sma": 5,
+        "alphabot_trade_qty": 10,
+        "sim_days": 12,
+        "sim_initial_cash": 10000.0,
+        "sim_initial_price": 100.0,
+        "sim_volatility": 0.02,
+        "sim_trend": 0.0005,
+        "riskguard_url": "http://127.0.0.1:8080",
+        "riskguard_max_pos_size": 1000.0,
+        "riskguard_max_concentration": 50,
+        "alphabot_url": "http://127.0.0.1:8081",
+    }
+    no_action = {
+        "approved_trade": None,
+        "rejected_trade": None,
+        "reason": "No action",
+        "error": None,
+    }
+    with (
+        patch("simulator.main._call_alphabot_a2a", return_value=no_action),
+        patch(
+            "simulator.main._create_results_figure",
+            wraps=_create_results_figure,
+        ) as mock_figure,
+    ):
+        res = await run_simulation_async(params)
+
+    assert res["success"] is True
+    results_df = mock_figure.call_args.args[0]
+    prices = [100.0, *results_df["Price"].tolist()]
+    for i, day in enumerate(results_df.index, start=1):
+        for column, period in (("SMA_Short", 3), ("SMA_Long", 5)):
+            expected = calculate_sma(prices[: i + 1], period)
+            actual = results_df.loc[day, column]
+            if expected is None:
+                assert math.isnan(actual)
+            else:
+                assert actual == pytest.approx(expected, rel=1e-12)
+
+
+@pytest.mark.asyncio
+async def test_run_simulation_async_seed_reproduces_prices() -> None:
+    """Tests that two runs with the same seed see the same price path."""
+    from simulator.main import _create_results_figure, run_simulation_async
+
+    params = {
+        "alphabot_short_sma": 3,
+        "alphabot_long_sma": 5,
+        "alphabot_trade_qty": 10,
+        "sim_days": 8,
+        "sim_initial_cash": 10000.0,
+        "sim_initial_price": 100.0,
+        "sim_volatility": 0.02,
+        "sim_trend": 0.0005,
+        "seed": 42,
+        "riskguard_url": "http://127.0.0.1:8080",
+        "riskguard_max_pos_size": 1000.0,
+        "riskguard_max_concentration": 50,
+        "alphabot_url": "http://127.0.0.1:8081",
+    }
+    no_action = {
+        "approved_trade": None,
+        "rejected_trade": None,
+        "reason": "No action",
+        "error": None,
+    }
+    price_paths = []
+    for _ in range(2):
+        with (
+            patch("simulator.main._call_alphabot_a2a", return_value=no_action),
+            patch(
+                "simulator.main._create_results_figure",
+                wraps=_create_results_figure,
+            ) as mock_figure,
+        ):
+            res = await run_simulation_async(params)
+        assert res["success"] is True
+        price_paths.append(mock_figure.call_args.args[0]["Price"].tolist())
+
+    assert len(price_paths[0]) == 8
+    assert price_paths[0] == price_paths[1]
+
+
+def test_simulation_run_params_seed_is_optional() -> None:
+    """Tests that the seed defaults to None and rejects negative values."""
+    from pydantic import ValidationError
+
+    from simulator.main import SimulationRunParams
+
+    assert SimulationRunParams(alphabot_short_sma=5).seed is None
+    assert SimulationRunParams(alphabot_short_sma=5, seed=7).to_dict()["seed"] == 7
+    with pytest.raises(ValidationError):
+        SimulationRunParams(alphabot_short_sma=5, seed=-1)
+
+
+def test_run_simulation_accepts_empty_seed(mock_a2a_call) -> None:
+    """Tests that the form treats an empty seed field as no seed."""
+    response = client.post(
+        "/run_simulation",
+        data={
+            "alphabot_short_sma": "10",
+            "alphabot_long_sma": "20",
+            "alphabot_trade_qty": "10",
+            "sim_days": "3",
+            "sim_initial_cash": "10000",
+            "sim_initial_price": "100",
+            "sim_volatility": "0.02",
+            "sim_trend": "0.001",
+            "seed": "",
+            "riskguard_url": defaults.DEFAULT_RISKGUARD_URL,
+            "riskguard_max_pos_size": "1000",
+            "riskguard_max_concentration": "50",
+            "alphabot_url": defaults.DEFAULT_ALPHABOT_URL,
+        },
+    )
+    assert response.status_code == 200
+    assert "Simulation completed successfully." in response.text
+    assert mock_a2a_call.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_run_simulation_async_replays_market_data(
+    tmp_path,
+    monkeypatch,
+) -> None:
+    """Tests that a replay file drives the run and shortens it to the data."""
+    from simulator.main import _create_results_figure, run_simulation_async
+    from simulator.replay import import_csv_closes
+
+    csv_path = tmp_path / "prices.csv"
+    csv_path.write_text(
+        "Date,AAA,BBB\n"
+        + "\n".join(f"2024-01-{day:02d},{day}.0,{100 + day}.0" for day in range(1, 8)),
+    )
+    import_csv_closes(csv_path, tmp_path / "prices.npy")
+    monkeypatch.setenv("MARKET_DATA_DIR", str(tmp_path))
+
+    params = {
+        "alphabot_short_sma": 2,
+        "alphabot_long_sma": 3,
+        "alphabot_trade_qty": 10,
+        "sim_days": 30,
+        "sim_initial_cash": 10000.0,
+        "sim_initial_price": 100.0,
+        "sim_volatility": 0.02,
+        "sim_trend": 0.0005,
+        "replay_file": "prices.npy",
+        "replay_symbol": "BBB",
+        "riskguard_url": "http://127.0.0.1:8080",
+        "riskguard_max_pos_size": 1000.0,
+        "riskguard_max_concentration": 50,
+        "alphabot_url": "http://127.0.0.1:8081",
+    }
+    no_action = {
+        "approved_trade": None,
+        "rejected_trade": None,
+        "reason": "No action",
+        "error": None,
+    }
+    with (
+        patch("simulator.main._call_alphabot_a2a", return_value=no_action) as mock_call,
+        patch(
+            "simulator.main._create_results_figure",
+            wraps=_create_results_figure,
+        ) as mock_figure,
+    ):
+        res = await run_simulation_async(params)
+
+    assert res["success"] is True
+    assert mock_call.call_count == 6
+    prices = mock_figure.call_args.args[0]["Price"].tolist()
+    assert prices == [102.0, 103.0, 104.0, 105.0, 106.0, 107.0]
+    assert mock_call.call_args.kwargs["historical_prices"].tolist() == [
+        101.0,
+        102.0,
+        103.0,
+        104.0,
+        105.0,
+        106.0,
+        107.0,
+    ]
+
+    params["replay_file"] = "../prices.npy"
+    res = await run_simulation_async(params)
+    assert res["success"] is False
+    assert "not found in the market data directory" in res["error"]
+
+
+@pytest.mark.asyncio
+async def test_run_simulation_async_incremental_payloads_resync() -> None:
+    """Tests that incremental runs send deltas after day 1 and resync on request."""
+    from simulator.main import run_simulation_async
+
+    params = {
+        "alphabot_short_sma": 2,
+        "alphabot_long_sma": 3,
+        "alphabot_trade_qty": 10,
+        "sim_days": 4,
+        "sim_initial_cash": 10000.0,
+        "sim_initial_price": 100.0,
+        "sim_volatility": 0.02,
+        "sim_trend": 0.0005,
+        "seed": 1,
+        "incremental_payloads": True,
+        "riskguard_url": "http://127.0.0.1:8080",
+        "riskguard_max_pos_size": 1000.0,
+        "riskguard_max_concentration": 50,
+        "alphabot_url": "http://127.0.0.1:8081",
+    }
+    no_action = {
+        "approved_trade": None,
+        "rejected_trade": None,
+        "reason": "No action",
+        "error": None,
+        "resync_required": False,
+    }
+    resync = {**no_action, "resync_required": True}
+    # Day 3's incremental call is rejected once and retried with the full window.
+    outcomes = [no_action, no_action, resync, no_action, no_action]
+    with patch("simulator.main._call_alphabot_a2a", side_effect=outcomes) as mock_call:
+        res = await run_simulation_async(params)
+
+    assert res["success"] is True
+    calls = [
+        (c.kwargs["day"], c.kwargs.get("incremental")) for c in mock_call.call_args_list
+    ]
+    assert calls == [(1, False), (2, True), (3, True), (3, None), (4, True)]
+
+
+@pytest.mark.asyncio
+async def test_call_alphabot_a2a_incremental_payload(
+    mock_simulator_a2a,
+    test_agent_card,
+    mock_a2a_send_message_generator,
+) -> None:
+    """Tests that an incremental call sends only the sequence and current price."""
+    mock_simulator_a2a[
+        "mock_resolver_instance"
+    ].get_agent_card.return_value = test_agent_card
+    trade_outcome = TradeOutcome(
+        status=TradeStatus.RESYNC_REQUIRED,
+        reason="Resync required.",
+    )
+    sent_messages = []
+    send_message = mock_a2a_send_message_generator(
+        Message(
+            message_id="mock_msg_id",
+            role=Role.ROLE_AGENT,
+            parts=[new_data_part(trade_outcome.model_dump(mode="json"))],
+        ),
+    )
+
+    def _capture(request, *args, **kwargs):
+        sent_messages.append(request)
+        return send_message(request, *args, **kwargs)
+
+    mock_simulator_a2a["mock_a2a_client"].send_message = _capture
+
+    params = {
+        "alphabot_short_sma": 10,
+        "alphabot_long_sma": 20,
+        "alphabot_trade_qty": 10,
+        "riskguard_url": "http://localhost:8001",
+        "riskguard_max_pos_size": 1000.0,
+        "riskguard_max_concentration": 50,
+        "incremental_payloads": True,
+    }
+    mock_factory_instance = mock_simulator_a2a["mock_factory_instance"]
+    outcome = await _call_alphabot_a2a(
+        client_factory=mock_factory_instance,
+        httpx_client=mock_factory_instance._config.httpx_client,
+        alphabot_url="http://test.com",
+        session_id="test-session",
+        day=5,
+        current_price=101.0,
+        historical_prices=[99.0, 100.0, 101.0],
+        portfolio=PortfolioState(cash=10000.0, shares=0, total_value=10000.0),
+        params=params,
+        sim_logger=MagicMock(),
+        incremental=True,
+    )
+
+    assert outcome["resync_required"] is True
+    assert outcome["error"] is None
+    payload = get_data_parts(sent_messages[0].message.parts)[0]
+    assert payload["historical_prices"] == []
+    assert payload["sequence"] == 5
+    assert payload["current_price"] == 101.0
+
+
+def test_run_simulation_vectorized_engine(mock_a2a_call) -> None:
+    """Tests that the vectorized engine runs in process without calling AlphaBot."""
+    response = client.post(
+        "/run_simulation",
+        data={
+            "alphabot_short_sma": "3",
+            "alphabot_long_sma": "8",
+            "alphabot_trade_qty": "10",
+            "sim_days": "2000",
+            "sim_initial_cash": "10000",
+            "sim_initial_price": "100",
+            "sim_volatility": "0.02",
+            "sim_trend": "0.0",
+            "seed": "3",
+            "engine": "vectorized",
+            "riskguard_url": defaults.DEFAULT_RISKGUARD_URL,
+            "riskguard_max_pos_size": "1000",
+            "riskguard_max_concentration": "50",
+            "alphabot_url": defaults.DEFAULT_ALPHABOT_URL,
+        },
+    )
+    assert response.status_code == 200
+    assert "Simulation completed successfully." in response.text
+    assert "| Approved: Trade adheres to risk rules. | Executed." in response.text
+    assert mock_a2a_call.call_count == 0
+
+
+def test_cached_results_follow_artifact_store(monkeypatch) -> None:
+    """Tests that a cached run is rerun once its chart and log were dropped."""
+    from simulator.main import simulation_artifacts
+
+    monkeypatch.setattr(simulation_artifacts, "max_runs", 2)
+
+    def _post(seed: int) -> str:
+        response = client.post(
+            "/run_simulation",
+            data={
+                "alphabot_short_sma": "3",
+                "sim_days": "30",
+                "seed": str(seed),
+                "engine": "vectorized",
+            },
+        )
+        assert response.status_code == 200
+        match = re.search(r"/results/([0-9a-f]{32})/chart", response.text)
+        assert match is not None
+        return match.group(1)
+
+    first_run = _post(9001)
+    assert _post(9001) == first_run  # Served from the cache.
+    _post(9002)
+    _post(9003)  # Drops the first run's artifacts.
+
+    rerun = _post(9001)
+
+    assert rerun != first_run
+    assert client.get(f"/results/{rerun}/chart").status_code == 200
+    assert client.get(f"/results/{rerun}/log").status_code == 200
+
+
+def test_run_simulation_vectorized_zero_days(tmp_path, monkeypatch) -> None:
+    """Tests that an exhausted replay file yields an empty but successful run."""
+    from simulator.main import run_simulation_vectorized
+    from simulator.replay import import_csv_closes
+
+    csv_path = tmp_path / "prices.csv"
+    csv_path.write_text("Date,AAA\n2024-01-01,100.0\n")
+    import_csv_closes(csv_path, tmp_path / "prices.npy")
+    monkeypatch.setenv("MARKET_DATA_DIR", str(tmp_path))
+
+    res = run_simulation_vectorized(
+        {
+            **SimulationRunParams(alphabot_short_sma=2).to_dict(),
+            "replay_file": "prices.npy",
+        },
+    )
+
+    assert res["success"] is True
+    assert res["final_portfolio"]["cash"] == defaults.DEFAULT_SIM_INITIAL_CASH
+    assert res["signals_log"].startswith("Day 0: Initial Portfolio")
+
+
+def test_run_sweep_vectorized_heatmap() -> None:
+    """Tests that a two-parameter vectorized sweep returns a metric matrix."""
+    response = client.post(
+        "/run_sweep",
+        json={
+            "sim_days": 200,
+            "sim_initial_cash": 10000,
+            "alphabot_trade_qty": 10,
+            "riskguard_max_pos_size": 5000,
+            "engine": "vectorized",
+            "sweep": {
+                "alphabot_short_sma": [3, 5],
+                "alphabot_long_sma": {"start": 10, "stop": 30, "step": 10},
+            },
+        },
+    )
+
+    assert response.status_code == 200
+    result = response.json()
+    assert result["axes"] == {
+        "alphabot_short_sma": [3, 5],
+        "alphabot_long_sma": [10, 20, 30],
+    }
+    assert isinstance(result["seed"], int)
+    assert len(result["metrics"]["total_return_pct"]) == 2
+    assert all(len(row) == 3 for row in result["metrics"]["max_drawdown_pct"])
+    assert all(run["error"] is None for run in result["runs"])
+
+
+def test_run_sweep_a2a_isolates_sessions(mock_a2a_call) -> None:
+    """Tests that A2A sweep runs share clients but not AlphaBot sessions."""
+    response = client.post(
+        "/run_sweep",
+        json={
+            "sim_days": 3,
+            "seed": 4,
+            "max_concurrency": 2,
+            "sweep": {"riskguard_max_concentration": [20, 40, 60]},
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.json()["metrics"]["trade_count"] == [3, 3, 3]
+    calls = mock_a2a_call.call_args_list
+    assert len(calls) == 9
+    assert len({c.kwargs["session_id"] for c in calls}) == 3
+    assert len({id(c.kwargs["httpx_client"]) for c in calls}) == 1
+    assert len({id(c.kwargs["cache"]) for c in calls}) == 1
+    assert {c.kwargs["params"]["seed"] for c in calls} == {4}
+
+
+def test_run_sweep_rejects_invalid_combinations() -> None:
+    """Tests that invalid and oversized sweeps are rejected before running."""
+    response = client.post(
+        "/run_sweep",
+        json={"sweep": {"alphabot_short_sma": [0, 5]}},
+    )
+    assert response.status_code == 422
+    assert "Invalid sweep combination" in response.text
+
+    response = client.post(
+        "/run_sweep",
+        json={
+            "sweep": {
+                "alphabot_short_sma": {"start": 1, "stop": 40, "step": 1},
+                "alphabot_long_sma": {"start": 41, "stop": 80, "step": 1},
+            },
+        },
+    )
+    assert response.status_code == 422
+    assert "the limit is" in response.text
+
+
+def test_run_sweep_uses_process_pool() -> None:
+    """Tests that sweeps can hand their runs to the simulation process pool."""
+    from simulator.main import run_simulation_job, simulation_pool
+
+    async def fake_pool_run(fn, params):
+        assert fn is run_simulation_job
+        return {"success": True, "metrics": {"trade_count": params["sim_days"]}}
+
+    with patch.object(simulation_pool, "run", side_effect=fake_pool_run) as mock_run:
+        response = client.post(
+            "/run_sweep",
+            json={
+                "use_process_pool": True,
+                "engine": "vectorized",
+                "sweep": {"sim_volatility": [0.01, 0.02]},
+            },
+        )
+
+    assert response.status_code == 200
+    assert response.json()["metrics"]["trade_count"] == [100, 100]
+    assert mock_run.call_count == 2
+    assert "use_process_pool" not in mock_run.call_args.args[1]
+
+
+def _read_sse_events(params: dict[str, Any]) -> list[tuple[str, dict[str, Any]]]:
+    """Read every event from the simulation stream as (event, data) pairs."""
+    with client.stream("GET", "/run_simulation/stream", params=params) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        body = response.read().decode()
+
+    events = []
+    for block in body.replace("\r\n", "\n").split("\n\n"):
+        fields = dict(
+            line.split(": ", 1) for line in block.splitlines() if ": " in line
+        )
+        if "event" in fields:
+            events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+def test_run_simulation_stream_emits_day_events(mock_a2a_call) -> None:
+    """Tests that the stream emits one event per day before the final results."""
+    from common.utils.indicators import calculate_sma
+
+    events = _read_sse_events(
+        {
+            "alphabot_short_sma": 2,
+            "alphabot_long_sma": 4,
+            "sim_days": 5,
+            "sim_initial_price": 100,
+            "seed": 11,
+        },
+    )
+
+    assert [name for name, _ in events] == ["start", *["day"] * 5, "complete"]
+    assert events[0][1]["sim_days"] == 5
+    days = [data for name, data in events if name == "day"]
+    assert [day["day"] for day in days] == [1, 2, 3, 4, 5]
+    assert all(day["action"] == "BUY" and day["approved"] for day in days)
+    prices = [100.0, *(day["price"] for day in days)]
+    for i, day in enumerate(days, start=1):
+        assert day["sma_short"] == pytest.approx(calculate_sma(prices[: i + 1], 2))
+        if i < 3:
+            assert day["sma_long"] is None
+        else:
+            assert day["sma_long"] == pytest.approx(calculate_sma(prices[: i + 1], 4))
+    # Day events carry the start-of-day portfolio; the first trade executes on day 1.
+    assert days[0]["total_value"] == defaults.DEFAULT_SIM_INITIAL_CASH
+    assert days[1]["shares"] == 10
+
+    results = events[-1][1]
+    assert results["success"] is True
+    assert results["final_portfolio"]["shares"] == 50
+    assert "combined_chart_json" in results["charts"]
+    assert "Executed." in results["signals_log"]
+    assert mock_a2a_call.call_count == 5
+
+
+def test_run_simulation_stream_reports_errors(mock_a2a_call) -> None:
+    """Tests that a failed run ends the stream with an error event."""
+    mock_a2a_call.side_effect = ConnectionError("AlphaBot is down")
+
+    events = _read_sse_events({"alphabot_short_sma": 2, "sim_days": 3})
+
+    assert [name for name, _ in events] == ["start", "error"]
+    assert "AlphaBot is down" in events[-1][1]["error"]
+
+
+def test_run_simulation_stream_reports_engine_exceptions() -> None:
+    """Tests that an exception in the engine still ends the stream with an error."""
+    with patch(
+        "simulator.main.run_simulation_vectorized",
+        side_effect=RuntimeError("Engine exploded"),
+    ):
+        events = _read_sse_events(
+            {"alphabot_short_sma": 3, "sim_days": 5, "engine": "vectorized"},
+        )
+
+    assert [name for name, _ in events] == ["start", "error"]
+    assert events[-1][1]["error"] == "Unexpected error: Engine exploded"
+
+
+def test_run_simulation_stream_vectorized_engine(mock_a2a_call) -> None:
+    """Tests that vectorized runs stream only their final results."""
+    events = _read_sse_events(
+        {"alphabot_short_sma": 3, "sim_days": 50, "seed": 3, "engine": "vectorized"},
+    )
+
+    assert [name for name, _ in events] == ["start", "complete"]
+    assert events[-1][1]["metrics"]["trade_count"] >= 0
+    assert mock_a2a_call.call_count == 0
+
+
+def test_simulation_jobs_endpoints(mock_a2a_call) -> None:
+    """Tests submitting a job and polling its status and result."""
+    import time
+    from datetime import timedelta
+
+    from simulator.jobs import SimulationJobQueue
+    from simulator.main import _run_queued_simulation
+
+    queue = SimulationJobQueue(
+        _run_queued_simulation,
+        state_dir=None,
+        max_workers=1,
+        max_queued=10,
+        max_finished=10,
+        finished_ttl=timedelta(hours=1),
+    )
+    with patch("simulator.main.simulation_jobs", queue), TestClient(app) as jobs_client:
+        response = jobs_client.post(
+            "/jobs",
+            json={"alphabot_short_sma": 2, "sim_days": 4, "seed": 5},
+        )
+        assert response.status_code == 202
+        job = response.json()
+        assert job["status"] in {"queued", "running"}
+        assert job["total_days"] == 4
+
+        deadline = time.monotonic() + 5
+        while job["status"] not in {"succeeded", "failed"}:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+            job = jobs_client.get(f"/jobs/{job['job_id']}").json()
+
+        assert job["status"] == "succeeded"
+        assert job["days_completed"] == 4
+        result = jobs_client.get(f"/jobs/{job['job_id']}/result").json()
+        assert result["success"] is True
+        assert result["final_portfolio"]["shares"] == 40
+        assert mock_a2a_call.call_count == 4
+
+        assert jobs_client.get("/jobs/unknown").status_code == 404
+        assert jobs_client.get("/jobs/unknown/result").status_code == 404
+
+
+def test_simulation_job_result_conflict_until_finished() -> None:
+    """Tests that the result endpoint answers 409 while the job is still queued."""
+    from datetime import timedelta
+
+    from simulator.jobs import SimulationJobQueue
+
+    queue = SimulationJobQueue(
+        AsyncMock(),
+        state_dir=None,
+        max_workers=1,
+        max_queued=10,
+        max_finished=10,
+        finished_ttl=timedelta(hours=1),
+    )
+    with patch("simulator.main.simulation_jobs", queue):
+        job = client.post("/jobs", json={"alphabot_short_sma": 2}).json()
+        response = client.get(f"/jobs/{job['job_id']}/result")
+
+    assert response.status_code == 409
+    assert "queued" in response.json()["detail"]
+
+
+def test_simulation_run_params_cache_key_is_canonical() -> None:
+    """Tests that equal parameters hash alike and any change alters the key."""
+    base = SimulationRunParams(alphabot_short_sma=5, sim_initial_price=100, seed=1)
+    same = SimulationRunParams(seed=1, sim_initial_price=100.0, alphabot_short_sma=5)
+
+    assert base.cache_key() == same.cache_key()
+    assert base.cache_key() != base.model_copy(update={"seed": 2}).cache_key()
+    assert base.cache_key() != base.model_copy(update={"sim_days": 7}).cache_key()
+
+
+def test_run_simulation_caches_seeded_runs(mock_a2a_call) -> None:
+    """Tests that resubmitting a seeded form is served from the cache."""
+    from simulator.cache import SimulationResultCache
+
+    form = {
+        "alphabot_short_sma": "2",
+        "sim_days": "3",
+        "riskguard_url": defaults.DEFAULT_RISKGUARD_URL,
+        "alphabot_url": defaults.DEFAULT_ALPHABOT_URL,
+    }
+    cache = SimulationResultCache(max_entries=4, ttl_seconds=60)
+    with patch("simulator.main.simulation_results_cache", cache):
+        first = client.post("/run_simulation", data={**form, "seed": "9"})
+        second = client.post("/run_simulation", data={**form, "seed": "9"})
+        assert mock_a2a_call.call_count == 3
+
+        # Runs without a seed are not deterministic, so they always run.
+        client.post("/run_simulation", data=form)
+        assert mock_a2a_call.call_count == 6
+
+    assert "Simulation completed successfully." in second.text
+    assert first.text == second.text
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_run_simulation_defers_the_chart(mock_a2a_call) -> None:
+    """Tests that the results page links the chart, which is built on request."""
+    import re
+
+    response = client.post(
+        "/run_simulation",
+        data={
+            "alphabot_short_sma": "2",
+            "sim_days": "5",
+            "riskguard_url": defaults.DEFAULT_RISKGUARD_URL,
+            "alphabot_url": defaults.DEFAULT_ALPHABOT_URL,
+        },
+    )
+    assert response.status_code == 200
+    assert '"layout":' not in response.text
+    match = re.search(r'data-chart-url="(/results/\w+/chart)"', response.text)
+    assert match is not None
+
+    with patch(
+        "simulator.main._create_results_figure",
+        wraps=_create_results_figure,
+    ) as mock_figure:
+        chart = client.get(match.group(1))
+        assert client.get(match.group(1)).json() == chart.json()
+    assert mock_figure.call_count == 1
+    assert chart.status_code == 200
+    trace_names = [trace["name"] for trace in chart.json()["data"]]
+    assert "Price" in trace_names
+    assert "Approved Buy" in trace_names
+
+    missing = client.get("/results/unknown/chart")
+    assert missing.status_code == 404
+
+
+def test_run_simulation_defers_the_detailed_log(mock_a2a_call) -> None:
+    """Tests that the results page links the detailed log, formatted on request."""
+    import re
+
+    response = client.post(
+        "/run_simulation",
+        data={
+            "alphabot_short_sma": "2",
+            "sim_days": "5",
+            "log_verbosity": "all",
+            "riskguard_url": defaults.DEFAULT_RISKGUARD_URL,
+            "alphabot_url": defaults.DEFAULT_ALPHABOT_URL,
+        },
+    )
+    assert response.status_code == 200
+    match = re.search(r'href="(/results/\w+/log)"', response.text)
+    assert match is not None
+
+    detailed_log = client.get(match.group(1))
+    assert detailed_log.status_code == 200
+    assert detailed_log.headers["content-type"].startswith("text/plain")
+    assert "===== Day 5 =====" in detailed_log.text
+
+    missing = client.get("/results/unknown/log")
+    assert missing.status_code == 404
+
+
+def test_run_simulation_exports_results(mock_a2a_call) -> None:
+    """Tests that a run's daily results and trade events can be exported."""
+    import io
+    import re
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    response = client.post(
+        "/run_simulation",
+        data={
+            "alphabot_short_sma": "2",
+            "sim_days": "5",
+            "riskguard_url": defaults.DEFAULT_RISKGUARD_URL,
+            "alphabot_url": defaults.DEFAULT_ALPHABOT_URL,
+        },
+    )
+    assert response.status_code == 200
+    match = re.search(
+        r'href="(/results/\w+/export/)daily\?format=arrow"', response.text
+    )
+    assert match is not None
+    export_url = match.group(1)
+
+    daily = client.get(f"{export_url}daily")
+    assert daily.status_code == 200
+    assert daily.headers["content-type"] == "application/vnd.apache.arrow.stream"
+    assert "attachment" in daily.headers["content-disposition"]
+    daily_table = pa.ipc.open_stream(daily.content).read_all()
+    assert daily_table.column("Day").to_pylist() == [1, 2, 3, 4, 5]
+    # The chart's SMA columns are not part of the export.
+    client.get(response.text.split('data-chart-url="')[1].split('"')[0])
+    assert (
+        "SMA_Short"
+        not in pa.ipc.open_stream(
+            client.get(f"{export_url}daily").content,
+        )
+        .read_all()
+        .column_names
+    )
+
+    trades = client.get(f"{export_url}trades", params={"format": "parquet"})
+    assert trades.status_code == 200
+    trades_table = pq.read_table(io.BytesIO(trades.content))
+    assert trades_table.column("action").to_pylist() == ["BUY"] * 5
+    assert trades_table.column("approved").to_pylist() == [True] * 5
+    assert trades_table.column("quantity").to_pylist() == [10] * 5
+
+    assert client.get("/results/unknown/export/daily").status_code == 404
+    assert client.get(f"{export_url}signals").status_code == 422
+    assert client.get(f"{export_url}daily?format=csv").status_code == 422
+
+
+def test_simulator_import_defers_heavy_modules() -> None:
+    """Tests that importing the app loads neither pandas, Plotly, Arrow nor the agents."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, simulator.main; "
+        "print(sorted(m for m in ('pandas', 'plotly', 'pyarrow', 'riskguard', 'google.adk') "
+        "if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "[]"
+
+
+@pytest.mark.asyncio
+async def test_run_simulation_episode_matches_vectorized(mock_simulator_a2a) -> None:
+    """Tests that the episode engine streams the same run as the vectorized engine."""
+    from a2a.types import Artifact, StreamResponse, TaskArtifactUpdateEvent
+
+    from alphabot.agent import AlphaBotAgent
+    from alphabot.episode import run_episode
+    from common.models import AlphaBotEpisodePayload, EpisodeChunk, RiskCheckResult
+    from riskguard.rules import check_trade_risk_logic
+    from simulator.main import run_simulation_async, run_simulation_vectorized
+
+    agent = AlphaBotAgent(stock_ticker=defaults.DEFAULT_TICKER)
+
+    async def _check_risk(risk_payload, **kwargs) -> dict[str, Any]:
+        result: RiskCheckResult = check_trade_risk_logic(
+            risk_payload.trade_proposal,
+            risk_payload.portfolio_state,
+            max_pos_size=risk_payload.max_pos_size,
+            max_concentration=risk_payload.max_concentration,
+        )
+        return result.model_dump()
+
+    risk_tool = agent.risk_check_tool()
+    assert risk_tool is not None
+    risk_tool.check_risk = AsyncMock(side_effect=_check_risk)
+    requests = []
+
+    async def _send_message(request):
+        requests.append(request)
+        payload = AlphaBotEpisodePayload.model_validate(
+            get_data_parts(request.message.parts)[0],
+        )
+        chunk = []
+        async for outcome in run_episode(agent, payload, "ctx"):
+            chunk.append(outcome)
+            if len(chunk) == 40:
+                yield StreamResponse(
+                    artifact_update=TaskArtifactUpdateEvent(
+                        artifact=Artifact(
+                            name="episode",
+                            parts=[
+                                new_data_part(
+                                    EpisodeChunk(days=chunk).model_dump(mode="json"),
+                                ),
+                            ],
+                        ),
+                    ),
+                )
+                chunk = []
+
+    mock_simulator_a2a["mock_a2a_client"].send_message = _send_message
+    params = {
+        **SimulationRunParams(
+            alphabot_short_sma=3,
+            alphabot_long_sma=8,
+            alphabot_trade_qty=10,
+            sim_days=200,
+            sim_initial_cash=10000,
+            seed=3,
+            riskguard_max_pos_size=1000,
+            riskguard_max_concentration=50,
+        ).to_dict(),
+        "engine": "episode",
+    }
+    days = []
+
+    async def _on_day(event: dict[str, Any]) -> None:
+        days.append(event["day"])
+
+    episode = await run_simulation_async(params, build_charts=False, on_day=_on_day)
+    vectorized = run_simulation_vectorized(params, build_charts=False)
+
+    assert episode["success"] is True
+    assert len(requests) == 1
+    assert days == list(range(1, 201))
+    assert episode["metrics"] == vectorized["metrics"]
+    assert episode["metrics"]["trade_count"] > 0
+    assert episode["final_portfolio"] == vectorized["final_portfolio"]
+    assert (
+        "| Approved: Trade Approved (A2A): Trade adheres to risk rules. | Executed."
+        in episode["signals_log"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_simulation_episode_reports_missing_days(mock_simulator_a2a) -> None:
+    """Tests that an episode that ends early fails the run."""
+    from a2a.types import StreamResponse, Task, TaskStatus
+    from a2a.types import TaskState as A2ATaskState
+
+    from simulator.main import run_simulation_async
+
+    async def _send_message(request):
+        yield StreamResponse(
+            task=Task(status=TaskStatus(state=A2ATaskState.TASK_STATE_FAILED)),
+        )
+
+    mock_simulator_a2a["mock_a2a_client"].send_message = _send_message
+    params = {
+        **SimulationRunParams(alphabot_short_sma=2, sim_days=5).to_dict(),
+        "engine": "episode",
+    }
+
+    result = await run_simulation_async(params)
+
+    assert result["success"] is False
+    assert result["error"] == (
+        "AlphaBot episode ended after 0 of 5 days: AlphaBot task execution failed."
+    )
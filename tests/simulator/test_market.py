@@ -2,7 +2,14 @@
 
 import random
 
-from simulator.market import MarketDataSimulator
+import numpy as np
+import pytest
+
+from simulator.market import (
+    MarketDataSimulator,
+    MultiAssetMarketSimulator,
+    simulate_price_paths,
+)
 
 
 def test_market_data_simulator_initialization() -> None:
@@ -194,3 +201,196 @@ def test_market_data_simulator_single_history_size() -> None:
     # Check that history size is maintained
     assert len(simulator.history) == 1
     assert simulator.history[0] == simulator.get_current_price()
+
+
+def test_market_data_simulator_seed_is_reproducible() -> None:
+    """Test that simulators with the same seed produce the same path."""
+    simulator1 = MarketDataSimulator(initial_price=100.0, seed=123)
+    simulator2 = MarketDataSimulator(initial_price=100.0, seed=123)
+    simulator3 = MarketDataSimulator(initial_price=100.0, seed=124)
+
+    prices1 = [simulator1.next_price() for _ in range(50)]
+    prices2 = [simulator2.next_price() for _ in range(50)]
+    prices3 = [simulator3.next_price() for _ in range(50)]
+
+    assert prices1 == prices2
+    assert prices1 != prices3
+    assert simulator1.get_historical_prices() == simulator2.get_historical_prices()
+
+
+def test_market_data_simulator_seed_ignores_global_random(monkeypatch) -> None:
+    """Test that block mode does not draw from the global random module."""
+
+    def fail(mu: float, sigma: float) -> float:
+        raise AssertionError("random.normalvariate should not be called")
+
+    monkeypatch.setattr(random, "normalvariate", fail)
+    simulator = MarketDataSimulator(initial_price=100.0, seed=1)
+
+    assert simulator.next_price() > 0
+
+
+def test_market_data_simulator_block_size_does_not_change_path() -> None:
+    """Test that refilling the buffer continues the same seeded path."""
+    whole = MarketDataSimulator(initial_price=100.0, seed=7, block_size=100)
+    chunked = MarketDataSimulator(initial_price=100.0, seed=7, block_size=3)
+
+    whole_prices = [whole.next_price() for _ in range(100)]
+    chunked_prices = [chunked.next_price() for _ in range(100)]
+
+    assert chunked_prices == pytest.approx(whole_prices, rel=1e-12)
+
+
+def test_market_data_simulator_block_mode_history_limit() -> None:
+    """Test that block mode keeps the history window and current price in sync."""
+    simulator = MarketDataSimulator(
+        initial_price=100.0,
+        history_size=5,
+        seed=3,
+        block_size=4,
+    )
+    prices = [simulator.next_price() for _ in range(9)]
+
+    assert simulator.get_historical_prices() == prices[-5:]
+    assert simulator.get_current_price() == prices[-1]
+
+
+def test_market_data_simulator_invalid_block_size() -> None:
+    """Test that a non-positive block size is rejected."""
+    with pytest.raises(ValueError, match="Block size must be positive"):
+        MarketDataSimulator(block_size=0)
+
+
+def test_simulate_price_paths_matches_step_recursion() -> None:
+    """Test the vectorized paths against the per-day recursion, including the floor."""
+    rng = np.random.default_rng(5)
+    paths = simulate_price_paths(1.5, 0.1, -0.05, 200, rng, num_paths=4)
+
+    changes = np.random.default_rng(5).normal(-0.05, 0.1, size=(4, 200))
+    assert paths.shape == (4, 200)
+    for path, path_changes in zip(paths, changes, strict=True):
+        price = 1.5
+        expected = []
+        for change in path_changes:
+            price = max(1.0, price * (1 + change))
+            expected.append(price)
+        assert path.tolist() == pytest.approx(expected, rel=1e-9)
+    assert paths.min() == 1.0
+
+
+def test_simulate_price_paths_per_path_initial_prices() -> None:
+    """Test that an array of initial prices starts each path from its own price."""
+    rng = np.random.default_rng(0)
+    paths = simulate_price_paths([50.0, 200.0], 0.0, 0.01, 3, rng, num_paths=2)
+
+    assert paths[0].tolist() == pytest.approx([50.5, 51.005, 51.51505])
+    assert paths[1].tolist() == pytest.approx([202.0, 204.02, 206.0602])
+
+
+def test_multi_asset_simulator_matches_correlation() -> None:
+    """Test that daily changes follow the requested correlation matrix."""
+    correlation = [[1.0, 0.8, -0.3], [0.8, 1.0, 0.0], [-0.3, 0.0, 1.0]]
+    simulator = MultiAssetMarketSimulator(
+        ["AAA", "BBB", "CCC"],
+        correlation,
+        volatility=0.01,
+        trend=0.0,
+        history_size=5001,
+        seed=11,
+    )
+    for _ in range(5000):
+        simulator.next_prices()
+
+    window = simulator.get_history_window()
+    returns = window[1:] / window[:-1] - 1
+    assert window.shape == (5001, 3)
+    np.testing.assert_allclose(np.corrcoef(returns.T), correlation, atol=0.05)
+    np.testing.assert_allclose(returns.std(axis=0), 0.01, rtol=0.05)
+
+
+def test_multi_asset_simulator_history_matches_single_asset_interface() -> None:
+    """Test per-ticker history windows behave like MarketDataSimulator's."""
+    simulator = MultiAssetMarketSimulator(
+        ["AAA", "BBB"],
+        np.eye(2),
+        initial_prices=[50.0, 150.0],
+        history_size=4,
+        seed=2,
+        block_size=3,
+    )
+    assert simulator.get_historical_prices("BBB") == [150.0]
+
+    days = [simulator.next_prices() for _ in range(6)]
+
+    assert simulator.get_historical_prices("AAA") == [day[0] for day in days[-4:]]
+    assert simulator.get_historical_prices("BBB") == [day[1] for day in days[-4:]]
+    assert simulator.get_current_price("BBB") == days[-1][1]
+    with pytest.raises(KeyError, match="Unknown ticker"):
+        simulator.get_historical_prices("ZZZ")
+
+
+def test_multi_asset_simulator_seed_and_floor() -> None:
+    """Test that seeded baskets are reproducible and respect the price floor."""
+    tickers = [f"T{i}" for i in range(50)]
+    correlation = np.full((50, 50), 0.5) + 0.5 * np.eye(50)
+
+    def run() -> np.ndarray:
+        simulator = MultiAssetMarketSimulator(
+            tickers,
+            correlation,
+            initial_prices=1.5,
+            volatility=0.1,
+            trend=-0.05,
+            seed=9,
+        )
+        return np.array([simulator.next_prices() for _ in range(100)])
+
+    first, second = run(), run()
+    np.testing.assert_array_equal(first, second)
+    assert first.min() == 1.0
+
+
+def test_multi_asset_simulator_perfect_correlation() -> None:
+    """Test that a singular but valid correlation matrix is accepted."""
+    simulator = MultiAssetMarketSimulator(
+        ["AAA", "BBB"],
+        np.ones((2, 2)),
+        volatility=0.02,
+        seed=4,
+    )
+    prices = np.array([simulator.next_prices() for _ in range(20)])
+
+    np.testing.assert_allclose(prices[:, 0], prices[:, 1])
+
+
+@pytest.mark.parametrize(
+    ("tickers", "correlation", "match"),
+    [
+        (["AAA", "BBB"], np.eye(3), "must have shape"),
+        (["AAA", "BBB"], [[1.0, 0.5], [0.2, 1.0]], "symmetric"),
+        (["AAA", "BBB"], [[2.0, 0.0], [0.0, 2.0]], "ones on the diagonal"),
+        (
+            ["A", "B", "C"],
+            [[1, 0.9, -0.9], [0.9, 1, 0.9], [-0.9, 0.9, 1]],
+            "semi-definite",
+        ),
+        (["AAA", "AAA"], np.eye(2), "unique"),
+    ],
+)
+def test_multi_asset_simulator_invalid_inputs(tickers, correlation, match) -> None:
+    """Test validation of tickers and the correlation matrix."""
+    with pytest.raises(ValueError, match=match):
+        MultiAssetMarketSimulator(tickers, correlation)
+
+
+def test_market_data_simulator_history_view() -> None:
+    """Test that the history view matches the list without copying the buffer."""
+    simulator = MarketDataSimulator(initial_price=100.0, history_size=5, seed=8)
+    for _ in range(7):
+        simulator.next_price()
+
+    view = simulator.get_history_view()
+
+    assert view.tolist() == simulator.get_historical_prices()
+    assert not view.flags.writeable
+    assert np.shares_memory(view, simulator.get_history_view())
@@ -0,0 +1,74 @@
+"""Tests for the columnar simulation results recorder."""
+
+import numpy as np
+
+from simulator.backtest import ACTION_BUY, ACTION_NONE
+from simulator.recorder import SimulationRecorder
+
+
+def test_recorder_frame_shares_the_columns() -> None:
+    """Test that recorded days come back as a Day-indexed frame without copies."""
+    recorder = SimulationRecorder(3)
+    assert recorder.record_day(100.0, 1000.0, 0, 0.0, 1000.0) == 0
+    assert recorder.record_day(101.0, 899.0, 1, 101.0, 1000.0) == 1
+
+    frame = recorder.to_frame()
+
+    assert list(frame.index) == [1, 2]
+    assert frame.index.name == "Day"
+    assert list(frame.columns) == [
+        "Price",
+        "Cash",
+        "Shares",
+        "HoldingsValue",
+        "TotalValue",
+    ]
+    assert frame["Shares"].dtype == np.int64
+    assert frame.loc[2, "HoldingsValue"] == 101.0
+    assert np.shares_memory(frame["Price"].to_numpy(), recorder.prices)
+    assert np.shares_memory(frame["Shares"].to_numpy(), recorder.shares)
+
+
+def test_recorder_trade_markers() -> None:
+    """Test that trades are returned as row positions by action and outcome."""
+    recorder = SimulationRecorder(5)
+    for price in (10.0, 11.0, 12.0, 13.0, 14.0):
+        recorder.record_day(price, 0.0, 0, 0.0, 0.0)
+    recorder.record_trade(0, "BUY", approved=True)
+    recorder.record_trade(2, "SELL", approved=False)
+    recorder.record_trade(3, "SELL", approved=True)
+
+    markers = recorder.trade_markers()
+
+    np.testing.assert_array_equal(markers.approved_buy, [0])
+    assert len(markers.rejected_buy) == 0
+    np.testing.assert_array_equal(markers.approved_sell, [3])
+    np.testing.assert_array_equal(markers.rejected_sell, [2])
+    np.testing.assert_array_equal(markers.all_positions(), [0, 2, 3])
+    assert (markers.trade_count, markers.rejected_count) == (2, 1)
+    np.testing.assert_array_equal(
+        recorder.to_frame()["Price"].to_numpy()[markers.approved_sell],
+        [13.0],
+    )
+
+
+def test_recorder_from_arrays() -> None:
+    """Test wrapping the columns of a vectorized backtest."""
+    prices = np.array([10.0, 20.0])
+    shares = np.array([0, 5])
+    recorder = SimulationRecorder.from_arrays(
+        prices,
+        np.array([100.0, 50.0]),
+        shares,
+        np.array([100.0, 150.0]),
+        np.array([ACTION_BUY, ACTION_NONE], dtype=np.int8),
+        np.array([True, False]),
+    )
+
+    frame = recorder.to_frame()
+    assert list(frame["HoldingsValue"]) == [0.0, 100.0]
+    assert np.shares_memory(frame["Price"].to_numpy(), prices)
+    markers = recorder.trade_markers()
+    np.testing.assert_array_equal(markers.approved_buy, [0])
+    assert markers.trade_count == 1
+    assert markers.rejected_count == 0
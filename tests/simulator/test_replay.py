@@ -0,0 +1,114 @@
+"""Tests for the memory-mapped historical replay source."""
+
+import json
+
+import numpy as np
+import pytest
+from click.testing import CliRunner
+
+from simulator.market import MarketDataSource
+from simulator.replay import HistoricalReplaySource, import_csv_closes, main
+
+CSV_TEXT = """Date,AAA,BBB
+2024-01-03,11.0,
+2024-01-02,10.0,20.0
+2024-01-04,12.0,22.0
+2024-01-05,13.0,23.0
+2024-01-08,14.0,24.0
+"""
+
+
+@pytest.fixture
+def replay_file(tmp_path):
+    """Import a small wide-format CSV and return the replay file path."""
+    csv_path = tmp_path / "prices.csv"
+    csv_path.write_text(CSV_TEXT)
+    output_path = tmp_path / "data" / "prices.npy"
+    assert import_csv_closes(csv_path, output_path) == ["AAA", "BBB"]
+    return output_path
+
+
+def test_import_csv_closes_sorts_and_fills(replay_file) -> None:
+    """Test that rows are sorted by date and gaps are carried forward."""
+    closes = np.load(replay_file)
+
+    assert closes.tolist() == [
+        [10.0, 20.0],
+        [11.0, 20.0],
+        [12.0, 22.0],
+        [13.0, 23.0],
+        [14.0, 24.0],
+    ]
+    assert replay_file.with_suffix(".json").exists()
+
+
+def test_import_csv_closes_drops_leading_missing_closes(tmp_path) -> None:
+    """Test that leading blank closes are dropped, not filled from later days."""
+    csv_path = tmp_path / "late.csv"
+    csv_path.write_text(
+        "Date,AAA,BBB\n2024-01-02,10.0,\n2024-01-03,11.0,21.0\n2024-01-04,,22.0\n",
+    )
+    output_path = tmp_path / "late.npy"
+
+    import_csv_closes(csv_path, output_path)
+
+    assert np.load(output_path).tolist() == [[11.0, 21.0], [11.0, 22.0]]
+    metadata = json.loads(output_path.with_suffix(".json").read_text())
+    assert metadata["start_date"] == "2024-01-03"
+
+    csv_path.write_text("Date,AAA,BBB\n2024-01-02,10.0,\n")
+    with pytest.raises(ValueError, match="every symbol has a close"):
+        import_csv_closes(csv_path, output_path)
+
+
+def test_import_csv_closes_requires_date_column(tmp_path) -> None:
+    """Test that a CSV without the date column is rejected."""
+    csv_path = tmp_path / "bad.csv"
+    csv_path.write_text("Day,AAA\n1,10.0\n")
+
+    with pytest.raises(ValueError, match="no 'Date' column"):
+        import_csv_closes(csv_path, tmp_path / "bad.npy")
+
+
+def test_replay_source_streams_days(replay_file) -> None:
+    """Test replay prices, history windows and the end of the data."""
+    source = HistoricalReplaySource(replay_file, symbol="BBB", history_size=3)
+
+    assert isinstance(source, MarketDataSource)
+    assert isinstance(source._closes, np.memmap)
+    assert source.get_current_price() == 20.0
+    assert source.get_historical_prices() == [20.0]
+    assert source.remaining_days == 4
+
+    prices = [source.next_price() for _ in range(4)]
+
+    assert prices == [20.0, 22.0, 23.0, 24.0]
+    assert source.get_historical_prices() == [22.0, 23.0, 24.0]
+    assert source.remaining_days == 0
+    with pytest.raises(EOFError):
+        source.next_price()
+
+
+def test_replay_source_defaults_and_validation(replay_file) -> None:
+    """Test the default symbol, start index and invalid arguments."""
+    source = HistoricalReplaySource(replay_file, start_index=2)
+
+    assert source.symbol == "AAA"
+    assert source.get_historical_prices() == [12.0]
+    assert source.next_price() == 13.0
+    with pytest.raises(ValueError, match="Symbol 'ZZZ' not found"):
+        HistoricalReplaySource(replay_file, symbol="ZZZ")
+    with pytest.raises(ValueError, match="Start index 5 is outside"):
+        HistoricalReplaySource(replay_file, start_index=5)
+
+
+def test_replay_cli_imports_csv(tmp_path) -> None:
+    """Test the CSV import command."""
+    csv_path = tmp_path / "prices.csv"
+    csv_path.write_text(CSV_TEXT)
+
+    result = CliRunner().invoke(main, [str(csv_path), str(tmp_path / "out")])
+
+    assert result.exit_code == 0
+    assert "Wrote 2 symbols" in result.output
+    assert np.load(tmp_path / "out.npy").shape == (5, 2)
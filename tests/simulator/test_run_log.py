@@ -0,0 +1,135 @@
+"""Tests for the simulation run's detailed log capture."""
+
+import asyncio
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+
+from simulator.run_log import (
+    SimulationLog,
+    SimulationLogHandler,
+    attach_simulation_log,
+    detach_simulation_log,
+)
+
+
+def _record(
+    message: str, level: int = logging.INFO, *args: object
+) -> logging.LogRecord:
+    return logging.LogRecord("SimulatorLogic", level, __file__, 1, message, args, None)
+
+
+def _log_days(log: SimulationLog) -> None:
+    """Log a quiet day, a trade day and a day with a warning."""
+    log.add(_record("setup"))
+    for day, traded, level in (
+        (1, False, logging.INFO),
+        (2, True, logging.INFO),
+        (3, False, logging.WARNING),
+    ):
+        log.begin_day()
+        log.add(_record("Day %s", logging.INFO, day))
+        log.add(_record("Day %s detail", level, day))
+        log.end_day(traded=traded)
+    log.add(_record("summary"))
+
+
+@pytest.mark.parametrize(
+    ("verbosity", "expected"),
+    [
+        (
+            "trades",
+            ["setup", "Day 2", "Day 2 detail", "Day 3", "Day 3 detail", "summary"],
+        ),
+        ("errors", ["setup", "Day 3 detail", "summary"]),
+        (
+            "all",
+            [
+                "setup",
+                "Day 1",
+                "Day 1 detail",
+                "Day 2",
+                "Day 2 detail",
+                "Day 3",
+                "Day 3 detail",
+                "summary",
+            ],
+        ),
+    ],
+)
+def test_simulation_log_keeps_days_by_verbosity(verbosity, expected) -> None:
+    """Tests that each verbosity keeps the expected day records."""
+    log = SimulationLog(max_records=100, verbosity=verbosity)
+    _log_days(log)
+    assert log.format(logging.Formatter("%(message)s")).splitlines() == expected
+
+
+def test_simulation_log_is_bounded() -> None:
+    """Tests that only the newest records are kept, with a note of the rest."""
+    log = SimulationLog(max_records=3, verbosity="all")
+    for i in range(10):
+        log.add(_record("record %s", logging.INFO, i))
+
+    assert len(log) == 3
+    assert log.num_dropped == 7
+    assert log.format(logging.Formatter("%(message)s")).splitlines() == [
+        "... 7 earlier log records were dropped ...",
+        "record 7",
+        "record 8",
+        "record 9",
+    ]
+
+
+def test_simulation_log_formats_records_only_when_viewed() -> None:
+    """Tests that record arguments are not converted to text until formatting."""
+    argument = MagicMock()
+    argument.__str__.return_value = "formatted"
+    log = SimulationLog(max_records=10)
+    log.add(_record("value: %s", logging.INFO, argument))
+    argument.__str__.assert_not_called()
+
+    assert log.format() == "INFO:SimulatorLogic: value: formatted"
+
+
+def test_simulation_log_keeps_interrupted_day_with_error() -> None:
+    """Tests that a day cut short by an error is kept when the log is formatted."""
+    log = SimulationLog(max_records=10)
+    log.begin_day()
+    log.add(_record("Day 1"))
+    log.add(_record("Unexpected Simulation Error", logging.ERROR))
+
+    assert log.format(logging.Formatter("%(message)s")).splitlines() == [
+        "Day 1",
+        "Unexpected Simulation Error",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_simulation_log_handler_routes_records_per_run() -> None:
+    """Tests that concurrent runs each capture only their own records."""
+    logger = logging.getLogger("test_simulation_log_handler")
+    logger.addHandler(SimulationLogHandler())
+    logger.propagate = False
+
+    async def _run(name: str) -> SimulationLog:
+        log = SimulationLog(max_records=10)
+        token = attach_simulation_log(log)
+        try:
+            for step in range(3):
+                logger.warning("%s step %s", name, step)
+                await asyncio.sleep(0)
+        finally:
+            detach_simulation_log(token)
+        return log
+
+    first, second = await asyncio.gather(_run("first"), _run("second"))
+    logger.warning("outside any run")
+
+    assert first.format(logging.Formatter("%(message)s")).splitlines() == [
+        "first step 0",
+        "first step 1",
+        "first step 2",
+    ]
+    assert "first" not in second.format()
+    assert "outside" not in second.format()
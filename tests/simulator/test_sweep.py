@@ -0,0 +1,77 @@
+"""Tests for parameter sweeps."""
+
+import asyncio
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+
+from simulator.sweep import SweepRange, expand_sweep, run_parameter_sweep
+
+
+def test_sweep_range_values() -> None:
+    """Test that ranges include their stop and keep whole-number ranges as ints."""
+    assert SweepRange(start=5, stop=20, step=5).values() == [5, 10, 15, 20]
+    assert SweepRange(start=0.1, stop=0.3, step=0.1).values() == [0.1, 0.2, 0.3]
+    assert SweepRange(start=2, stop=2, step=1).values() == [2]
+    with pytest.raises(ValidationError):
+        SweepRange(start=10, stop=5, step=1)
+    with pytest.raises(ValidationError):
+        SweepRange(start=1, stop=5, step=0)
+
+
+def test_expand_sweep_row_major() -> None:
+    """Test that the last axis varies fastest."""
+    axes, combinations = expand_sweep(
+        {
+            "alphabot_short_sma": [3, 5],
+            "alphabot_long_sma": SweepRange(start=10, stop=30, step=10),
+        },
+    )
+
+    assert axes == {"alphabot_short_sma": [3, 5], "alphabot_long_sma": [10, 20, 30]}
+    assert combinations[:3] == [
+        {"alphabot_short_sma": 3, "alphabot_long_sma": 10},
+        {"alphabot_short_sma": 3, "alphabot_long_sma": 20},
+        {"alphabot_short_sma": 3, "alphabot_long_sma": 30},
+    ]
+    assert len(combinations) == 6
+
+
+@pytest.mark.asyncio
+async def test_run_parameter_sweep_matrix_and_concurrency() -> None:
+    """Test the metric matrix, failed cells and the concurrency limit."""
+    in_flight = 0
+    peak_in_flight = 0
+
+    async def fake_run(params: dict[str, Any]) -> dict[str, Any]:
+        nonlocal in_flight, peak_in_flight
+        in_flight += 1
+        peak_in_flight = max(peak_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if params["alphabot_short_sma"] == 4 and params["alphabot_long_sma"] == 20:
+            return {"success": False, "error": "boom"}
+        return {
+            "success": True,
+            "metrics": {
+                "final_value": params["alphabot_short_sma"] * 1000
+                + params["alphabot_long_sma"],
+            },
+        }
+
+    result = await run_parameter_sweep(
+        {"seed": 9, "alphabot_short_sma": 1},
+        {"alphabot_short_sma": [2, 4], "alphabot_long_sma": [10, 20, 30]},
+        fake_run,
+        max_concurrency=2,
+    )
+
+    assert peak_in_flight == 2
+    assert result.seed == 9
+    assert result.metrics["final_value"] == [
+        [2010, 2020, 2030],
+        [4010, None, 4030],
+    ]
+    assert [run.error for run in result.runs].count("boom") == 1
+    assert result.runs[4].params == {"alphabot_short_sma": 4, "alphabot_long_sma": 20}